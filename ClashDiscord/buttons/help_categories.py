@@ -28,7 +28,7 @@ class HelpSuperUserBtn(disnake.ui.Button):
         await inter.response.defer()
 
         field_dict_list = []
-        db_user = db_responder.read_user(inter.author.id)
+        db_user = await db_responder.read_user(inter.author.id)
 
         # user not claimed
         if db_user is None:
@@ -50,7 +50,7 @@ class HelpSuperUserBtn(disnake.ui.Button):
             for category in self.client_data.bot_categories:
                 # category name matches button label
                 if category.name == self.label:
-                    field_dict_list.extend(help_responder.help_super_user(
+                    field_dict_list.extend(await help_responder.help_super_user(
                         inter=inter, all_commands=self.bot.all_slash_commands,
                         bot_category=category))
 
@@ -94,8 +94,8 @@ class HelpAdminBtn(disnake.ui.Button):
         await inter.response.defer()
 
         field_dict_list = []
-        db_user = db_responder.read_user(inter.author.id)
-        db_guild = db_responder.read_guild(inter.guild.id)
+        db_user = await db_responder.read_user(inter.author.id)
+        db_guild = await db_responder.read_guild(inter.guild.id)
 
         # user not claimed
         if db_user is None:
@@ -124,7 +124,7 @@ class HelpAdminBtn(disnake.ui.Button):
             for category in self.client_data.bot_categories:
                 # category name matches button label
                 if category.name == self.label:
-                    field_dict_list.extend(help_responder.help_admin(
+                    field_dict_list.extend(await help_responder.help_admin(
                         inter=inter, all_commands=self.bot.all_slash_commands,
                         bot_category=category))
 
@@ -173,7 +173,7 @@ class HelpClientBtn(disnake.ui.Button):
         for category in self.client_data.bot_categories:
             # category name matches button label
             if category.name == self.label:
-                field_dict_list.extend(help_responder.help_client(
+                field_dict_list.extend(await help_responder.help_client(
                     inter=inter, all_commands=self.bot.all_slash_commands,
                     bot_category=category))
 
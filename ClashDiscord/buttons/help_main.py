@@ -24,7 +24,7 @@ class HelpMainBtn(disnake.ui.Button):
 
         await inter.response.defer()
 
-        help_dict = help_main_responder.help_main(
+        help_dict = await help_main_responder.help_main(
             bot=self.bot, inter=inter,
             client_data=self.client_data)
 
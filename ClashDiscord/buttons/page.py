@@ -0,0 +1,36 @@
+import disnake
+
+
+class PagePreviousBtn(disnake.ui.Button):
+    def __init__(self):
+        super().__init__(
+            label="Previous", style=disnake.ButtonStyle.primary)
+
+    async def callback(
+            self,
+            inter: disnake.MessageInteraction):
+
+        await inter.response.defer()
+
+        await self.view.show_page(inter, self.view.page_index - 1)
+
+
+class PageCountBtn(disnake.ui.Button):
+    def __init__(self):
+        # only shows the page number
+        super().__init__(
+            label="1/1", style=disnake.ButtonStyle.secondary, disabled=True)
+
+
+class PageNextBtn(disnake.ui.Button):
+    def __init__(self):
+        super().__init__(
+            label="Next", style=disnake.ButtonStyle.primary)
+
+    async def callback(
+            self,
+            inter: disnake.MessageInteraction):
+
+        await inter.response.defer()
+
+        await self.view.show_page(inter, self.view.page_index + 1)
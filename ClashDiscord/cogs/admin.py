@@ -12,12 +12,12 @@ from responders.ClientResponder import (
     client_user_profile
 )
 from utils import discord_utils
-from linkAPI.client import LinkApiClient
+from linkAPI.async_client import AsyncLinkApiClient
 from linkAPI.errors import *
 
 
 class Admin(commands.Cog):
-    def __init__(self, bot, coc_client, client_data, linkapi_client: LinkApiClient):
+    def __init__(self, bot, coc_client, client_data, linkapi_client: AsyncLinkApiClient):
         self.bot = bot
         self.coc_client = coc_client
         self.client_data = client_data
@@ -53,7 +53,7 @@ class Admin(commands.Cog):
 
         # authenticating admin authorization
         verification_payload = (
-            auth_responder.guild_admin_verification(inter))
+            await auth_responder.guild_admin_verification(inter))
 
         if not verification_payload['verified']:
 
@@ -71,10 +71,10 @@ class Admin(commands.Cog):
             return
 
         # confirm user has been claimed
-        db_user_obj = db_responder.read_user(user.id)
+        db_user_obj = await db_responder.read_user(user.id)
         if not db_user_obj:
             # user has not been claimed
-            db_user_obj = db_responder.claim_user(user.id)
+            db_user_obj = await db_responder.claim_user(user.id)
             if not db_user_obj:
                 # user could not be claimed
                 embed_description = f"{user.mention} user couldn't be claimed"
@@ -117,7 +117,7 @@ class Admin(commands.Cog):
         field_dict_list = []
 
         if option == "profile":
-            db_player_list = db_responder.read_player_list(user.id)
+            db_player_list = await db_responder.read_player_list(user.id)
 
             # user has no claimed players
             if len(db_player_list) == 0:
@@ -145,7 +145,7 @@ class Admin(commands.Cog):
                 coc_client=self.coc_client)
 
         elif option == "player list":
-            db_player_list = db_responder.read_player_list(user.id)
+            db_player_list = await db_responder.read_player_list(user.id)
 
             # user has no claimed players
             if len(db_player_list) == 0:
@@ -172,7 +172,7 @@ class Admin(commands.Cog):
 
         elif option == "sync":
             try:
-                link_responder.sync_link(
+                await link_responder.sync_link(
                     linkapi_client=self.linkapi_client,
                     discord_user_id=db_user_obj.discord_id
                 )
@@ -237,7 +237,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_player = db_responder.read_player(
+            db_player = await db_responder.read_player(
                 user.id, player.tag)
 
             # if requested player is not claimed
@@ -277,7 +277,7 @@ class Admin(commands.Cog):
                 return
 
             else:
-                db_player = db_responder.update_player_active(
+                db_player = await db_responder.update_player_active(
                     user.id, player.tag)
 
                 embed_description = (
@@ -332,7 +332,7 @@ class Admin(commands.Cog):
 
         # authenticating admin authorization
         verification_payload = (
-            auth_responder.guild_admin_verification(inter))
+            await auth_responder.guild_admin_verification(inter))
 
         if not verification_payload['verified']:
 
@@ -368,10 +368,10 @@ class Admin(commands.Cog):
         # confirm admin is not editing an admin
 
         # confirm user has been claimed
-        db_user = db_responder.read_user(user.id)
+        db_user = await db_responder.read_user(user.id)
         if not db_user:
             # user has not been claimed
-            db_user = db_responder.claim_user(user.id)
+            db_user = await db_responder.claim_user(user.id)
             if not db_user:
                 # user could not be claimed
                 embed_description = f"{user.mention} user couldn't be claimed"
@@ -433,7 +433,7 @@ class Admin(commands.Cog):
                 return
 
             # confirm player has not been claimed
-            db_player = db_responder.read_player_from_tag(player.tag)
+            db_player = await db_responder.read_player_from_tag(player.tag)
 
             # player has already been claimed
             if db_player:
@@ -452,7 +452,7 @@ class Admin(commands.Cog):
 
             # add player link to link API
             try:
-                link_responder.add_link(
+                await link_responder.add_link(
                     linkapi_client=self.linkapi_client,
                     player_tag=player.tag,
                     discord_user_id=db_user.discord_id
@@ -475,7 +475,7 @@ class Admin(commands.Cog):
             # user claimed
             # player is valid
             # player hasn't been claimed
-            db_player = db_responder.claim_player(
+            db_player = await db_responder.claim_player(
                 user.id, player.tag)
 
             # succesfully claimed
@@ -522,7 +522,7 @@ class Admin(commands.Cog):
                 player_tag = player.tag
                 player_title = f"{player.name} {player.tag}"
 
-            db_player = db_responder.read_player(user.id, player_tag)
+            db_player = await db_responder.read_player(user.id, player_tag)
 
             # db player not found
             if not db_player:
@@ -540,7 +540,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_del_player = db_responder.delete_player(
+            db_del_player = await db_responder.delete_player(
                 user.id, player_tag)
 
             # player was not deleted
@@ -563,7 +563,7 @@ class Admin(commands.Cog):
 
             # delete link api link
             try:
-                self.linkapi_client.delete_link(
+                await self.linkapi_client.delete_link(
                     player_tag=player_tag)
             except LoginError as arg:
                 print(arg)
@@ -572,7 +572,7 @@ class Admin(commands.Cog):
             except NotFoundError:
                 pass
 
-            db_active_player = db_responder.read_player_active(user.id)
+            db_active_player = await db_responder.read_player_active(user.id)
 
             # active player found
             # no need to change the active player
@@ -594,7 +594,7 @@ class Admin(commands.Cog):
 
             # no active player found
             # check if there are any other players
-            db_player_list = db_responder.read_player_list(
+            db_player_list = await db_responder.read_player_list(
                 user.id)
 
             # no additional players claimed
@@ -616,7 +616,7 @@ class Admin(commands.Cog):
 
             # additional players claimed by user
             # update the first as the new active
-            db_updated_player = db_responder.update_player_active(
+            db_updated_player = await db_responder.update_player_active(
                 user.id, db_player_list[0].player_tag)
 
             # update not successful
@@ -690,7 +690,7 @@ class Admin(commands.Cog):
         """
 
         verification_payload = (
-            auth_responder.guild_admin_verification(inter))
+            await auth_responder.guild_admin_verification(inter))
 
         if not verification_payload['verified']:
 
@@ -709,7 +709,7 @@ class Admin(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(
+            db_player_obj = await db_responder.read_player_active(
                 inter.author.id)
 
             verification_payload = (
@@ -739,12 +739,9 @@ class Admin(commands.Cog):
         field_dict_list = []
         embed_thumbnail = clan_obj.badge.small
 
-        member_dict_list = []
-
         # finding the user for each member in the clan
-        for member_obj in clan_obj.members:
-            member_dict_list.append(discord_responder.find_user_from_tag(
-                member_obj, inter.guild.members))
+        member_dict_list = await discord_responder.find_user_list_from_tag(
+            clan_obj.members, inter.guild.members)
 
         # selecting all those who aren't linked
         for member_dict in member_dict_list:
@@ -791,7 +788,7 @@ class Admin(commands.Cog):
         field_dict_list = []
 
         if option == "show":
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild not claimed
             if not db_guild_obj:
@@ -807,7 +804,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # user not claimed
             if not db_user_obj:
@@ -838,7 +835,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_obj_list = db_responder.read_clan_list_from_guild(
+            db_clan_obj_list = await db_responder.read_clan_list_from_guild(
                 inter.guild.id)
 
             # guild has no claimed clans
@@ -883,7 +880,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild not claimed
             if not db_guild_obj:
@@ -899,7 +896,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # user not claimed
             if not db_user_obj:
@@ -946,7 +943,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            claimed_clan_obj = db_responder.read_clan(
+            claimed_clan_obj = await db_responder.read_clan(
                 inter.guild.id, clan_obj.tag)
 
             # already claimed
@@ -966,7 +963,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_obj = db_responder.claim_clan(inter.guild.id, clan_obj.tag)
+            db_clan_obj = await db_responder.claim_clan(inter.guild.id, clan_obj.tag)
 
             # clan not claimed
             if not db_clan_obj:
@@ -1000,7 +997,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild not claimed
             if not db_guild_obj:
@@ -1016,7 +1013,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # user not claimed
             if not db_user_obj:
@@ -1063,7 +1060,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_obj = db_responder.read_clan(inter.guild.id, clan_obj.tag)
+            db_clan_obj = await db_responder.read_clan(inter.guild.id, clan_obj.tag)
             # clan not claimed by guild
             if not db_clan_obj:
                 embed_description = (f"{clan_obj.name} has not been claimed by "
@@ -1079,7 +1076,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_deletion = db_responder.delete_clan(
+            db_clan_deletion = await db_responder.delete_clan(
                 inter.guild.id, clan_obj.tag)
             # clan was found after deletion
             if db_clan_deletion:
@@ -1138,9 +1135,9 @@ class Admin(commands.Cog):
         field_dict_list = []
 
         if option == "show":
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
             # guild not claimed
             if not db_guild_obj:
                 embed_description = f"{inter.guild.name} has not been claimed"
@@ -1187,10 +1184,10 @@ class Admin(commands.Cog):
             embed_title = f"{inter.guild.name} claimed roles"
             field_dict_list = []
 
-            db_clan_role_list = db_responder.read_guild_clan_role(
+            db_clan_role_list = await db_responder.read_guild_clan_role(
                 inter.guild.id)
 
-            db_rank_role_list = db_responder.read_guild_rank_role(
+            db_rank_role_list = await db_responder.read_guild_rank_role(
                 inter.guild.id)
 
             if len(db_clan_role_list) != 0:
@@ -1200,7 +1197,7 @@ class Admin(commands.Cog):
 
                     # discord role is claimed, but not found in server
                     if not discord_role:
-                        deleted_db_role = db_responder.delete_clan_role(
+                        deleted_db_role = await db_responder.delete_clan_role(
                             db_role.discord_role_id)
 
                         field_dict_list.append({
@@ -1231,7 +1228,7 @@ class Admin(commands.Cog):
 
                     # discord role is claimed, but not found in server
                     if not discord_role:
-                        deleted_db_role = db_responder.delete_rank_role(
+                        deleted_db_role = await db_responder.delete_rank_role(
                             db_role.discord_role_id)
 
                         field_dict_list.append({
@@ -1269,8 +1266,8 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild not claimed
             if not db_guild_obj:
@@ -1315,12 +1312,12 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_role_obj = db_responder.read_clan_role(role.id)
+            db_clan_role_obj = await db_responder.read_clan_role(role.id)
 
             # claimed role is clan role
             if db_clan_role_obj:
                 # delete clan role
-                db_clan_role_deletion = db_responder.delete_clan_role(role.id)
+                db_clan_role_deletion = await db_responder.delete_clan_role(role.id)
                 # clan role found after deletion
                 if db_clan_role_deletion:
                     embed_description = f"{role.mention} claim could not be removed"
@@ -1348,12 +1345,12 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_rank_role_obj = db_responder.read_rank_role(role.id)
+            db_rank_role_obj = await db_responder.read_rank_role(role.id)
 
             # claimed role is rank role
             if db_rank_role_obj:
                 # delete rank role
-                db_rank_role_deletion = db_responder.delete_rank_role(role.id)
+                db_rank_role_deletion = await db_responder.delete_rank_role(role.id)
                 # rank role found after deletion
                 if db_rank_role_deletion:
                     embed_description = f"{role.mention} claim could not be removed"
@@ -1456,7 +1453,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild not claimed
             if not db_guild_obj:
@@ -1472,7 +1469,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # user not claimed
             if not db_user_obj:
@@ -1503,7 +1500,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_obj = db_responder.read_clan(inter.guild.id, clan_obj.tag)
+            db_clan_obj = await db_responder.read_clan(inter.guild.id, clan_obj.tag)
 
             # clan not claimed by guild
             if not db_clan_obj:
@@ -1521,7 +1518,7 @@ class Admin(commands.Cog):
                 return
 
             # confirm clan role has not been claimed
-            db_clan_role_obj = db_responder.read_clan_role(role.id)
+            db_clan_role_obj = await db_responder.read_clan_role(role.id)
 
             # clan role has been claimed
             if db_clan_role_obj:
@@ -1539,7 +1536,7 @@ class Admin(commands.Cog):
                 return
 
             # confirm rank role has not been claimed
-            db_rank_role_obj = db_responder.read_rank_role(role.id)
+            db_rank_role_obj = await db_responder.read_rank_role(role.id)
 
             # rank role has been claimed
             if db_rank_role_obj:
@@ -1557,7 +1554,7 @@ class Admin(commands.Cog):
                 return
 
             # claim clan role
-            claimed_clan_role_obj = db_responder.claim_clan_role(
+            claimed_clan_role_obj = await db_responder.claim_clan_role(
                 role.id, inter.guild.id, clan_obj.tag)
 
             # clan role could not be claimed
@@ -1634,7 +1631,7 @@ class Admin(commands.Cog):
                 return
 
             # validate given role name with model
-            rank_role_model_obj = db_responder.read_rank_role_model(rank_name)
+            rank_role_model_obj = await db_responder.read_rank_role_model(rank_name)
 
             # rank role name invalid
             if not rank_role_model_obj:
@@ -1650,7 +1647,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
             # guild not claimed
             if not db_guild_obj:
                 embed_description = f"{inter.guild.name} has not been claimed"
@@ -1665,7 +1662,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
             # user not claimed
             if not db_user_obj:
                 embed_description = f"{inter.author.mention} has not been claimed"
@@ -1696,7 +1693,7 @@ class Admin(commands.Cog):
                 return
 
             # confirm clan role has not been claimed
-            db_clan_role_obj = db_responder.read_clan_role(role.id)
+            db_clan_role_obj = await db_responder.read_clan_role(role.id)
             # clan role has been claimed
             if db_clan_role_obj:
                 embed_description = (f"{role.mention} has already been claimed for clan "
@@ -1713,7 +1710,7 @@ class Admin(commands.Cog):
                 return
 
             # confirm rank role has not been claimed
-            db_rank_role_obj = db_responder.read_rank_role(role.id)
+            db_rank_role_obj = await db_responder.read_rank_role(role.id)
             # rank role has been claimed
             if db_rank_role_obj:
                 embed_description = (f"{role.mention} has already been claimed for rank "
@@ -1730,7 +1727,7 @@ class Admin(commands.Cog):
                 return
 
             # claim rank role
-            claimed_rank_role_obj = db_responder.claim_rank_role(
+            claimed_rank_role_obj = await db_responder.claim_rank_role(
                 role.id, inter.guild.id, rank_name)
             # rank role could not be claimed
             if claimed_rank_role_obj is None:
@@ -1781,7 +1778,7 @@ class Admin(commands.Cog):
 
         if option == "claim":
             # getting db user object
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # user not found
             if not db_user_obj:
@@ -1797,7 +1794,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild already claimed
             if db_guild_obj:
@@ -1813,7 +1810,7 @@ class Admin(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_claimed_guild = db_responder.claim_guild(
+            db_claimed_guild = await db_responder.claim_guild(
                 inter.author.id, inter.guild.id)
 
             # guild already claimed or could not be claimed
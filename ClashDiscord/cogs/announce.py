@@ -43,7 +43,7 @@ class Announce(commands.Cog):
             message: message to send the specified channel
         """
 
-        db_player_obj = db_responder.read_player_active(inter.author.id)
+        db_player_obj = await db_responder.read_player_active(inter.author.id)
 
         verification_payload = (
             await auth_responder.player_leadership_verification(
@@ -93,7 +93,7 @@ class Announce(commands.Cog):
             tag: player tag to find and ping user
         """
 
-        db_player_obj = db_responder.read_player_active(inter.author.id)
+        db_player_obj = await db_responder.read_player_active(inter.author.id)
 
         verification_payload = (
             await auth_responder.player_verification(
@@ -137,7 +137,7 @@ class Announce(commands.Cog):
             thumbnail=embed_thumbnail,
             author=inter.author)
 
-        content = discord_responder.user_player_ping(
+        content = await discord_responder.user_player_ping(
             player, inter.guild.members)
 
         if channel is None:
@@ -173,7 +173,7 @@ class Announce(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.clan_verification(
@@ -221,9 +221,10 @@ class Announce(commands.Cog):
 
         else:
             content = ""
-            for donor in donator_list:
-                member_message = discord_responder.user_player_ping(
-                    donor.player_obj, inter.guild.members)
+            member_message_list = await discord_responder.user_player_ping_list(
+                [donor.player_obj for donor in donator_list],
+                inter.guild.members)
+            for member_message in member_message_list:
                 member_message += ", "
                 # making sure the proposed content will not exceed the 2K limit
                 if len(content+member_message) >= 2000:
@@ -292,7 +293,7 @@ class Announce(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.clan_verification(
@@ -343,9 +344,9 @@ class Announce(commands.Cog):
 
         else:
             content = ""
-            for donor in donator_list:
-                member_message = discord_responder.user_player_ping(
-                    donor, inter.guild.members)
+            member_message_list = await discord_responder.user_player_ping_list(
+                donator_list, inter.guild.members)
+            for member_message in member_message_list:
                 member_message += ", "
                 # making sure the proposed content will not exceed the 2K limit
                 if len(content+member_message) >= 2000:
@@ -412,7 +413,7 @@ class Announce(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.war_leadership_verification(
@@ -440,9 +441,9 @@ class Announce(commands.Cog):
 
         content_list = []
         content = ""
-        for war_member in war.clan.members:
-            member_message = discord_responder.user_player_ping(
-                war_member, inter.guild.members)
+        member_message_list = await discord_responder.user_player_ping_list(
+            war.clan.members, inter.guild.members)
+        for member_message in member_message_list:
             member_message += ", "
             # making sure the proposed content will not exceed the 2K limit
             if len(content+member_message) >= 2000:
@@ -511,7 +512,7 @@ class Announce(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.war_leadership_verification(
@@ -550,9 +551,9 @@ class Announce(commands.Cog):
 
         content_list = []
         content = ""
-        for war_member in war_member_no_attack_list:
-            member_message = discord_responder.user_player_ping(
-                war_member, inter.guild.members)
+        member_message_list = await discord_responder.user_player_ping_list(
+            war_member_no_attack_list, inter.guild.members)
+        for member_message in member_message_list:
             member_message += ", "
             # making sure the proposed content will not exceed the 2K limit
             if len(content+member_message) >= 2000:
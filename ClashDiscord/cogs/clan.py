@@ -43,7 +43,7 @@ class Clan(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.clan_verification(
                 db_player_obj, inter.author, self.coc_client)
@@ -118,7 +118,7 @@ class Clan(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.clan_verification(
@@ -219,7 +219,7 @@ class Clan(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.clan_verification(
@@ -317,7 +317,7 @@ class Clan(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.clan_verification(
                 db_player_obj, inter.author, self.coc_client)
@@ -400,7 +400,7 @@ class Clan(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.clan_verification(
                 db_player_obj, inter.author, self.coc_client)
@@ -9,12 +9,12 @@ from responders import (
     ClientResponder as client_responder
 )
 from utils import discord_utils
-from linkAPI.client import LinkApiClient
+from linkAPI.async_client import AsyncLinkApiClient
 from linkAPI.errors import *
 
 
 class Client(commands.Cog):
-    def __init__(self, bot, coc_client, client_data, linkapi_client: LinkApiClient):
+    def __init__(self, bot, coc_client, client_data, linkapi_client: AsyncLinkApiClient):
         self.bot = bot
         self.coc_client = coc_client
         self.client_data = client_data
@@ -40,12 +40,12 @@ class Client(commands.Cog):
         field_dict_list.extend(client_responder.client_info(
             inter.client, self.client_data))
 
-        db_guild = db_responder.read_guild(inter.guild.id)
+        db_guild = await db_responder.read_guild(inter.guild.id)
 
         field_dict_list.extend(client_responder.client_guild_info(
             inter.guild, db_guild))
 
-        db_players = db_responder.read_player_list(inter.author.id)
+        db_players = await db_responder.read_player_list(inter.author.id)
 
         field_dict_list.extend(await client_responder.client_player_info(
             inter.author, db_players, self.coc_client))
@@ -81,7 +81,7 @@ class Client(commands.Cog):
         field_dict_list = []
 
         if option == "profile":
-            db_player_list = db_responder.read_player_list(inter.author.id)
+            db_player_list = await db_responder.read_player_list(inter.author.id)
 
             # user has no claimed players
             if len(db_player_list) == 0:
@@ -109,7 +109,7 @@ class Client(commands.Cog):
                 coc_client=self.coc_client)
 
         elif option == "player list":
-            db_player_list = db_responder.read_player_list(inter.author.id)
+            db_player_list = await db_responder.read_player_list(inter.author.id)
 
             # user has no claimed players
             if len(db_player_list) == 0:
@@ -167,7 +167,7 @@ class Client(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_player = db_responder.read_player(
+            db_player = await db_responder.read_player(
                 inter.author.id, player.tag)
 
             # if requested player is not claimed
@@ -207,7 +207,7 @@ class Client(commands.Cog):
                 return
 
             else:
-                db_player = db_responder.update_player_active(
+                db_player = await db_responder.update_player_active(
                     inter.author.id, player.tag)
 
                 embed_description = (
@@ -227,10 +227,10 @@ class Client(commands.Cog):
 
         elif option == "sync":
             # confirm user has been claimed
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             if not db_user_obj:
-                db_user_obj = db_responder.claim_user(inter.author.id)
+                db_user_obj = await db_responder.claim_user(inter.author.id)
 
                 # user could not be claimed
                 if not db_user_obj:
@@ -247,7 +247,7 @@ class Client(commands.Cog):
                     return
 
             try:
-                link_responder.sync_link(
+                await link_responder.sync_link(
                     linkapi_client=self.linkapi_client,
                     discord_user_id=db_user_obj.discord_id
                 )
@@ -270,7 +270,7 @@ class Client(commands.Cog):
                 f"data for {inter.author.mention} has been properly synced")
 
         elif option == "claim":
-            user = db_responder.claim_user(inter.author.id)
+            user = await db_responder.claim_user(inter.author.id)
 
             # user wasn't claimed and now is
             if user:
@@ -282,7 +282,7 @@ class Client(commands.Cog):
                                      f"has already been claimed")
 
         elif option == "remove":
-            db_user = db_responder.read_user(inter.author.id)
+            db_user = await db_responder.read_user(inter.author.id)
 
             # user not found
             if not db_user:
@@ -304,7 +304,7 @@ class Client(commands.Cog):
             # user found
 
             # delete user claim
-            removed_user = db_responder.delete_user(inter.author.id)
+            removed_user = await db_responder.delete_user(inter.author.id)
 
             # user could not be deleted
             if removed_user:
@@ -329,7 +329,7 @@ class Client(commands.Cog):
 
             # get all player links for this user
             try:
-                player_links = self.linkapi_client.get_discord_user_link(
+                player_links = await self.linkapi_client.get_discord_user_link(
                     inter.author.id)
             except LoginError as arg:
                 print(arg)
@@ -340,7 +340,7 @@ class Client(commands.Cog):
             # delete each link for the user
             for link in player_links:
                 try:
-                    self.linkapi_client.delete_link(player_tag=link.player_tag)
+                    await self.linkapi_client.delete_link(player_tag=link.player_tag)
                 except LoginError as arg:
                     print(arg)
                 # pass this error as nothing needs to be deleted
@@ -428,9 +428,9 @@ class Client(commands.Cog):
                 return
 
             # confirm user has been claimed
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
             if not db_user_obj:
-                db_user_obj = db_responder.claim_user(inter.author.id)
+                db_user_obj = await db_responder.claim_user(inter.author.id)
 
                 # user could not be claimed
                 if not db_user_obj:
@@ -447,7 +447,7 @@ class Client(commands.Cog):
                     return
 
             # confirm player has not been claimed
-            db_player_obj = db_responder.read_player_from_tag(player_obj.tag)
+            db_player_obj = await db_responder.read_player_from_tag(player_obj.tag)
             # player has already been claimed
             if db_player_obj:
                 embed_description = (f"{player_obj.name} {player_obj.tag} "
@@ -483,7 +483,7 @@ class Client(commands.Cog):
 
             # add player link to link API
             try:
-                link_responder.add_secure_link(
+                await link_responder.add_secure_link(
                     linkapi_client=self.linkapi_client,
                     player_tag=player_obj.tag,
                     discord_user_id=db_user_obj.discord_id
@@ -509,7 +509,7 @@ class Client(commands.Cog):
             # player is authenticated
 
             # claim player in db
-            db_player_obj = db_responder.claim_player(
+            db_player_obj = await db_responder.claim_player(
                 inter.author.id, player_obj.tag)
 
             # succesfully claimed
@@ -556,7 +556,7 @@ class Client(commands.Cog):
                 player_tag = player.tag
                 player_title = f"{player.name} {player.tag}"
 
-            db_player = db_responder.read_player(
+            db_player = await db_responder.read_player(
                 inter.author.id, player_tag)
 
             # db player not found
@@ -574,7 +574,7 @@ class Client(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_del_player = db_responder.delete_player(
+            db_del_player = await db_responder.delete_player(
                 inter.author.id, player_tag)
 
             # player was not deleted
@@ -595,10 +595,10 @@ class Client(commands.Cog):
                 return
 
             # delete link api link
-            self.linkapi_client.delete_link(
+            await self.linkapi_client.delete_link(
                 player_tag=player_tag)
 
-            db_active_player = db_responder.read_player_active(
+            db_active_player = await db_responder.read_player_active(
                 inter.author.id)
 
             # active player found
@@ -621,7 +621,7 @@ class Client(commands.Cog):
 
             # no active player found
             # check if there are any other players
-            db_player_list = db_responder.read_player_list(
+            db_player_list = await db_responder.read_player_list(
                 inter.author.id)
 
             # no additional players claimed
@@ -642,7 +642,7 @@ class Client(commands.Cog):
 
             # additional players claimed by user
             # update the first as the new active
-            db_updated_player = db_responder.update_player_active(
+            db_updated_player = await db_responder.update_player_active(
                 inter.author.id, db_player_list[0].player_tag)
 
             # update not successful
@@ -745,7 +745,7 @@ class Client(commands.Cog):
         field_dict_list = []
 
         if option == "show":
-            db_guild_obj = db_responder.read_guild(inter.guild.id)
+            db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
             # guild not claimed
             if not db_guild_obj:
@@ -762,7 +762,7 @@ class Client(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # user not claimed
             if not db_user_obj:
@@ -795,7 +795,7 @@ class Client(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_clan_obj_list = db_responder.read_clan_list_from_guild(
+            db_clan_obj_list = await db_responder.read_clan_list_from_guild(
                 inter.guild.id)
 
             # guild has no claimed clans
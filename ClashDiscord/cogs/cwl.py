@@ -6,7 +6,8 @@ from responders import (
     ClashResponder as clash_responder,
     RazBotDB_Responder as db_responder,
     AuthResponder as auth_responder,
-    CWLResponder as cwl_responder
+    CWLResponder as cwl_responder,
+    WarResponder as war_responder
 )
 from utils import discord_utils
 
@@ -44,7 +45,7 @@ class CWL(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.cwl_group_verification(
                 db_player_obj, inter.author, self.coc_client)
@@ -78,7 +79,7 @@ class CWL(commands.Cog):
         war_selection = None
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.war_verification(
                 db_player_obj, war_selection, inter.author, self.coc_client)
@@ -145,7 +146,7 @@ class CWL(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.cwl_group_verification(
                 db_player_obj, inter.author, self.coc_client)
@@ -242,7 +243,7 @@ class CWL(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.cwl_group_verification(
                 db_player_obj, inter.author, self.coc_client)
@@ -309,7 +310,8 @@ class CWL(commands.Cog):
             for cwl_round in cwl_group.rounds:
 
                 # checking if war has ended
-                war = await self.coc_client.get_league_war(cwl_round[0])
+                war = await clash_responder.fetch_league_war(
+                    cwl_round[0], self.coc_client)
                 if war.state != "warEnded":
                     break
 
@@ -365,7 +367,8 @@ class CWL(commands.Cog):
             for cwl_round in cwl_group.rounds:
 
                 # checking if war has ended
-                war = await self.coc_client.get_league_war(cwl_round[0])
+                war = await clash_responder.fetch_league_war(
+                    cwl_round[0], self.coc_client)
                 if war.state != "warEnded":
                     break
 
@@ -419,7 +422,7 @@ class CWL(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.cwl_group_leadership_verification(
@@ -488,7 +491,7 @@ class CWL(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.cwl_group_verification(
             db_player_obj, user, self.coc_client)
@@ -525,7 +528,7 @@ class CWL(commands.Cog):
 
         embed_thumbnail = discord_responder.get_town_hall_url(player_obj)
         field_dict_list = await cwl_responder.cwl_member_score(
-            player_obj, cwl_group_obj, player_obj.clan.tag)
+            player_obj, cwl_group_obj, player_obj.clan.tag, self.coc_client)
         embed_list = discord_responder.embed_message(
             icon_url=inter.bot.user.avatar.url,
             title=f"{player_obj.name} CWL score",
@@ -554,7 +557,7 @@ class CWL(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.cwl_group_leadership_verification(
@@ -582,7 +585,7 @@ class CWL(commands.Cog):
         cwl_group_obj = verification_payload['cwl_group_obj']
 
         field_dict_list = await cwl_responder.cwl_clan_score(
-            clan_obj, cwl_group_obj)
+            clan_obj, cwl_group_obj, self.coc_client)
         embed_list = discord_responder.embed_message(
             icon_url=inter.bot.user.avatar.url,
             title=f"{clan_obj.name} CWL scores",
@@ -593,3 +596,43 @@ class CWL(commands.Cog):
         )
 
         await discord_responder.send_embed_list(inter, embed_list)
+
+    @cwl.sub_command()
+    async def leaderboard(
+        self,
+        inter,
+        season: str = discord_utils.command_param_dict['season']
+    ):
+        """
+            ranks the server's clan members by cwl score for a season
+
+            Parameters
+            ----------
+            season (optional): season as YYYY-MM, defaults to this season
+        """
+
+        if season is None:
+            season = db_responder.current_war_season()
+
+        db_clan_obj_list = await db_responder.read_clan_list_from_guild(
+            inter.guild.id)
+
+        # ranked from the season totals kept as wars end
+        war_season_member_list = (
+            await db_responder.read_war_season_leaderboard(
+                season, "cwl",
+                [db_clan_obj.clan_tag for db_clan_obj in db_clan_obj_list]))
+
+        field_dict_list = war_responder.war_season_leaderboard(
+            war_season_member_list, season,
+            inter.client.emojis, self.client_data.emojis)
+
+        embed_list = discord_responder.embed_message(
+            icon_url=inter.bot.user.avatar.url,
+            title=f"{inter.guild.name} CWL leaderboard {season}",
+            bot_user_name=inter.me.display_name,
+            field_list=field_dict_list,
+            author=inter.author
+        )
+
+        await discord_responder.send_embed_list(inter, embed_list)
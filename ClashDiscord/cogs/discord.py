@@ -46,7 +46,7 @@ class Discord(commands.Cog):
 
         await inter.response.defer()
 
-        db_guild_obj = db_responder.read_guild(inter.guild.id)
+        db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
         # if guild is not claimed
         if not db_guild_obj:
@@ -102,7 +102,7 @@ class Discord(commands.Cog):
                 return
 
             # getting author's db player obj for leadership verification
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.player_leadership_verification(
                 db_player_obj, inter.author, inter.guild.id, self.coc_client)
@@ -136,7 +136,7 @@ class Discord(commands.Cog):
             return
 
         elif option == "all":
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # if user is not claimed
             if not db_user_obj:
@@ -152,45 +152,30 @@ class Discord(commands.Cog):
                     content=f"{inter.author.mention} is not server's admin")
                 return
 
-            # telling the user that the bot is updating roles
-            embed_list = discord_responder.embed_message(
-                icon_url=inter.bot.user.avatar.url,
-                description="updating roles",
-                bot_user_name=inter.me.display_name,
-                author=inter.author
-            )
+            member_list = [
+                member for member in inter.guild.members if not member.bot]
 
-            await discord_responder.send_embed_list(inter, embed_list)
+            # one progress message edited with running counts
+            progress_report = discord_responder.ProgressReport(
+                inter, "updating roles", len(member_list))
 
-            for user in inter.guild.members:
-                if user.bot:
-                    continue
+            await progress_report.edit(force=True)
 
-                embed_dict_list = await discord_responder.update_roles(
-                    user, inter.guild, self.coc_client)
+            async def role_progress(member_embed_dict_list):
+                changed_field_dict_list, failed_field_dict_list = (
+                    discord_responder.role_summary_field_list(
+                        member_embed_dict_list))
 
-                for embed_dict in embed_dict_list:
+                await progress_report.add(
+                    changed_field_dict_list, failed_field_dict_list)
 
-                    embed_list = discord_responder.embed_message(
-                        icon_url=inter.bot.user.avatar.url,
-                        title=embed_dict["title"],
-                        bot_user_name=inter.me.display_name,
-                        thumbnail=embed_dict["thumbnail"],
-                        field_list=embed_dict["field_dict_list"],
-                        author=inter.author
-                    )
-
-                    await discord_responder.send_embed_list(inter, embed_list)
-
-            # telling the user that the bot is done updating roles
-            embed_list = discord_responder.embed_message(
-                icon_url=inter.bot.user.avatar.url,
-                description="update complete",
-                bot_user_name=inter.me.display_name,
-                author=inter.author
+            await discord_responder.update_roles_guild(
+                member_list, inter.guild, self.coc_client,
+                progress_callback=role_progress
             )
 
-            await discord_responder.send_embed_list(inter, embed_list)
+            # one summary of changes and failures
+            await progress_report.finish("role update summary")
             return
 
         else:
@@ -247,7 +232,7 @@ class Discord(commands.Cog):
             await discord_responder.send_embed_list(inter, embed_list)
             return
 
-        db_guild_obj = db_responder.read_guild(inter.guild.id)
+        db_guild_obj = await db_responder.read_guild(inter.guild.id)
 
         # if guild is not claimed
         if not db_guild_obj:
@@ -290,7 +275,7 @@ class Discord(commands.Cog):
                 return
 
             # getting author's db player obj for leadership verification
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.player_leadership_verification(
                 db_player_obj, inter.author, inter.guild.id, self.coc_client)
@@ -312,7 +297,7 @@ class Discord(commands.Cog):
                 user, self.coc_client)
 
         elif option == "all":
-            db_user_obj = db_responder.read_user(inter.author.id)
+            db_user_obj = await db_responder.read_user(inter.author.id)
 
             # if user is not claimed
             if not db_user_obj:
@@ -328,13 +313,31 @@ class Discord(commands.Cog):
                     content=f"{inter.author.mention} is not server's admin")
                 return
 
-            field_dict_list = []
-            for user in inter.guild.members:
-                if user.bot:
-                    continue
+            member_list = [
+                member for member in inter.guild.members if not member.bot]
+
+            # one progress message edited with running counts
+            progress_report = discord_responder.ProgressReport(
+                inter, "updating nicknames", len(member_list))
+
+            await progress_report.edit(force=True)
 
-                field_dict_list.extend(await discord_responder.update_user_nickname(
-                    user, self.coc_client))
+            async def nickname_progress(member_field_dict_list):
+                changed_field_dict_list, failed_field_dict_list = (
+                    discord_responder.nickname_summary_field_list(
+                        member_field_dict_list))
+
+                await progress_report.add(
+                    changed_field_dict_list, failed_field_dict_list)
+
+            await discord_responder.update_nickname_guild(
+                member_list, self.coc_client,
+                progress_callback=nickname_progress
+            )
+
+            # one summary of changes and failures
+            await progress_report.finish("nickname update summary")
+            return
 
         else:
             embed_title = None
@@ -441,13 +444,13 @@ class Discord(commands.Cog):
             embed_thumbnail = player_obj.league.icon.small
 
             field_dict_list.append(
-                discord_responder.find_user_from_tag(
+                await discord_responder.find_user_from_tag(
                     player_obj, inter.guild.members))
 
         elif option == "clan":
             # role not mentioned
             if clan_role is None:
-                db_player_obj = db_responder.read_player_active(
+                db_player_obj = await db_responder.read_player_active(
                     inter.author.id)
 
                 verification_payload = (
@@ -478,9 +481,9 @@ class Discord(commands.Cog):
             embed_thumbnail = clan_obj.badge.small
 
             # finding the user for each member in the clan
-            for member_obj in clan_obj.members:
-                field_dict_list.append(discord_responder.find_user_from_tag(
-                    member_obj, inter.guild.members))
+            field_dict_list.extend(
+                await discord_responder.find_user_list_from_tag(
+                    clan_obj.members, inter.guild.members))
 
         else:
             embed_title = None
@@ -1,6 +1,7 @@
 import disnake
-from disnake.ext import commands
-from linkAPI.client import LinkApiClient
+import coc
+from disnake.ext import commands, tasks
+from linkAPI.async_client import AsyncLinkApiClient
 from linkAPI.errors import ConflictError
 from responders import (
     DiscordResponder as discord_responder,
@@ -14,22 +15,162 @@ from utils import discord_utils
 
 
 class Events(commands.Cog):
-    def __init__(self, bot, coc_client, client_data, linkapi_client: LinkApiClient):
+    def __init__(self, bot, coc_client, client_data, linkapi_client: AsyncLinkApiClient):
         self.bot = bot
         self.coc_client = coc_client
         self.client_data = client_data
         self.linkapi_client = linkapi_client
 
+        # clan tags watched for clan events
+        self.clan_event_tag_set = set()
+
+        # clan member events update the roles of the affected user
+        self.coc_client.add_events(
+            self.on_clan_member_join,
+            self.on_clan_member_leave,
+            self.on_clan_member_role_change
+        )
+
+    def cog_unload(self):
+        self.war_poll.cancel()
+        self.clan_event_sync.cancel()
+        self.role_reconcile.cancel()
+
+        self.coc_client.remove_events(
+            self.on_clan_member_join,
+            self.on_clan_member_leave,
+            self.on_clan_member_role_change
+        )
+        self.coc_client.remove_clan_updates(*self.clan_event_tag_set)
+
     # client events
     @commands.Cog.listener()
     async def on_ready(self):
         print(f"RazBot is ready")
 
+        # on_ready fires again after reconnects
+        if not self.war_poll.is_running():
+            self.war_poll.start()
+
+        if not self.clan_event_sync.is_running():
+            self.clan_event_sync.start()
+
+        if not self.role_reconcile.is_running():
+            self.role_reconcile.start()
+
+    # background tasks
+    @tasks.loop(seconds=clash_responder.war_poll_interval)
+    async def war_poll(self):
+        """
+            keeps war snapshots of every claimed clan current
+            so war commands are served without fetching the war,
+            and stores wars as they end
+        """
+
+        try:
+            clan_tag_list = await db_responder.read_clan_tag_list()
+
+            ended_war_list = await clash_responder.poll_war_list(
+                clan_tag_list, self.coc_client)
+
+            # keep ended wars for war history
+            for war_obj in ended_war_list:
+                try:
+                    await db_responder.claim_war(war_obj)
+
+                # the war is returned again on its next poll
+                except Exception as arg:
+                    print(f"war history store failed: {arg}")
+                    continue
+
+                # only stored wars are skipped by later polls
+                clash_responder.mark_ended_war(war_obj)
+
+        # keep the poller running through unexpected errors
+        except Exception as arg:
+            print(f"war poll failed: {arg}")
+
+    @tasks.loop(seconds=clash_responder.clan_event_sync_interval)
+    async def clan_event_sync(self):
+        """
+            keeps the clans watched for clan events
+            matching the clans claimed in any guild
+        """
+
+        try:
+            # a clan claimed by several guilds is watched once
+            clan_tag_set = set(await db_responder.read_clan_tag_list())
+
+            self.coc_client.remove_clan_updates(
+                *(self.clan_event_tag_set - clan_tag_set))
+            self.coc_client.add_clan_updates(
+                *(clan_tag_set - self.clan_event_tag_set))
+
+            self.clan_event_tag_set = clan_tag_set
+
+        # keep the sync running through unexpected errors
+        except Exception as arg:
+            print(f"clan event sync failed: {arg}")
+
+    @tasks.loop(seconds=discord_responder.role_reconcile_interval)
+    async def role_reconcile(self):
+        """
+            updates roles in every claimed guild,
+            skipping members whose clash data has not changed
+            since the last guild sync
+        """
+
+        for guild in self.bot.guilds:
+            try:
+                # guild is not claimed
+                db_guild = await db_responder.read_guild(guild.id)
+                if not db_guild:
+                    continue
+
+                await discord_responder.update_roles_guild(
+                    guild.members, guild, self.coc_client,
+                    skip_unchanged=True)
+
+            # keep reconciling the other guilds
+            except Exception as arg:
+                print(f"role reconcile failed for {guild.name}: {arg}")
+
+    # clash events
+    @coc.ClanEvents.member_join()
+    async def on_clan_member_join(self, member, clan):
+        try:
+            await discord_responder.update_roles_clan_event(
+                member.tag, clan.tag, self.bot, self.coc_client,
+                clan_member=member)
+
+        except Exception as arg:
+            print(f"clan member join role update failed: {arg}")
+
+    @coc.ClanEvents.member_leave()
+    async def on_clan_member_leave(self, member, clan):
+        try:
+            await discord_responder.update_roles_clan_event(
+                member.tag, clan.tag, self.bot, self.coc_client)
+
+        except Exception as arg:
+            print(f"clan member leave role update failed: {arg}")
+
+    @coc.ClanEvents.member_role()
+    async def on_clan_member_role_change(self, old_member, member):
+        try:
+            await discord_responder.update_roles_clan_event(
+                member.tag, member.clan.tag, self.bot, self.coc_client,
+                clan_member=member)
+
+        except Exception as arg:
+            print(f"clan member role update failed: {arg}")
+
+    # discord events
     @commands.Cog.listener()
     async def on_member_join(self, member):
         # updating roles for possible uninitiated role
         # get uninitiated role from db
-        db_role_obj = db_responder.read_rank_role_from_guild_and_clash(
+        db_role_obj = await db_responder.read_rank_role_from_guild_and_clash(
             member.guild.id, 'uninitiated')
         if db_role_obj:
             discord_role_obj = disnake.utils.get(
@@ -40,10 +181,10 @@ class Events(commands.Cog):
         # sync player data
 
         # confirm user has been claimed
-        db_user_obj = db_responder.read_user(member.id)
+        db_user_obj = await db_responder.read_user(member.id)
 
         if not db_user_obj:
-            db_user_obj = db_responder.claim_user(member.id)
+            db_user_obj = await db_responder.claim_user(member.id)
 
             # user could not be claimed
             if not db_user_obj:
@@ -52,7 +193,7 @@ class Events(commands.Cog):
                 print(print_info)
 
         try:
-            link_responder.sync_link(
+            await link_responder.sync_link(
                 linkapi_client=self.linkapi_client,
                 discord_user_id=db_user_obj.discord_id
             )
@@ -65,30 +206,37 @@ class Events(commands.Cog):
 
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role):
+        # claimed roles are cached with the guild config
+        db_responder.invalidate_guild_config(role.guild.id)
+
         # check if deleted role is a claimed role
 
         # clan role
-        clan_role = db_responder.read_clan_role(role.id)
+        clan_role = await db_responder.read_clan_role(role.id)
         # clan role found
         if clan_role:
-            deleted_role = db_responder.delete_clan_role(role.id)
+            deleted_role = await db_responder.delete_clan_role(role.id)
             return
 
         # rank role
-        rank_role = db_responder.read_rank_role(role.id)
+        rank_role = await db_responder.read_rank_role(role.id)
         # rank role found
         if rank_role:
-            deleted_role = db_responder.delete_rank_role(role.id)
+            deleted_role = await db_responder.delete_rank_role(role.id)
             return
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
+        # drop the cached guild config even if the guild was not claimed
+        db_responder.invalidate_guild_config(guild.id)
+        discord_responder.forget_role_fingerprint(guild.id)
+
         # check if removed guild is a claimed guild
-        db_guild = db_responder.read_guild(guild.id)
+        db_guild = await db_responder.read_guild(guild.id)
 
         # guild was claimed
         if db_guild:
-            deleted_guild = db_responder.delete_guild(guild.id)
+            deleted_guild = await db_responder.delete_guild(guild.id)
             return
 
     @commands.Cog.listener()
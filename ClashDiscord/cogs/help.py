@@ -30,7 +30,7 @@ class Help(commands.Cog):
 
         await inter.response.defer()
 
-        help_dict = help_main_responder.help_main(
+        help_dict = await help_main_responder.help_main(
             bot=inter.bot,
             inter=inter,
             client_data=self.client_data)
@@ -45,7 +45,7 @@ class Player(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.player_verification(
             db_player_obj, user, self.coc_client)
@@ -115,7 +115,7 @@ class Player(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.player_verification(
             db_player_obj, user, self.coc_client)
@@ -217,7 +217,7 @@ class Player(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.player_verification(
             db_player_obj, user, self.coc_client)
@@ -295,7 +295,7 @@ class Player(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.player_verification(
             db_player_obj, user, self.coc_client)
@@ -375,7 +375,7 @@ class Player(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.player_verification(
             db_player_obj, user, self.coc_client)
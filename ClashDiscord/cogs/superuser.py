@@ -11,12 +11,12 @@ from responders.ClientResponder import (
     client_user_profile
 )
 from utils import discord_utils
-from linkAPI.client import LinkApiClient
+from linkAPI.async_client import AsyncLinkApiClient
 from linkAPI.errors import *
 
 
 class SuperUser(commands.Cog):
-    def __init__(self, bot, coc_client, client_data, linkapi_client: LinkApiClient):
+    def __init__(self, bot, coc_client, client_data, linkapi_client: AsyncLinkApiClient):
         self.bot = bot
         self.coc_client = coc_client
         self.client_data = client_data
@@ -51,7 +51,7 @@ class SuperUser(commands.Cog):
         # defer for every superuser player command
         await inter.response.defer(ephemeral=True)
 
-        db_author = db_responder.read_user(inter.author.id)
+        db_author = await db_responder.read_user(inter.author.id)
         # author is not claimed
         if not db_author:
             embed_description = f"{inter.author.mention} is not claimed"
@@ -86,7 +86,7 @@ class SuperUser(commands.Cog):
         field_dict_list = []
 
         if option == "profile":
-            db_player_list = db_responder.read_player_list(user.id)
+            db_player_list = await db_responder.read_player_list(user.id)
 
             # user has no claimed players
             if len(db_player_list) == 0:
@@ -114,7 +114,7 @@ class SuperUser(commands.Cog):
                 coc_client=self.coc_client)
 
         elif option == "player list":
-            db_player_list = db_responder.read_player_list(user.id)
+            db_player_list = await db_responder.read_player_list(user.id)
 
             # user has no claimed players
             if len(db_player_list) == 0:
@@ -143,9 +143,9 @@ class SuperUser(commands.Cog):
         elif option == "sync":
             try:
                 # confirm user has been claimed
-                db_user = db_responder.read_user(user.id)
+                db_user = await db_responder.read_user(user.id)
 
-                link_responder.sync_link(
+                await link_responder.sync_link(
                     linkapi_client=self.linkapi_client,
                     discord_user_id=db_user.discord_id
                 )
@@ -168,7 +168,7 @@ class SuperUser(commands.Cog):
                 f"data for {user.mention} has been properly synced")
 
         elif option == "claim":
-            db_user = db_responder.claim_user(user.id)
+            db_user = await db_responder.claim_user(user.id)
 
             # user wasn't claimed and now is
             if db_user:
@@ -180,7 +180,7 @@ class SuperUser(commands.Cog):
                                      f"has already been claimed")
 
         elif option == "remove":
-            db_user = db_responder.read_user(user.id)
+            db_user = await db_responder.read_user(user.id)
 
             # user not found
             if not db_user:
@@ -202,7 +202,7 @@ class SuperUser(commands.Cog):
             # user found
 
             # delete user claim
-            removed_user = db_responder.delete_user(user.id)
+            removed_user = await db_responder.delete_user(user.id)
 
             # user could not be deleted
             if removed_user:
@@ -227,7 +227,7 @@ class SuperUser(commands.Cog):
 
             # get all player links for this user
             try:
-                player_links = self.linkapi_client.get_discord_user_link(
+                player_links = await self.linkapi_client.get_discord_user_link(
                     user.id)
             except LoginError as arg:
                 print(arg)
@@ -238,7 +238,7 @@ class SuperUser(commands.Cog):
             # delete each link for the user
             for link in player_links:
                 try:
-                    self.linkapi_client.delete_link(player_tag=link.player_tag)
+                    await self.linkapi_client.delete_link(player_tag=link.player_tag)
                 except LoginError as arg:
                     print(arg)
                 # pass this error as nothing needs to be deleted
@@ -284,7 +284,7 @@ class SuperUser(commands.Cog):
         # defer for every superuser admin command
         await inter.response.defer(ephemeral=True)
 
-        db_author = db_responder.read_user(inter.author.id)
+        db_author = await db_responder.read_user(inter.author.id)
         # author is not claimed
         if not db_author:
             embed_description = f"{inter.author.mention} is not claimed"
@@ -319,7 +319,7 @@ class SuperUser(commands.Cog):
         field_dict_list = []
 
         if option == "show":
-            db_admin_users = db_responder.read_user_admin_all()
+            db_admin_users = await db_responder.read_user_admin_all()
 
             if len(db_admin_users) == 0:
                 embed_description = f"{inter.me.display_name} has no admin users"
@@ -376,7 +376,7 @@ class SuperUser(commands.Cog):
                 return
 
             # confirm user is claimed
-            db_user = db_responder.read_user(user.id)
+            db_user = await db_responder.read_user(user.id)
             # user isn't claimed
             if not db_user:
                 embed_description = f"{user.mention} is not claimed"
@@ -391,7 +391,7 @@ class SuperUser(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            updated_user = db_responder.update_toggle_user_admin(user.id)
+            updated_user = await db_responder.update_toggle_user_admin(user.id)
             # upated user not found
             if updated_user is None:
                 embed_description = f"{user.mention} could not be updated"
@@ -453,7 +453,7 @@ class SuperUser(commands.Cog):
         # defer for every superuser player command
         await inter.response.defer(ephemeral=True)
 
-        db_author = db_responder.read_user(inter.author.id)
+        db_author = await db_responder.read_user(inter.author.id)
         # author is not claimed
         if not db_author:
             embed_description = f"{inter.author.mention} is not claimed"
@@ -536,7 +536,7 @@ class SuperUser(commands.Cog):
                 player_tag = player.tag
                 player_title = f"{player.name} {player.tag}"
 
-            db_player = db_responder.read_player(user.id, player_tag)
+            db_player = await db_responder.read_player(user.id, player_tag)
 
             # db player not found
             if not db_player:
@@ -553,7 +553,7 @@ class SuperUser(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            db_del_player = db_responder.delete_player(
+            db_del_player = await db_responder.delete_player(
                 user.id, player_tag)
 
             # player was not deleted
@@ -572,10 +572,10 @@ class SuperUser(commands.Cog):
                 return
 
             # delete link api link
-            self.linkapi_client.delete_link(
+            await self.linkapi_client.delete_link(
                 player_tag=player_tag)
 
-            db_active_player = db_responder.read_player_active(user.id)
+            db_active_player = await db_responder.read_player_active(user.id)
 
             # active player found
             # no need to change the active player
@@ -595,7 +595,7 @@ class SuperUser(commands.Cog):
 
             # no active player found
             # check if there are any other players
-            db_player_list = db_responder.read_player_list(
+            db_player_list = await db_responder.read_player_list(
                 user.id)
 
             # no additional players claimed
@@ -615,7 +615,7 @@ class SuperUser(commands.Cog):
 
             # additional players claimed by user
             # update the first as the new active
-            db_updated_player = db_responder.update_player_active(
+            db_updated_player = await db_responder.update_player_active(
                 user.id, db_player_list[0].player_tag)
 
             # update not successful
@@ -679,7 +679,7 @@ class SuperUser(commands.Cog):
             return
 
         if option == "user":
-            field_dict_list.append(discord_responder.find_user_from_tag(
+            field_dict_list.append(await discord_responder.find_user_from_tag(
                 player, inter.guild.members))
 
             embed_list = discord_responder.embed_message(
@@ -723,10 +723,10 @@ class SuperUser(commands.Cog):
         elif option == "claim":
 
             # confirm user has been claimed
-            db_user = db_responder.read_user(user.id)
+            db_user = await db_responder.read_user(user.id)
             if not db_user:
                 # user has not been claimed
-                db_user = db_responder.claim_user(user.id)
+                db_user = await db_responder.claim_user(user.id)
                 if not db_user:
                     # user could not be claimed
                     await inter.edit_original_message(
@@ -734,7 +734,7 @@ class SuperUser(commands.Cog):
                     return
 
             # confirm player has not been claimed
-            db_player = db_responder.read_player_from_tag(player.tag)
+            db_player = await db_responder.read_player_from_tag(player.tag)
             # player has already been claimed
             if db_player:
                 embed_description = (f"{player.name} {player.tag} "
@@ -752,7 +752,7 @@ class SuperUser(commands.Cog):
 
             # add player link to link API
             try:
-                link_responder.add_secure_link(
+                await link_responder.add_secure_link(
                     linkapi_client=self.linkapi_client,
                     player_tag=player.tag,
                     discord_user_id=db_user.discord_id
@@ -775,7 +775,7 @@ class SuperUser(commands.Cog):
             # user claimed
             # player is valid
             # player hasn't been claimed
-            db_player = db_responder.claim_player(
+            db_player = await db_responder.claim_player(
                 user.id, player.tag)
 
             # failed to claim
@@ -823,7 +823,7 @@ class SuperUser(commands.Cog):
 
         await inter.response.defer()
 
-        db_author = db_responder.read_user(inter.author.id)
+        db_author = await db_responder.read_user(inter.author.id)
         # author is not claimed
         if not db_author:
             embed_description = f"{inter.author.mention} is not claimed"
@@ -886,7 +886,7 @@ class SuperUser(commands.Cog):
             guild_id = int(guild_id)
 
             # confirm guild is claimed
-            db_guild = db_responder.read_guild(guild_id)
+            db_guild = await db_responder.read_guild(guild_id)
 
             # guild isn't claimed
             if not db_guild:
@@ -902,7 +902,7 @@ class SuperUser(commands.Cog):
                 await discord_responder.send_embed_list(inter, embed_list)
                 return
 
-            deleted_guild = db_responder.delete_guild(guild_id)
+            deleted_guild = await db_responder.delete_guild(guild_id)
 
             # guild was deleted properly
             if deleted_guild is None:
@@ -978,6 +978,124 @@ class SuperUser(commands.Cog):
 
         await discord_responder.send_embed_list(inter, embed_list)
 
+    @superuser.sub_command()
+    async def link(
+        self, inter,
+        option: str = discord_utils.command_param_dict['superuser_link'],
+    ):
+        """
+            *super user* 
+            super user LinkAPI commands
+
+            Parameters
+            ----------
+            option (optional): options for superuser link commands
+        """
+
+        # defer for every superuser link command
+        await inter.response.defer(ephemeral=True)
+
+        db_author = await db_responder.read_user(inter.author.id)
+
+        # author is not claimed
+        if not db_author:
+            embed_description = f"{inter.author.mention} is not claimed"
+
+            embed_list = discord_responder.embed_message(
+                icon_url=inter.bot.user.avatar.url,
+                description=embed_description,
+                bot_user_name=inter.me.display_name,
+                author=inter.author
+            )
+
+            await discord_responder.send_embed_list(inter, embed_list)
+            return
+
+        # author is not super user
+        if not db_author.super_user:
+            embed_description = f"{inter.author.mention} is not super user"
+
+            embed_list = discord_responder.embed_message(
+                icon_url=inter.bot.user.avatar.url,
+                description=embed_description,
+                bot_user_name=inter.me.display_name,
+                author=inter.author
+            )
+
+            await discord_responder.send_embed_list(inter, embed_list)
+            return
+
+        # initializing embed default values
+        embed_title = None
+        embed_description = None
+        field_dict_list = []
+
+        if option in ("sync server", "sync all"):
+            try:
+                if option == "sync server":
+                    embed_title = f"{inter.guild.name} LinkAPI Sync"
+                    reconciliation_payload = (
+                        await link_responder.reconcile_guild_links(
+                            self.linkapi_client, inter.guild))
+
+                else:
+                    embed_title = f"{inter.me.display_name} LinkAPI Sync"
+                    reconciliation_payload = (
+                        await link_responder.reconcile_all_links(
+                            self.linkapi_client))
+
+            except LoginError as arg:
+                embed_description = f"{arg}"
+                reconciliation_payload = None
+
+            if reconciliation_payload:
+                conflict_list = reconciliation_payload['conflict_list']
+
+                embed_description = (
+                    f"{reconciliation_payload['user_count']} users synced")
+
+                field_dict_list = [
+                    {
+                        'name': "pulled from LinkAPI",
+                        'value': f"{reconciliation_payload['pulled_count']}",
+                        'inline': True
+                    },
+                    {
+                        'name': "pushed to LinkAPI",
+                        'value': f"{reconciliation_payload['pushed_count']}",
+                        'inline': True
+                    },
+                    {
+                        'name': "conflicts",
+                        'value': f"{len(conflict_list)}",
+                        'inline': True
+                    }
+                ]
+
+                # list the first conflicts to stay within embed limits
+                for conflict in conflict_list[:20]:
+                    field_dict_list.append({
+                        'name': "conflict",
+                        'value': conflict,
+                        'inline': False
+                    })
+
+        else:
+            field_dict_list = [{
+                'name': "incorrect option selected",
+                'value': "please select a different option"
+            }]
+
+        embed_list = discord_responder.embed_message(
+            icon_url=inter.bot.user.avatar.url,
+            title=embed_title,
+            description=embed_description,
+            bot_user_name=inter.me.display_name,
+            field_list=field_dict_list,
+            author=inter.author)
+
+        await discord_responder.send_embed_list(inter, embed_list)
+
     @superuser.sub_command()
     async def count(
         self, inter,
@@ -995,7 +1113,7 @@ class SuperUser(commands.Cog):
         # defer for every superuser count command
         await inter.response.defer(ephemeral=True)
 
-        db_author = db_responder.read_user(inter.author.id)
+        db_author = await db_responder.read_user(inter.author.id)
 
         # author is not claimed
         if not db_author:
@@ -1031,25 +1149,25 @@ class SuperUser(commands.Cog):
         field_dict_list = []
 
         if option == "user":
-            user_count = db_responder.read_user_count()
+            user_count = await db_responder.read_user_count()
 
             embed_title = f"{inter.me.display_name} User Count"
             embed_description = f"{user_count} users"
 
         elif option == "player":
-            player_count = db_responder.read_player_count()
+            player_count = await db_responder.read_player_count()
 
             embed_title = f"{inter.me.display_name} Player Count"
             embed_description = f"{player_count} players"
 
         elif option == "server":
-            guild_count = db_responder.read_guild_count()
+            guild_count = await db_responder.read_guild_count()
 
             embed_title = f"{inter.me.display_name} Server Count"
             embed_description = f"{guild_count} servers"
 
         elif option == "clan":
-            clan_count = db_responder.read_clan_count()
+            clan_count = await db_responder.read_clan_count()
 
             embed_title = f"{inter.me.display_name} Clan Count"
             embed_description = f"{clan_count} clans"
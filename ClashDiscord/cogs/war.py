@@ -46,7 +46,7 @@ class War(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.war_verification(
                 db_player_obj, war_selection, inter.author, self.coc_client)
@@ -102,7 +102,7 @@ class War(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.war_verification(
                 db_player_obj, war_selection, inter.author, self.coc_client)
@@ -159,7 +159,7 @@ class War(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.war_verification(
                 db_player_obj, war_selection, inter.author, self.coc_client)
@@ -239,7 +239,7 @@ class War(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.war_verification(
@@ -319,7 +319,7 @@ class War(commands.Cog):
         if user is None:
             user = inter.author
 
-        db_player_obj = db_responder.read_player_active(user.id)
+        db_player_obj = await db_responder.read_player_active(user.id)
 
         verification_payload = await auth_responder.war_verification(
             db_player_obj, war_selection, user, self.coc_client)
@@ -369,7 +369,7 @@ class War(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = (
                 await auth_responder.war_leadership_verification(
@@ -429,7 +429,7 @@ class War(commands.Cog):
 
         # role not mentioned
         if clan_role is None:
-            db_player_obj = db_responder.read_player_active(inter.author.id)
+            db_player_obj = await db_responder.read_player_active(inter.author.id)
 
             verification_payload = await auth_responder.war_verification(
                 db_player_obj, war_selection, inter.author, self.coc_client)
@@ -516,3 +516,222 @@ class War(commands.Cog):
         )
 
         await discord_responder.send_embed_list(inter, embed_list)
+
+    @war.sub_command()
+    async def leaderboard(
+        self,
+        inter,
+        season: str = discord_utils.command_param_dict['season']
+    ):
+        """
+            ranks the server's clan members by war score for a season
+
+            Parameters
+            ----------
+            season (optional): season as YYYY-MM, defaults to this season
+        """
+
+        if season is None:
+            season = db_responder.current_war_season()
+
+        db_clan_obj_list = await db_responder.read_clan_list_from_guild(
+            inter.guild.id)
+
+        # ranked from the season totals kept as wars end
+        war_season_member_list = (
+            await db_responder.read_war_season_leaderboard(
+                season, "war",
+                [db_clan_obj.clan_tag for db_clan_obj in db_clan_obj_list]))
+
+        field_dict_list = war_responder.war_season_leaderboard(
+            war_season_member_list, season,
+            inter.client.emojis, self.client_data.emojis)
+
+        embed_list = discord_responder.embed_message(
+            icon_url=inter.bot.user.avatar.url,
+            title=f"{inter.guild.name} war leaderboard {season}",
+            bot_user_name=inter.me.display_name,
+            field_list=field_dict_list,
+            author=inter.author
+        )
+
+        await discord_responder.send_embed_list(inter, embed_list)
+
+    @war.sub_command_group()
+    async def history(self, inter):
+        """
+            parent for war history commands
+        """
+
+        pass
+
+    @history.sub_command(name="user")
+    async def history_user(
+        self,
+        inter,
+        user: disnake.User = discord_utils.command_param_dict['user'],
+        season: str = discord_utils.command_param_dict['season']
+    ):
+        """
+            user's active player stored war history
+
+            Parameters
+            ----------
+            user (optional): user to search for active player
+            season (optional): season as YYYY-MM, defaults to this season
+        """
+
+        # setting user to author if not specified
+        if user is None:
+            user = inter.author
+
+        if season is None:
+            season = db_responder.current_war_season()
+
+        db_player_obj = await db_responder.read_player_active(user.id)
+
+        # user active player not found
+        if not db_player_obj:
+            embed_list = discord_responder.embed_message(
+                icon_url=inter.bot.user.avatar.url,
+                bot_user_name=inter.me.display_name,
+                field_list=[{
+                    'name': "no active player claimed",
+                    'value': user.mention
+                }],
+                author=inter.author
+            )
+
+            await discord_responder.send_embed_list(inter, embed_list)
+            return
+
+        # read from the stored wars, no clash requests
+        player_tag = db_player_obj.player_tag
+        season_war_member_stats = (
+            await db_responder.read_war_member_stats_from_player(
+                player_tag, season))
+        war_member_stats = (
+            await db_responder.read_war_member_stats_from_player(player_tag))
+        war_member_list = (
+            await db_responder.read_war_member_list_from_player(player_tag))
+        war_attack_list = (
+            await db_responder.read_war_attack_list_from_player(player_tag))
+
+        # latest stored name for the player
+        if len(war_member_list) != 0:
+            embed_title = (f"{war_member_list[0].name} {player_tag} "
+                           f"war history")
+        else:
+            embed_title = f"{player_tag} war history"
+
+        field_dict_list = war_responder.war_history_player(
+            season_war_member_stats, war_member_stats, season,
+            war_member_list, war_attack_list,
+            inter.client.emojis, self.client_data.emojis)
+
+        embed_list = discord_responder.embed_message(
+            icon_url=inter.bot.user.avatar.url,
+            title=embed_title,
+            bot_user_name=inter.me.display_name,
+            field_list=field_dict_list,
+            author=inter.author
+        )
+
+        await discord_responder.send_embed_list(inter, embed_list)
+
+    @history.sub_command(name="clan")
+    async def history_clan(
+        self,
+        inter,
+        clan_role: disnake.Role = discord_utils.command_param_dict['clan_role'],
+        season: str = discord_utils.command_param_dict['season']
+    ):
+        """
+            clan's stored war history and latest stored war
+
+            Parameters
+            ----------
+            clan_role (optional): clan role to use linked clan
+            season (optional): season as YYYY-MM, defaults to this season
+        """
+
+        if season is None:
+            season = db_responder.current_war_season()
+
+        # role not mentioned
+        if clan_role is None:
+            db_player_obj = await db_responder.read_player_active(
+                inter.author.id)
+
+            verification_payload = (
+                await auth_responder.player_clan_verification(
+                    db_player_obj, inter.author, self.coc_client))
+
+            if not verification_payload['verified']:
+                embed_list = discord_responder.embed_message(
+                    icon_url=inter.bot.user.avatar.url,
+                    bot_user_name=inter.me.display_name,
+                    field_list=verification_payload['field_dict_list'],
+                    author=inter.author
+                )
+
+                await discord_responder.send_embed_list(inter, embed_list)
+                return
+
+            clan_tag = verification_payload['player_obj'].clan.tag
+
+        # role has been mentioned
+        else:
+            db_clan_role = await db_responder.read_clan_role(clan_role.id)
+
+            # role mentioned was not a linked clan role
+            if db_clan_role is None:
+                embed_list = discord_responder.embed_message(
+                    icon_url=inter.bot.user.avatar.url,
+                    bot_user_name=inter.me.display_name,
+                    field_list=[{
+                        'name': "please mention a clan role",
+                        'value': f"{clan_role.mention} is not linked to a clan"
+                    }],
+                    author=inter.author
+                )
+
+                await discord_responder.send_embed_list(inter, embed_list)
+                return
+
+            clan_tag = db_clan_role.clan_tag
+
+        # read from the stored wars, no clash requests
+        season_war_stats = await db_responder.read_war_stats_from_clan(
+            clan_tag, season)
+        war_stats = await db_responder.read_war_stats_from_clan(clan_tag)
+        war_list = await db_responder.read_war_list_from_clan(clan_tag)
+
+        # members and attacks of the latest stored war
+        if len(war_list) != 0:
+            war_member_list = (
+                await db_responder.read_war_member_list_from_clan_war(
+                    clan_tag, war_list[0].end_time))
+            war_attack_list = (
+                await db_responder.read_war_attack_list_from_clan_war(
+                    clan_tag, war_list[0].end_time))
+            embed_title = f"{war_list[0].clan_name} {clan_tag} war history"
+        else:
+            war_member_list = []
+            war_attack_list = []
+            embed_title = f"{clan_tag} war history"
+
+        field_dict_list = war_responder.war_history_clan(
+            season_war_stats, war_stats, season, war_list,
+            war_member_list, war_attack_list,
+            inter.client.emojis, self.client_data.emojis)
+
+        embed_list = discord_responder.embed_message(
+            icon_url=inter.bot.user.avatar.url,
+            title=embed_title,
+            bot_user_name=inter.me.display_name,
+            field_list=field_dict_list,
+            author=inter.author
+        )
+
+        await discord_responder.send_embed_list(inter, embed_list)
@@ -0,0 +1,52 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import database.RazBotDB_Pool as db_pool
+
+
+db_executor = None
+db_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+        returns the thread pool used for blocking db calls,
+        sized to the connection pool so no worker waits on a connection
+
+        Returns:
+            obj: ThreadPoolExecutor
+    """
+    global db_executor
+
+    if db_executor is not None:
+        return db_executor
+
+    with db_executor_lock:
+        if db_executor is None:
+            db_executor = ThreadPoolExecutor(
+                max_workers=db_pool.get_pool().max_size,
+                thread_name_prefix="RazBotDB"
+            )
+
+    return db_executor
+
+
+async def run(db_function, *args, **kwargs):
+    """
+        runs a blocking database function in the db executor
+        so the event loop is not stalled while waiting on MySQL
+
+        Args:
+            db_function (function): RazBotDB_* table function
+            *args: positional args for db_function
+            **kwargs: keyword args for db_function
+
+        Returns:
+            the return value of db_function
+    """
+
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(db_function, *args, **kwargs))
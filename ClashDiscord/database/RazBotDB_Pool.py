@@ -0,0 +1,330 @@
+import threading
+import time
+from contextlib import contextmanager
+import pymysql
+import data.RazBotDB_Connection_Data as RazBotDB_Connection_Data
+
+
+# pool defaults, used when RazBotDB_Connection_Data does not set them
+default_pool_min_size = 1
+default_pool_max_size = 10
+default_pool_acquire_timeout = 10
+default_pool_idle_timeout = 300
+default_pool_max_lifetime = 3600
+default_pool_health_check_interval = 30
+
+
+class PoolTimeoutError(Exception):
+    """no pooled connection became available in time"""
+    pass
+
+
+class PooledConnection(object):
+    """
+        PooledConnection: pymysql connection owned by the connection pool
+
+            Instance Attributes
+                connection (obj): pymysql connection
+                created_time (float): monotonic time the connection was opened
+                last_used_time (float): monotonic time the connection
+                    was last returned to the pool
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_time = time.monotonic()
+        self.last_used_time = self.created_time
+
+
+class ConnectionPool(object):
+    """
+        ConnectionPool: thread safe pool of pymysql connections
+
+            Instance Attributes
+                connection_data (obj): RazBotDB_Connection_Data instance
+                min_size (int): connections kept open while idle
+                max_size (int): maximum connections open at once
+                acquire_timeout (int): seconds to wait for a free connection
+                idle_timeout (int): seconds an idle connection is kept
+                    above min_size before it is recycled
+                max_lifetime (int): seconds a connection is kept
+                    before it is recycled
+                health_check_interval (int): seconds a connection can sit
+                    idle before it is pinged on checkout
+    """
+
+    def __init__(
+        self, connection_data,
+        min_size=default_pool_min_size,
+        max_size=default_pool_max_size,
+        acquire_timeout=default_pool_acquire_timeout,
+        idle_timeout=default_pool_idle_timeout,
+        max_lifetime=default_pool_max_lifetime,
+        health_check_interval=default_pool_health_check_interval
+    ):
+        self.connection_data = connection_data
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+
+        # idle connections, most recently used last
+        self._idle_list = []
+        # count of open connections, idle and checked out
+        self._open_count = 0
+        self._condition = threading.Condition(threading.Lock())
+
+        for _ in range(self.min_size):
+            self._open_count += 1
+            self._idle_list.append(self._open())
+
+    def _open(self):
+        """
+            opens a new pymysql connection,
+            the caller must have already counted it against max_size
+        """
+
+        # autocommit keeps a reused connection from holding a
+        # stale REPEATABLE READ snapshot between queries
+        try:
+            connection = pymysql.connect(
+                host=self.connection_data.hostname,
+                user=self.connection_data.username,
+                password=self.connection_data.password,
+                db=self.connection_data.db_name,
+                port=self.connection_data.port,
+                autocommit=True
+            )
+
+        # give the reserved slot back if the connection could not be made
+        except Exception:
+            with self._condition:
+                self._open_count -= 1
+                self._condition.notify()
+            raise
+
+        return PooledConnection(connection)
+
+    def _close(self, pooled_connection):
+        """
+            closes a pooled connection and frees its max_size slot
+        """
+
+        try:
+            pooled_connection.connection.close()
+        except Exception:
+            # connection was already unusable
+            pass
+
+        with self._condition:
+            self._open_count -= 1
+            self._condition.notify()
+
+    def _is_expired(self, pooled_connection, now):
+        """
+            returns True if the connection has outlived max_lifetime
+        """
+
+        return (now - pooled_connection.created_time) > self.max_lifetime
+
+    def _is_healthy(self, pooled_connection, now):
+        """
+            pings the connection if it has been idle
+            longer than health_check_interval
+        """
+
+        idle_time = now - pooled_connection.last_used_time
+
+        if idle_time < self.health_check_interval:
+            return True
+
+        try:
+            pooled_connection.connection.ping(reconnect=False)
+        except Exception:
+            return False
+
+        return True
+
+    def _recycle_idle(self, now):
+        """
+            returns the idle connections that have been idle
+            longer than idle_timeout while above min_size,
+            caller must hold the condition
+        """
+
+        recycle_list = []
+        keep_list = []
+        open_count = self._open_count
+
+        # oldest idle connections are at the front of the list
+        for pooled_connection in self._idle_list:
+            idle_time = now - pooled_connection.last_used_time
+
+            if (idle_time > self.idle_timeout
+                    and open_count - len(recycle_list) > self.min_size):
+                recycle_list.append(pooled_connection)
+            else:
+                keep_list.append(pooled_connection)
+
+        self._idle_list = keep_list
+        return recycle_list
+
+    def acquire(self):
+        """
+            checks out a connection,
+            opening a new one if none are idle and max_size allows
+
+            Raises:
+                PoolTimeoutError: no connection freed up in acquire_timeout
+
+            Returns:
+                obj: PooledConnection
+        """
+
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            pooled_connection = None
+            open_new = False
+
+            with self._condition:
+                recycle_list = self._recycle_idle(time.monotonic())
+
+                if self._idle_list:
+                    pooled_connection = self._idle_list.pop()
+
+                elif self._open_count - len(recycle_list) < self.max_size:
+                    # reserve the slot before opening outside the condition
+                    self._open_count += 1
+                    open_new = True
+
+                elif not recycle_list:
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"no database connection available after "
+                            f"{self.acquire_timeout} seconds")
+
+                    self._condition.wait(remaining)
+                    continue
+
+            # closing outside the condition, _close takes it again
+            for recycled_connection in recycle_list:
+                self._close(recycled_connection)
+
+            if open_new:
+                return self._open()
+
+            if pooled_connection is None:
+                continue
+
+            now = time.monotonic()
+
+            if (self._is_expired(pooled_connection, now)
+                    or not self._is_healthy(pooled_connection, now)):
+                self._close(pooled_connection)
+                continue
+
+            return pooled_connection
+
+    def release(self, pooled_connection, discard=False):
+        """
+            returns a connection to the pool,
+            discarded connections are closed instead
+
+            Args:
+                pooled_connection (obj): PooledConnection from acquire
+                discard (bool): close the connection instead of reusing it
+        """
+
+        now = time.monotonic()
+
+        if discard or self._is_expired(pooled_connection, now):
+            self._close(pooled_connection)
+            return
+
+        pooled_connection.last_used_time = now
+
+        with self._condition:
+            self._idle_list.append(pooled_connection)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+            context manager yielding a pymysql connection,
+            the connection is discarded if the block raises
+        """
+
+        pooled_connection = self.acquire()
+
+        try:
+            yield pooled_connection.connection
+
+        except Exception:
+            self.release(pooled_connection, discard=True)
+            raise
+
+        self.release(pooled_connection)
+
+    def close_all(self):
+        """
+            closes every idle connection,
+            checked out connections close when they are released
+        """
+
+        with self._condition:
+            idle_list = self._idle_list
+            self._idle_list = []
+
+        for pooled_connection in idle_list:
+            self._close(pooled_connection)
+
+
+db_pool = None
+db_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+        returns the process wide connection pool,
+        creating it from RazBotDB_Connection_Data on first use
+
+        Returns:
+            obj: ConnectionPool
+    """
+    global db_pool
+
+    if db_pool is not None:
+        return db_pool
+
+    with db_pool_lock:
+        if db_pool is None:
+            connection_data = RazBotDB_Connection_Data.RazBotDB_Connection_Data()
+
+            db_pool = ConnectionPool(
+                connection_data,
+                min_size=getattr(
+                    connection_data, 'pool_min_size',
+                    default_pool_min_size),
+                max_size=getattr(
+                    connection_data, 'pool_max_size',
+                    default_pool_max_size),
+                acquire_timeout=getattr(
+                    connection_data, 'pool_acquire_timeout',
+                    default_pool_acquire_timeout),
+                idle_timeout=getattr(
+                    connection_data, 'pool_idle_timeout',
+                    default_pool_idle_timeout),
+                max_lifetime=getattr(
+                    connection_data, 'pool_max_lifetime',
+                    default_pool_max_lifetime),
+                health_check_interval=getattr(
+                    connection_data, 'pool_health_check_interval',
+                    default_pool_health_check_interval)
+            )
+
+    return db_pool
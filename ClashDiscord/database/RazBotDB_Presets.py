@@ -2,44 +2,86 @@ import database.RazBotDB_Query as db_query
 
 
 # INSERT
-def insert(query):
+def insert(query, params=None):
     # execute the query
-    db_query.execute_query(query)
+    db_query.execute_query(query, params)
+
+
+def insert_list(query, params_list):
+    # execute the query for each params and return inserted row count
+    row_count = db_query.execute_many_query(query, params_list)
+    return row_count
+
+
+def insert_transaction(statement_list):
+    # execute the (query, params) statements in one transaction
+    db_query.execute_transaction(statement_list)
 
 
 # SELECT
-def select(query):
+def select(query, params=None):
     # execute and return query
-    data = db_query.fetch_single_query(query)
+    data = db_query.fetch_single_query(query, params)
     return data
 
 
-def select_list(query):
+def select_list(query, params=None):
     # return query
-    data = db_query.fetch_all_query(query)
+    data = db_query.fetch_all_query(query, params)
     return data
 
 
 # UPDATE
-def update(query):
+def update(query, params=None):
     # execute the query
-    db_query.execute_query(query)
+    db_query.execute_query(query, params)
 
 
 # DELETE
-def delete(query):
+def delete(query, params=None):
     # execute the query
-    db_query.execute_query(query)
+    db_query.execute_query(query, params)
 
 # CREATE
 
 
-def create(query):
+def create(query, params=None):
     # execute the query
-    db_query.execute_query(query)
+    db_query.execute_query(query, params)
+
+
+def create_index(table_name, index_name, query):
+    # information_schema has a row per indexed column
+    exists_query = (
+        "SELECT 1 FROM information_schema.statistics "
+        "WHERE table_schema = DATABASE() "
+        "AND table_name = %s AND index_name = %s "
+        "LIMIT 1;"
+    )
+
+    # only create the index if it does not exist,
+    # so a migration that stopped partway can run again
+    if db_query.fetch_single_query(
+            exists_query, (table_name, index_name)) is None:
+        db_query.execute_query(query)
+
+
+def create_column(table_name, column_name, query):
+    exists_query = (
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() "
+        "AND table_name = %s AND column_name = %s "
+        "LIMIT 1;"
+    )
+
+    # only add the column if it does not exist,
+    # so a migration that stopped partway can run again
+    if db_query.fetch_single_query(
+            exists_query, (table_name, column_name)) is None:
+        db_query.execute_query(query)
 
 
 # DROP
-def drop(query):
+def drop(query, params=None):
     # execute the query
-    db_query.execute_query(query)
+    db_query.execute_query(query, params)
@@ -1,64 +1,71 @@
-import pymysql
-import data.RazBotDB_Connection_Data as RazBotDB_Connection_Data
+import database.RazBotDB_Pool as db_pool
 
 
-def fetch_single_query(query):
+def fetch_single_query(query, params=None):
 
-    connection_data = RazBotDB_Connection_Data.RazBotDB_Connection_Data()
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
 
-    connection = pymysql.connect(
-        host=connection_data.hostname,
-        user=connection_data.username,
-        password=connection_data.password,
-        db=connection_data.db_name,
-        port=connection_data.port
-    )
+        cur.execute(query, params)
+        result = cur.fetchone()
+        cur.close()
 
-    cur = connection.cursor()
+    return result
+
+
+def fetch_all_query(query, params=None):
+
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
+
+        cur.execute(query, params)
+        result = cur.fetchall()
+        cur.close()
 
-    cur.execute(query)
-    result = cur.fetchone()
-    cur.close()
-    connection.close()
     return result
 
 
-def fetch_all_query(query):
+def execute_query(query, params=None):
 
-    connection_data = RazBotDB_Connection_Data.RazBotDB_Connection_Data()
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
 
-    connection = pymysql.connect(
-        host=connection_data.hostname,
-        user=connection_data.username,
-        password=connection_data.password,
-        db=connection_data.db_name,
-        port=connection_data.port
-    )
+        cur.execute(query, params)
+        connection.commit()
+        cur.close()
 
-    cur = connection.cursor()
 
-    cur.execute(query)
-    result = cur.fetchall()
-    cur.close()
-    connection.close()
-    return result
+def execute_many_query(query, params_list):
+
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
+
+        # pymysql sends INSERT ... VALUES as multi row inserts
+        row_count = cur.executemany(query, params_list)
+        connection.commit()
+        cur.close()
+
+    return row_count
+
 
+def execute_transaction(statement_list):
 
-def execute_query(query):
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
 
-    connection_data = RazBotDB_Connection_Data.RazBotDB_Connection_Data()
+        # pooled connections autocommit,
+        # begin holds every statement until the commit
+        connection.begin()
 
-    connection = pymysql.connect(
-        host=connection_data.hostname,
-        user=connection_data.username,
-        password=connection_data.password,
-        db=connection_data.db_name,
-        port=connection_data.port
-    )
+        try:
+            for query, params in statement_list:
+                cur.execute(query, params)
+            connection.commit()
 
-    cur = connection.cursor()
+        # nothing is kept if a statement fails
+        except Exception:
+            connection.rollback()
+            raise
 
-    cur.execute(query)
-    connection.commit()
-    cur.close()
-    connection.close()
+        finally:
+            cur.close()
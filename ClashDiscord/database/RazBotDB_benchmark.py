@@ -0,0 +1,288 @@
+import copy
+import time
+import database.RazBotDB_Pool as db_pool
+import database.RazBotDB_db as db
+import data.RazBotDB_Connection_Data as RazBotDB_Connection_Data
+
+
+# query plan benchmark for the sub-select to JOIN rewrite
+# run from ClashDiscord with: python -m database.RazBotDB_benchmark
+# seeds a scratch schema, the configured schema is never touched
+
+benchmark_db_name = "razbot_benchmark"
+benchmark_user_count = 100000
+benchmark_player_per_user = 5
+benchmark_guild_count = 100
+benchmark_clan_per_guild = 5
+benchmark_repeat_count = 1000
+benchmark_batch_size = 10000
+
+# discord ids and player tags for seeded rows
+benchmark_discord_id_offset = 100000000000000000
+benchmark_guild_id_offset = 200000000000000000
+benchmark_role_id_offset = 300000000000000000
+
+
+# (name, sub-select query, JOIN query, params)
+benchmark_query_list = [
+    (
+        "select_player_active",
+        "SELECT player_tag, active FROM player "
+        "WHERE user_id = "
+        "(SELECT id FROM user WHERE discord_id = %s) "
+        "AND active = true",
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.active = true",
+        (benchmark_discord_id_offset + 50000,)
+    ),
+    (
+        "select_player_from_user_tag",
+        "SELECT player_tag, active FROM player "
+        "WHERE user_id = "
+        "(SELECT id FROM user WHERE discord_id = %s) "
+        "AND player_tag = %s",
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.player_tag = %s",
+        (benchmark_discord_id_offset + 50000, "#B250001")
+    ),
+    (
+        "select_player_all",
+        "SELECT player_tag, active FROM player "
+        "WHERE user_id = "
+        "(SELECT id FROM user WHERE discord_id = %s) ",
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s ",
+        (benchmark_discord_id_offset + 50000,)
+    ),
+    (
+        "select_user_from_tag",
+        "SELECT discord_id, admin, super_user FROM user "
+        "WHERE id = ("
+        "SELECT user_id FROM player WHERE player_tag = %s);",
+        "SELECT user.discord_id, user.admin, user.super_user FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE player.player_tag = %s;",
+        ("#B250001",)
+    ),
+    (
+        "select_clan_from_clan_role",
+        "SELECT clan_tag FROM clan "
+        "WHERE id = ("
+        "SELECT clan_id FROM clan_role WHERE discord_role_id = %s"
+        ") AND "
+        "guild_id = ("
+        "SELECT id from guild WHERE guild_id = %s"
+        ");",
+        "SELECT clan.clan_tag FROM clan_role "
+        "INNER JOIN clan ON clan_role.clan_id = clan.id "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan_role.discord_role_id = %s "
+        "AND guild.guild_id = %s;",
+        (benchmark_role_id_offset + 250, benchmark_guild_id_offset + 50)
+    ),
+    (
+        "update_player_active",
+        "UPDATE player "
+        "SET active = false "
+        "WHERE user_id = "
+        "(SELECT id FROM user WHERE discord_id = %s) "
+        "AND active = true;",
+        "UPDATE player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "SET player.active = false "
+        "WHERE user.discord_id = %s "
+        "AND player.active = true;",
+        (benchmark_discord_id_offset + 50000,)
+    ),
+    (
+        "delete_player",
+        "DELETE FROM player "
+        "WHERE user_id = "
+        "(SELECT id FROM user WHERE discord_id = %s) "
+        "AND player_tag = %s;",
+        "DELETE player FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.player_tag = %s;",
+        (benchmark_discord_id_offset + 50000, "#B250001")
+    )
+]
+
+
+def use_benchmark_pool():
+    """
+        creates the scratch schema and points the RazBotDB pool at it
+    """
+
+    connection_data = RazBotDB_Connection_Data.RazBotDB_Connection_Data()
+
+    # create the scratch schema through a pool on the configured schema
+    setup_pool = db_pool.ConnectionPool(connection_data, min_size=0)
+    with setup_pool.connection() as connection:
+        cur = connection.cursor()
+        cur.execute(f"DROP DATABASE IF EXISTS {benchmark_db_name};")
+        cur.execute(f"CREATE DATABASE {benchmark_db_name};")
+        cur.close()
+    setup_pool.close_all()
+
+    benchmark_connection_data = copy.copy(connection_data)
+    benchmark_connection_data.db_name = benchmark_db_name
+
+    # every RazBotDB query in this process now runs in the scratch schema
+    db_pool.db_pool = db_pool.ConnectionPool(benchmark_connection_data)
+
+
+def insert_batch(cur, query, row_list):
+    """
+        inserts row_list in benchmark_batch_size chunks
+    """
+
+    for index in range(0, len(row_list), benchmark_batch_size):
+        cur.executemany(query, row_list[index:index + benchmark_batch_size])
+
+
+def seed():
+    """
+        seeds users, players, guilds, clans and clan roles
+    """
+
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
+
+        # the migration already created the Raz user as id 1
+        user_row_list = []
+        for index in range(benchmark_user_count):
+            user_row_list.append((benchmark_discord_id_offset + index,))
+        insert_batch(
+            cur, "INSERT into user (discord_id) VALUES (%s);", user_row_list)
+
+        cur.execute(
+            "SELECT id, discord_id FROM user WHERE discord_id >= %s;",
+            (benchmark_discord_id_offset,))
+        user_id_dict = {}
+        for user_id, discord_id in cur.fetchall():
+            user_id_dict[discord_id - benchmark_discord_id_offset] = user_id
+
+        player_row_list = []
+        for index in range(benchmark_user_count):
+            for player_index in range(benchmark_player_per_user):
+                tag_index = index * benchmark_player_per_user + player_index
+                player_row_list.append((
+                    user_id_dict[index], f"#B{tag_index}",
+                    player_index == 0))
+        insert_batch(
+            cur,
+            "INSERT into player (user_id, player_tag, active) "
+            "VALUES (%s, %s, %s);",
+            player_row_list)
+
+        guild_row_list = []
+        for index in range(benchmark_guild_count):
+            guild_row_list.append((
+                benchmark_guild_id_offset + index, user_id_dict[index]))
+        insert_batch(
+            cur,
+            "INSERT into guild (guild_id, admin_user_id) VALUES (%s, %s);",
+            guild_row_list)
+
+        # one clan role per clan, ids follow the clan insert order
+        clan_row_list = []
+        clan_role_row_list = []
+        for index in range(benchmark_guild_count):
+            for clan_index in range(benchmark_clan_per_guild):
+                role_index = index * benchmark_clan_per_guild + clan_index
+                clan_row_list.append((
+                    benchmark_guild_id_offset + index, f"#C{role_index}"))
+                clan_role_row_list.append((
+                    benchmark_role_id_offset + role_index, f"#C{role_index}"))
+        insert_batch(
+            cur,
+            "INSERT into clan (guild_id, clan_tag) "
+            "SELECT id, %s FROM guild WHERE guild_id = %s;",
+            [(clan_tag, guild_id) for guild_id, clan_tag in clan_row_list])
+        insert_batch(
+            cur,
+            "INSERT into clan_role (discord_role_id, clan_id) "
+            "SELECT %s, id FROM clan WHERE clan_tag = %s;",
+            clan_role_row_list)
+
+        cur.execute("ANALYZE TABLE user, player, guild, clan, clan_role;")
+        cur.fetchall()
+        cur.close()
+
+
+def explain(cur, query, params):
+    """
+        returns the EXPLAIN rows for query as formatted strings
+    """
+
+    cur.execute(f"EXPLAIN {query}", params)
+    column_list = [column[0] for column in cur.description]
+
+    plan_list = []
+    for row in cur.fetchall():
+        row_dict = dict(zip(column_list, row))
+        plan_list.append(
+            f"    {row_dict['select_type']:<20} "
+            f"{str(row_dict['table']):<10} "
+            f"type={str(row_dict['type']):<7} "
+            f"key={str(row_dict['key']):<28} "
+            f"rows={row_dict['rows']}")
+
+    return plan_list
+
+
+def time_query(connection, cur, query, params):
+    """
+        returns the average milliseconds to run query,
+        writes are rolled back so every run sees the same rows
+    """
+
+    start_time = time.perf_counter()
+
+    for _ in range(benchmark_repeat_count):
+        connection.begin()
+        cur.execute(query, params)
+        cur.fetchall()
+        connection.rollback()
+
+    elapsed_time = time.perf_counter() - start_time
+    return elapsed_time / benchmark_repeat_count * 1000
+
+
+def run_benchmark():
+    """
+        prints the query plan and average run time
+        of each sub-select query next to its JOIN rewrite
+    """
+
+    with db_pool.get_pool().connection() as connection:
+        cur = connection.cursor()
+
+        for name, sub_select_query, join_query, params in benchmark_query_list:
+            print(name)
+
+            for label, query in (
+                ("sub-select", sub_select_query),
+                ("join", join_query)
+            ):
+                average_ms = time_query(connection, cur, query, params)
+                print(f"  {label}: {average_ms:.3f} ms")
+                for plan in explain(cur, query, params):
+                    print(plan)
+
+            print()
+
+        cur.close()
+
+
+if __name__ == "__main__":
+    use_benchmark_pool()
+    db.db_migrate()
+    seed()
+    run_benchmark()
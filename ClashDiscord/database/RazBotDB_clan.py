@@ -33,14 +33,12 @@ def insert_clan(guild_id, clan_tag):
     """
     # set up the query
     query = (
-        f"INSERT into clan (guild_id, clan_tag) "
-        f"VALUES ("
-        f"(SELECT id FROM guild WHERE guild_id={guild_id}), '{clan_tag}'"
-        f");"
+        "INSERT into clan (guild_id, clan_tag) "
+        "SELECT id, %s FROM guild WHERE guild_id = %s;"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (clan_tag, guild_id))
     # select and return clan
     data = select_clan(guild_id, clan_tag)
     return data
@@ -61,15 +59,15 @@ def select_clan(guild_id, clan_tag):
     """
     # find the clan based on clan_tag and guild_id
     query = (
-        f"SELECT guild.guild_id, clan.clan_tag "
-        f"FROM clan "
-        f"INNER JOIN guild ON clan.guild_id = guild.id "
-        f"WHERE clan.clan_tag = '{clan_tag}' "
-        f"AND guild.guild_id = {guild_id};"
+        "SELECT guild.guild_id, clan.clan_tag "
+        "FROM clan "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan.clan_tag = %s "
+        "AND guild.guild_id = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (clan_tag, guild_id))
     return data
 
 
@@ -89,10 +87,27 @@ def select_clan_all_from_guild(guild_id):
     """
     # find the clan based on clan_tag and guild_id
     query = (
-        f"SELECT guild.guild_id, clan.clan_tag "
-        f"FROM clan "
-        f"INNER JOIN guild ON clan.guild_id = guild.id "
-        f"WHERE guild.guild_id = {guild_id};"
+        "SELECT guild.guild_id, clan.clan_tag "
+        "FROM clan "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE guild.guild_id = %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (guild_id,))
+    return data
+
+
+def select_clan_tag_all():
+    """
+        returns the distinct clan tags claimed in any guild
+
+        Returns:
+            clan_tag: clan's tag
+    """
+    # a clan claimed by several guilds is listed once
+    query = (
+        "SELECT DISTINCT clan_tag FROM clan;"
     )
 
     # execute and return query
@@ -100,6 +115,32 @@ def select_clan_all_from_guild(guild_id):
     return data
 
 
+def select_clan_all_from_tag(clan_tag):
+    """
+        Takes in clan_tag and
+        returns discord guild id and clan tag
+        for every guild the clan is claimed in
+
+        Args:
+            clan_tag (str): clan's tag
+
+        Returns:
+            guild id: discord guild id
+            clan_tag: clan's tag
+    """
+    # find the guilds based on clan_tag
+    query = (
+        "SELECT guild.guild_id, clan.clan_tag "
+        "FROM clan "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan.clan_tag = %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (clan_tag,))
+    return data
+
+
 # ! good query formatting
 def select_clan_from_clan_role(discord_role_id, guild_id):
     """
@@ -115,17 +156,15 @@ def select_clan_from_clan_role(discord_role_id, guild_id):
     """
     # find the clan based on clan_tag and guild_id
     query = (
-        f"SELECT clan_tag FROM clan "
-        f"WHERE id = ("
-        f"SELECT clan_id FROM clan_role WHERE discord_role_id = {discord_role_id}"
-        f") AND "
-        f"guild_id = ("
-        f"SELECT id from guild WHERE guild_id={guild_id}"
-        f");"
+        "SELECT clan.clan_tag FROM clan_role "
+        "INNER JOIN clan ON clan_role.clan_id = clan.id "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan_role.discord_role_id = %s "
+        "AND guild.guild_id = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_role_id, guild_id))
     return data
 
 
@@ -143,13 +182,14 @@ def delete_clan(guild_id, clan_tag):
     """
     # set up the query
     query = (
-        f"DELETE FROM clan "
-        f"WHERE clan_tag = '{clan_tag}' AND "
-        f"guild_id = (SELECT id FROM guild WHERE guild_id={guild_id});"
+        "DELETE clan FROM clan "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan.clan_tag = %s "
+        "AND guild.guild_id = %s;"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (clan_tag, guild_id))
     # confirm deletion from null response
     data = select_clan(guild_id, clan_tag)
     return data
@@ -164,7 +204,7 @@ def select_clan_count():
     """
     # set up the query
     query = (
-        f"SELECT COUNT(id) as clan_count FROM clan;"
+        "SELECT COUNT(id) as clan_count FROM clan;"
     )
 
     # execute and return query
@@ -177,7 +217,7 @@ def select_clan_count():
 def create_clan_table():
     # set up the query
     query = (
-        "CREATE TABLE clan( "
+        "CREATE TABLE IF NOT EXISTS clan( "
         "id int not null auto_increment, "
         "guild_id int not null, "
         "clan_tag varchar(28) not null, "
@@ -193,6 +233,18 @@ def create_clan_table():
     preset.create(query)
 
 
+def create_clan_guild_tag_index():
+    # set up the query
+    # covers clan lookups by guild and clan tag
+    query = (
+        "CREATE INDEX clan_guild_tag_index "
+        "ON clan (guild_id, clan_tag);"
+    )
+
+    # execute create query
+    preset.create_index("clan", "clan_guild_tag_index", query)
+
+
 # todo docstring
 # todo some sort of confirmation
 def drop_clan_table():
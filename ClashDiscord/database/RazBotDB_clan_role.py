@@ -37,15 +37,15 @@ def insert_clan_role(discord_role_id, guild_id, clan_tag):
     """
     # set up the query
     query = (
-        f"INSERT into clan_role (discord_role_id, clan_id) "
-        f"VALUES ({discord_role_id}, "
-        f"(SELECT id FROM clan WHERE clan_tag = '{clan_tag}' AND "
-        f"guild_id = (SELECT id from guild WHERE guild_id={guild_id})"
-        f"));"
+        "INSERT into clan_role (discord_role_id, clan_id) "
+        "SELECT %s, clan.id FROM clan "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan.clan_tag = %s "
+        "AND guild.guild_id = %s;"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (discord_role_id, clan_tag, guild_id))
     # select and return clan_role
     data = select_clan_role(discord_role_id)
     return data
@@ -67,17 +67,17 @@ def select_clan_role(discord_role_id):
     """
     # find the clan_role based on discord_role_id
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"clan_role.discord_role_id as discord_role_id, "
-        f"clan.clan_tag as clan_tag "
-        f"FROM clan_role "
-        f"INNER JOIN clan ON clan_role.clan_id = clan.id "
-        f"INNER JOIN guild ON clan.guild_id = guild.id "
-        f"WHERE clan_role.discord_role_id = {discord_role_id};"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "clan_role.discord_role_id as discord_role_id, "
+        "clan.clan_tag as clan_tag "
+        "FROM clan_role "
+        "INNER JOIN clan ON clan_role.clan_id = clan.id "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE clan_role.discord_role_id = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_role_id,))
     return data
 
 
@@ -100,12 +100,8 @@ def select_clan_role_from_list(discord_role_id_list):
     if len(discord_role_id_list) == 0:
         return []
 
-    where_string = ""
-    for role_id in discord_role_id_list:
-        where_string += f"clan_role.discord_role_id = {role_id} OR "
-
-    # cuts the last four characters from the string ' OR '
-    where_string = where_string[:-4]
+    # one placeholder for each discord_role_id
+    placeholder_string = ", ".join(["%s"] * len(discord_role_id_list))
 
     # find the clan_role based on discord_role_id
     query = (
@@ -115,11 +111,11 @@ def select_clan_role_from_list(discord_role_id_list):
         f"FROM clan_role "
         f"INNER JOIN clan ON clan_role.clan_id = clan.id "
         f"INNER JOIN guild ON clan.guild_id = guild.id "
-        f"WHERE {where_string};"
+        f"WHERE clan_role.discord_role_id IN ({placeholder_string});"
     )
 
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, tuple(discord_role_id_list))
     return data
 
 
@@ -141,17 +137,17 @@ def select_clan_role_from_guild(discord_guild_id):
 
     # find the clan_role based on discord_guild_id
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"clan_role.discord_role_id as discord_role_id, "
-        f"clan.clan_tag as clan_tag "
-        f"FROM clan_role "
-        f"INNER JOIN clan ON clan_role.clan_id = clan.id "
-        f"INNER JOIN guild ON clan.guild_id = guild.id "
-        f"WHERE guild.guild_id = {discord_guild_id};"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "clan_role.discord_role_id as discord_role_id, "
+        "clan.clan_tag as clan_tag "
+        "FROM clan_role "
+        "INNER JOIN clan ON clan_role.clan_id = clan.id "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE guild.guild_id = %s;"
     )
 
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, (discord_guild_id,))
     return data
 
 
@@ -170,18 +166,18 @@ def select_clan_role_from_tag(discord_guild_id, clan_tag):
     """
     # find the clan_role based on discord_role_id
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"clan_role.discord_role_id as discord_role_id, "
-        f"clan.clan_tag as clan_tag "
-        f"FROM clan_role "
-        f"INNER JOIN clan ON clan_role.clan_id = clan.id "
-        f"INNER JOIN guild ON clan.guild_id = guild.id "
-        f"WHERE guild.guild_id = {discord_guild_id} "
-        f"AND clan.clan_tag = '{clan_tag}';"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "clan_role.discord_role_id as discord_role_id, "
+        "clan.clan_tag as clan_tag "
+        "FROM clan_role "
+        "INNER JOIN clan ON clan_role.clan_id = clan.id "
+        "INNER JOIN guild ON clan.guild_id = guild.id "
+        "WHERE guild.guild_id = %s "
+        "AND clan.clan_tag = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_guild_id, clan_tag))
     return data
 
 
@@ -199,12 +195,12 @@ def delete_clan_role(discord_role_id):
     """
     # delete the clan_role based on discord_role_id
     query = (
-        f"DELETE FROM clan_role "
-        f"WHERE discord_role_id = {discord_role_id};"
+        "DELETE FROM clan_role "
+        "WHERE discord_role_id = %s;"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (discord_role_id,))
     # confirm deletion from null response
     data = select_clan_role(discord_role_id)
     return data
@@ -216,7 +212,7 @@ def delete_clan_role(discord_role_id):
 def create_clan_role_table():
     # set up the query
     query = (
-        f"CREATE TABLE clan_role( "
+        f"CREATE TABLE IF NOT EXISTS clan_role( "
         f"id int not null auto_increment, "
         f"discord_role_id bigint unique not null, "
         f"clan_id int not null, "
@@ -6,22 +6,17 @@ import database.RazBotDB_clan as clan
 import database.RazBotDB_clan_role as clan_role
 import database.RazBotDB_rank_role_model as rank_role_model
 import database.RazBotDB_rank_role as rank_role
+import database.RazBotDB_war as war
+import database.RazBotDB_war_member as war_member
+import database.RazBotDB_war_attack as war_attack
+import database.RazBotDB_war_season_member as war_season_member
+import database.RazBotDB_schema_migration as schema_migration
 
 
-# DB RESET
+# DB MIGRATION
 
-# todo make this 1 or 3 queries
-def db_reset():
-    # drop tables
-    rank_role.drop_rank_role_table()
-    rank_role_model.drop_rank_role_model_table()
-    clan_role.drop_clan_role_table()
-    clan.drop_clan_table()
-    player.drop_player_table()
-    guild.drop_guild_table()
-    user.drop_user_table()
-
-    # create tables
+def migration_initial_schema():
+    # create tables, existing tables are left untouched
     user.create_user_table()
     player.create_player_table()
     guild.create_guild_table()
@@ -30,11 +25,82 @@ def db_reset():
     rank_role_model.create_rank_role_model_table()
     rank_role.create_rank_role_table()
 
-    # set Raz values
-    user.insert_raz_super_user(250312821647081472)
-    player.insert_raz_player(250312821647081472, '#RGQ8RGU9')
-    guild.insert_guild_dev(798603935022710844, 1)
-    rank_role_model.insert_rank_role_model_setup()
+    # set rank role models if they have not been set
+    if len(rank_role_model.select_rank_role_model_all()) == 0:
+        rank_role_model.insert_rank_role_model_setup()
+
+    # set Raz values if this is a new db
+    user_count, = user.select_user_count()
+    if user_count == 0:
+        user.insert_raz_super_user(250312821647081472)
+        player.insert_raz_player(250312821647081472, '#RGQ8RGU9')
+        guild.insert_guild_dev(798603935022710844, 1)
+
+
+def migration_lookup_indexes():
+    # composite indexes for the RazBotDB_Responder lookups
+    player.create_player_user_active_index()
+    clan.create_clan_guild_tag_index()
+    rank_role.create_rank_role_guild_model_index()
+    rank_role_model.create_rank_role_model_clash_name_index()
+    rank_role_model.create_rank_role_model_name_index()
+
+
+def migration_war_history():
+    # ended wars with their members and attacks
+    war.create_war_table()
+    war_member.create_war_member_table()
+    war_attack.create_war_attack_table()
+
+
+def migration_war_season_totals():
+    # season totals for the war and cwl leaderboards
+    war_season_member.create_war_season_member_table()
+    war.create_war_season_aggregated_column()
+
+    # add wars stored before the season totals existed
+    for war_id, in war.select_war_id_not_aggregated():
+        war_season_member.update_war_season_member_from_war(war_id)
+
+
+# versioned migrations, append new migrations to the end
+# applied migrations must never be edited or reordered
+# (version, name, migration function)
+migration_list = [
+    (1, "initial schema", migration_initial_schema),
+    (2, "lookup indexes", migration_lookup_indexes),
+    (3, "war history", migration_war_history),
+    (4, "war season totals", migration_war_season_totals)
+]
+
+
+def db_migrate():
+    """
+        applies every migration that has not been applied yet
+        in version order and returns the applied migrations
+
+        Returns:
+            list: list of SchemaMigration objects applied in this run
+    """
+    schema_migration.create_schema_migration_table()
+
+    applied_version_list = []
+    for version, name in schema_migration.select_schema_migration_all():
+        applied_version_list.append(version)
+
+    migrated_list = []
+    for version, name, migration_function in migration_list:
+        # migration has already been applied
+        if version in applied_version_list:
+            continue
+
+        migration_function()
+        schema_migration.insert_schema_migration(version, name)
+
+        migrated_list.append(
+            schema_migration.SchemaMigration(version, name))
+
+    return migrated_list
 
 
 # RazBotDB
@@ -50,12 +116,12 @@ def select_table(table_name):
     """
     # set up the query
     query = (
-        f"SELECT * FROM information_schema.tables "
-        f"WHERE table_name = '{table_name}'"
+        "SELECT * FROM information_schema.tables "
+        "WHERE table_name = %s"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (table_name,))
     return data
 
 
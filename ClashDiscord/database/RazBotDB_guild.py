@@ -42,13 +42,12 @@ def insert_guild(guild_id, admin_user_id):
     """
     # set up the query
     query = (
-        f"INSERT into guild (guild_id, admin_user_id) "
-        f"VALUES ({guild_id}, ("
-        f"SELECT ID FROM user WHERE discord_id={admin_user_id}));"
+        "INSERT into guild (guild_id, admin_user_id) "
+        "SELECT %s, id FROM user WHERE discord_id = %s;"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (guild_id, admin_user_id))
     # select and return guild
     data = select_guild(guild_id)
     return data
@@ -58,12 +57,12 @@ def insert_guild(guild_id, admin_user_id):
 def insert_guild_dev(guild_id, admin_user_id):
     # set up the query
     query = (
-        f"INSERT into guild (guild_id, admin_user_id, dev) "
-        f"VALUES ({guild_id}, {admin_user_id}, TRUE);"
+        "INSERT into guild (guild_id, admin_user_id, dev) "
+        "VALUES (%s, %s, TRUE);"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (guild_id, admin_user_id))
     # select and return guild
     data = select_guild(guild_id)
     return data
@@ -87,15 +86,15 @@ def select_guild(guild_id):
     """
     # find the guild based on guild_id
     query = (
-        f"SELECT guild.guild_id, user.discord_id as admin_user_id, "
-        f"guild.bot_channel, active, dev "
-        f"FROM guild "
-        f"INNER JOIN user ON guild.admin_user_id = user.id "
-        f"WHERE guild.guild_id = {guild_id};"
+        "SELECT guild.guild_id, user.discord_id as admin_user_id, "
+        "guild.bot_channel, active, dev "
+        "FROM guild "
+        "INNER JOIN user ON guild.admin_user_id = user.id "
+        "WHERE guild.guild_id = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (guild_id,))
     return data
 
 
@@ -112,12 +111,12 @@ def delete_guild(guild_id):
     """
     # set up the query
     query = (
-        f"DELETE FROM guild "
-        f"WHERE guild_id = {guild_id};"
+        "DELETE FROM guild "
+        "WHERE guild_id = %s;"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (guild_id,))
     # confirm deletion from null response
     data = select_guild(guild_id)
     return data
@@ -132,7 +131,7 @@ def select_guild_count():
     """
     # set up the query
     query = (
-        f"SELECT COUNT(id) as guild_count FROM guild;"
+        "SELECT COUNT(id) as guild_count FROM guild;"
     )
 
     # execute and return query
@@ -145,7 +144,7 @@ def select_guild_count():
 def create_guild_table():
     # set up the query
     query = (
-        "CREATE TABLE guild( "
+        "CREATE TABLE IF NOT EXISTS guild( "
         "id int not null auto_increment, "
         "guild_id bigint unique not null, "
         "bot_channel int unique, "
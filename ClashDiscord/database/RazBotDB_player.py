@@ -20,19 +20,18 @@ class Player(object):
 # player
 
 
-# todo working with sub-queries
 def select_player_raz():
     # find player based on user_id
     discord_id = 250312821647081472
     query = (
-        f"SELECT player_tag, active FROM player "
-        f"WHERE user_id = "
-        f"(SELECT id FROM user WHERE discord_id={discord_id}) "
-        f"AND active=true"
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.active = true"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_id,))
     return data
 
 
@@ -50,14 +49,14 @@ def select_player_from_user_tag(discord_id, player_tag):
     """
     # find the player based on user_id
     query = (
-        f"SELECT player_tag, active FROM player "
-        f"WHERE user_id = "
-        f"(SELECT ID FROM user WHERE discord_id={discord_id}) "
-        f"AND player_tag = '{player_tag}'"
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.player_tag = %s"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_id, player_tag))
     return data
 
 
@@ -75,12 +74,12 @@ def select_player_from_tag(player_tag):
     """
     # find the player based on user_id
     query = (
-        f"SELECT player_tag, active FROM player "
-        f"WHERE player_tag = '{player_tag}'"
+        "SELECT player_tag, active FROM player "
+        "WHERE player_tag = %s"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (player_tag,))
     return data
 
 
@@ -98,14 +97,14 @@ def select_player_active(discord_id):
     """
     # find the player based on user_id
     query = (
-        f"SELECT player_tag, active FROM player "
-        f"WHERE user_id = "
-        f"(SELECT ID FROM user WHERE discord_id={discord_id}) "
-        f"AND active=true"
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.active = true"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_id,))
     return data
 
 
@@ -123,14 +122,14 @@ def select_player_alt(discord_id):
     """
     # find the player based on user_id
     query = (
-        f"SELECT player_tag, active FROM player "
-        f"WHERE user_id = "
-        f"(SELECT id FROM user WHERE discord_id={discord_id}) "
-        f"AND active = false"
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.active = false"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_id,))
     return data
 
 
@@ -148,31 +147,121 @@ def select_player_all(discord_id):
     """
     # find the player based on user_id
     query = (
-        f"SELECT player_tag, active FROM player "
-        f"WHERE user_id = "
-        f"(SELECT id FROM user WHERE discord_id={discord_id}) "
+        "SELECT player.player_tag, player.active FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
     )
 
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, (discord_id,))
+    return data
+
+
+def select_player_all_from_user_list(discord_id_list):
+    """
+        Takes in list of discord_id and
+        returns player db discord_id, player_tag and active
+        for every player claimed by those users
+
+        Args:
+            list
+                discord_id (int): id received from discord
+
+        Returns:
+            list
+                discord_id: user's discord id
+                player_tag: player's tag
+                active: bool of active or not
+    """
+
+    if len(discord_id_list) == 0:
+        return []
+
+    # one placeholder for each discord_id
+    placeholder_string = ", ".join(["%s"] * len(discord_id_list))
+
+    # find the players based on user discord_id
+    query = (
+        f"SELECT user.discord_id, player.player_tag, player.active "
+        f"FROM player "
+        f"INNER JOIN user ON player.user_id = user.id "
+        f"WHERE user.discord_id IN ({placeholder_string});"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, tuple(discord_id_list))
     return data
 
 
 def insert_raz_player(discord_user_id, player_tag):
     # set up the query
     query = (
-        f"INSERT into player (user_id, player_tag) "
-        f"VALUES ((SELECT ID FROM user WHERE discord_id={discord_user_id}), "
-        f"'{player_tag}');"
+        "INSERT into player (user_id, player_tag) "
+        "SELECT id, %s FROM user WHERE discord_id = %s;"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (player_tag, discord_user_id))
     # select and return player
     data = select_player_raz()
     return data
 
 
+def insert_player_list(player_list):
+    """
+        Takes in list of discord_id, player_tag and active
+        and inserts the players in bulk,
+        players already claimed are skipped
+
+        Args:
+            list
+                discord_id (int): id received from discord
+                player_tag (str): player's tag
+                active (bool): TF of if player is user's active
+
+        Returns:
+            int: count of inserted players
+    """
+
+    if len(player_list) == 0:
+        return 0
+
+    discord_id_list = list(dict.fromkeys(
+        discord_id for discord_id, player_tag, active in player_list))
+
+    # one placeholder for each discord_id
+    placeholder_string = ", ".join(["%s"] * len(discord_id_list))
+
+    # find the user ids for every discord_id
+    query = (
+        f"SELECT discord_id, id FROM user "
+        f"WHERE discord_id IN ({placeholder_string});"
+    )
+
+    user_id_dict = dict(preset.select_list(query, tuple(discord_id_list)))
+
+    params_list = []
+    for discord_id, player_tag, active in player_list:
+        # user not found
+        if discord_id not in user_id_dict:
+            continue
+
+        params_list.append((user_id_dict[discord_id], player_tag, active))
+
+    if len(params_list) == 0:
+        return 0
+
+    # set up the query
+    query = (
+        "INSERT IGNORE into player (user_id, player_tag, active) "
+        "VALUES (%s, %s, %s);"
+    )
+
+    # execute insert query and return inserted count
+    data = preset.insert_list(query, params_list)
+    return data
+
+
 # todo update docstring
 def insert_player_active(discord_id, player_tag):
     """
@@ -188,13 +277,12 @@ def insert_player_active(discord_id, player_tag):
     """
     # set up the query
     query = (
-        f"INSERT into player (user_id, player_tag) "
-        f"VALUES ((SELECT ID FROM user WHERE discord_id={discord_id}), "
-        f"'{player_tag}');"
+        "INSERT into player (user_id, player_tag) "
+        "SELECT id, %s FROM user WHERE discord_id = %s;"
     )
 
     # execute update query
-    preset.update(query)
+    preset.update(query, (player_tag, discord_id))
     # select and return player
     data = select_player_active(discord_id)
     return data
@@ -215,13 +303,12 @@ def insert_player_alt(discord_id, player_tag):
     """
     # set up the query
     query = (
-        f"INSERT into player (user_id, player_tag, active) "
-        f"VALUES ((SELECT ID FROM user WHERE discord_id={discord_id}), "
-        f"'{player_tag}', FALSE);"
+        "INSERT into player (user_id, player_tag, active) "
+        "SELECT id, %s, FALSE FROM user WHERE discord_id = %s;"
     )
 
     # execute update query
-    preset.update(query)
+    preset.update(query, (player_tag, discord_id))
     # select and return player
     data = select_player_alt(discord_id)
     return data
@@ -243,27 +330,27 @@ def update_player_active(discord_id, player_tag):
     # set up the query
     # change the user's active player to false
     query = (
-        f"UPDATE player "
-        f"SET active=false "
-        f"WHERE user_id = "
-        f"(SELECT id FROM user WHERE discord_id={discord_id}) "
-        f"AND active=true;"
+        "UPDATE player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "SET player.active = false "
+        "WHERE user.discord_id = %s "
+        "AND player.active = true;"
     )
 
     # execute update query
-    preset.update(query)
+    preset.update(query, (discord_id,))
 
     # change requested user's player to active
     query = (
-        f"UPDATE player "
-        f"SET active=true "
-        f"WHERE user_id = "
-        f"(SELECT id FROM user WHERE discord_id={discord_id}) "
-        f"AND player_tag='{player_tag}';"
+        "UPDATE player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "SET player.active = true "
+        "WHERE user.discord_id = %s "
+        "AND player.player_tag = %s;"
     )
 
     # execute update query
-    preset.update(query)
+    preset.update(query, (discord_id, player_tag))
     # select and return player
     data = select_player_active(discord_id)
     return data
@@ -285,14 +372,14 @@ def delete_player(discord_id, player_tag):
     # set up the query
     # delete the requested
     query = (
-        f"DELETE FROM player "
-        f"WHERE user_id = "
-        f"(SELECT id FROM user WHERE discord_id={discord_id}) "
-        f"AND player_tag = '{player_tag}';"
+        "DELETE player FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE user.discord_id = %s "
+        "AND player.player_tag = %s;"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (discord_id, player_tag))
 
     # select and return player
     data = select_player_from_user_tag(discord_id, player_tag)
@@ -316,12 +403,12 @@ def delete_player_from_tag(player_tag):
     # set up the query
     # delete the requested
     query = (
-        f"DELETE FROM player "
-        f"WHERE player_tag = '{player_tag}';"
+        "DELETE FROM player "
+        "WHERE player_tag = %s;"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (player_tag,))
 
     # select and return player
     data = select_player_from_tag(player_tag)
@@ -340,7 +427,7 @@ def select_player_count():
     """
     # set up the query
     query = (
-        f"SELECT COUNT(id) as player_count FROM player;"
+        "SELECT COUNT(id) as player_count FROM player;"
     )
 
     # execute and return query
@@ -352,7 +439,7 @@ def select_player_count():
 def create_player_table():
     # set up the query
     query = (
-        "CREATE TABLE player (  "
+        "CREATE TABLE IF NOT EXISTS player (  "
         "id int not null auto_increment, "
         "user_id int not null, "
         "player_tag varchar(28) unique not null, "
@@ -369,6 +456,18 @@ def create_player_table():
     preset.create(query)
 
 
+def create_player_user_active_index():
+    # set up the query
+    # covers player lookups by user and active status
+    query = (
+        "CREATE INDEX player_user_active_index "
+        "ON player (user_id, active);"
+    )
+
+    # execute create query
+    preset.create_index("player", "player_user_active_index", query)
+
+
 # todo some sort of confirmation
 def drop_player_table():
     # set up the query
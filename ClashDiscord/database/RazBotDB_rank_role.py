@@ -26,18 +26,16 @@ class RankRole(object):
 def insert_rank_role(discord_role_id, discord_guild_id, model_name):
     # set up the query
     query = (
-        f"INSERT into "
-        f"rank_role (discord_role_id, guild_id, model_id) "
-        f"VALUES "
-        f"("
-        f"{discord_role_id}, "
-        f"(SELECT id FROM guild WHERE guild_id={discord_guild_id}), "
-        f"(SELECT id FROM rank_role_model WHERE name = '{model_name}')"
-        f");"
+        "INSERT into "
+        "rank_role (discord_role_id, guild_id, model_id) "
+        "SELECT %s, guild.id, rank_role_model.id "
+        "FROM guild "
+        "INNER JOIN rank_role_model ON rank_role_model.name = %s "
+        "WHERE guild.guild_id = %s;"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (discord_role_id, model_name, discord_guild_id))
     # select and return inserted rank_role_id
     data = select_rank_role(discord_role_id)
     return data
@@ -60,18 +58,18 @@ def select_rank_role(discord_role_id):
     """
     # find the rank_role_model based on discord role id
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"rank_role.discord_role_id as discord_role_id, "
-        f"rank_role_model.name as rank_model_name, "
-        f"rank_role_model.clash_name as clash_name "
-        f"FROM rank_role "
-        f"INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
-        f"INNER JOIN guild ON rank_role.guild_id = guild.id "
-        f"WHERE rank_role.discord_role_id = {discord_role_id};"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "rank_role.discord_role_id as discord_role_id, "
+        "rank_role_model.name as rank_model_name, "
+        "rank_role_model.clash_name as clash_name "
+        "FROM rank_role "
+        "INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
+        "INNER JOIN guild ON rank_role.guild_id = guild.id "
+        "WHERE rank_role.discord_role_id = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_role_id,))
     return data
 
 
@@ -94,18 +92,18 @@ def select_guild_rank_role(discord_guild_id):
 
     # find the rank_role_model based on discord guild id
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"rank_role.discord_role_id as discord_role_id, "
-        f"rank_role_model.name as rank_model_name, "
-        f"rank_role_model.clash_name as clash_name "
-        f"FROM rank_role "
-        f"INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
-        f"INNER JOIN guild ON rank_role.guild_id = guild.id "
-        f"WHERE guild.guild_id = {discord_guild_id};"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "rank_role.discord_role_id as discord_role_id, "
+        "rank_role_model.name as rank_model_name, "
+        "rank_role_model.clash_name as clash_name "
+        "FROM rank_role "
+        "INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
+        "INNER JOIN guild ON rank_role.guild_id = guild.id "
+        "WHERE guild.guild_id = %s;"
     )
 
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, (discord_guild_id,))
     return data
 
 
@@ -129,12 +127,8 @@ def select_rank_role_from_list(discord_role_id_list):
     if len(discord_role_id_list) == 0:
         return []
 
-    where_string = ""
-    for role_id in discord_role_id_list:
-        where_string += f"rank_role.discord_role_id = {role_id} OR "
-
-    # cuts the last four characters from the string ' OR '
-    where_string = where_string[:-4]
+    # one placeholder for each discord_role_id
+    placeholder_string = ", ".join(["%s"] * len(discord_role_id_list))
 
     # find the rank_role_model based on discord role id
     query = (
@@ -145,11 +139,11 @@ def select_rank_role_from_list(discord_role_id_list):
         f"FROM rank_role "
         f"INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
         f"INNER JOIN guild ON rank_role.guild_id = guild.id "
-        f"WHERE {where_string};"
+        f"WHERE rank_role.discord_role_id IN ({placeholder_string});"
     )
 
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, tuple(discord_role_id_list))
     return data
 
 
@@ -169,18 +163,18 @@ def select_rank_role_all_from_guild(discord_guild_id):
     """
     # find the rank_role_model based on discord guild id
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"rank_role.discord_role_id as discord_role_id, "
-        f"rank_role_model.name as rank_model_name, "
-        f"rank_role_model.clash_name as clash_name "
-        f"FROM rank_role "
-        f"INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
-        f"INNER JOIN guild ON rank_role.guild_id = guild.id "
-        f"WHERE guild.guild_id = {discord_guild_id};"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "rank_role.discord_role_id as discord_role_id, "
+        "rank_role_model.name as rank_model_name, "
+        "rank_role_model.clash_name as clash_name "
+        "FROM rank_role "
+        "INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
+        "INNER JOIN guild ON rank_role.guild_id = guild.id "
+        "WHERE guild.guild_id = %s;"
     )
 
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, (discord_guild_id,))
     return data
 
 
@@ -201,19 +195,19 @@ def select_rank_role_name_from_guild_and_clash(discord_guild_id, clash_name):
     """
     # find the rank_role based on discord guild id and clash name
     query = (
-        f"SELECT guild.guild_id as discord_guild_id, "
-        f"rank_role.discord_role_id as discord_role_id, "
-        f"rank_role_model.name as rank_model_name, "
-        f"rank_role_model.clash_name as clash_name "
-        f"FROM rank_role "
-        f"INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
-        f"INNER JOIN guild ON rank_role.guild_id = guild.id "
-        f"WHERE guild.guild_id = {discord_guild_id} "
-        f"AND rank_role_model.clash_name = '{clash_name}';"
+        "SELECT guild.guild_id as discord_guild_id, "
+        "rank_role.discord_role_id as discord_role_id, "
+        "rank_role_model.name as rank_model_name, "
+        "rank_role_model.clash_name as clash_name "
+        "FROM rank_role "
+        "INNER JOIN rank_role_model ON rank_role.model_id = rank_role_model.id "
+        "INNER JOIN guild ON rank_role.guild_id = guild.id "
+        "WHERE guild.guild_id = %s "
+        "AND rank_role_model.clash_name = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_guild_id, clash_name))
     return data
 
 
@@ -231,12 +225,12 @@ def delete_rank_role(discord_role_id):
     """
     # delete the rank_role based on discord_role_id
     query = (
-        f"DELETE FROM rank_role "
-        f"WHERE discord_role_id = {discord_role_id};"
+        "DELETE FROM rank_role "
+        "WHERE discord_role_id = %s;"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (discord_role_id,))
     # confirm deletion from null response
     data = select_rank_role(discord_role_id)
     return data
@@ -246,7 +240,7 @@ def delete_rank_role(discord_role_id):
 def create_rank_role_table():
     # set up the query
     query = (
-        f"CREATE TABLE rank_role("
+        f"CREATE TABLE IF NOT EXISTS rank_role("
         f"id int not null auto_increment, "
         f"discord_role_id bigint unique not null, "
         f"guild_id int not null, "
@@ -267,6 +261,18 @@ def create_rank_role_table():
     preset.create(query)
 
 
+def create_rank_role_guild_model_index():
+    # set up the query
+    # covers rank role lookups by guild joined to rank role model
+    query = (
+        "CREATE INDEX rank_role_guild_model_index "
+        "ON rank_role (guild_id, model_id);"
+    )
+
+    # execute create query
+    preset.create_index("rank_role", "rank_role_guild_model_index", query)
+
+
 # DROP
 # todo docstring
 # todo some sort of confirmation
@@ -55,12 +55,12 @@ def select_rank_role_model(id):
     """
     # find the rank_role_model based on id
     query = (
-        f"SELECT name, clash_name FROM rank_role_model "
-        f"WHERE id = {id};"
+        "SELECT name, clash_name FROM rank_role_model "
+        "WHERE id = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (id,))
     return data
 
 
@@ -78,12 +78,12 @@ def select_rank_role_model_name(name):
     """
     # find the rank_role_model based on name
     query = (
-        f"SELECT name, clash_name FROM rank_role_model "
-        f"WHERE name = '{name}';"
+        "SELECT name, clash_name FROM rank_role_model "
+        "WHERE name = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (name,))
     return data
 
 
@@ -109,7 +109,7 @@ def select_rank_role_model_all():
 def create_rank_role_model_table():
     # set up the query
     query = (
-        f"CREATE TABLE rank_role_model("
+        f"CREATE TABLE IF NOT EXISTS rank_role_model("
         f"id int not null auto_increment, "
         f"name varchar(28) not null, "
         f"clash_name varchar(28) not null, "
@@ -121,6 +121,32 @@ def create_rank_role_model_table():
     preset.create(query)
 
 
+def create_rank_role_model_clash_name_index():
+    # set up the query
+    # covers rank role lookups by clash role name
+    query = (
+        "CREATE INDEX rank_role_model_clash_name_index "
+        "ON rank_role_model (clash_name);"
+    )
+
+    # execute create query
+    preset.create_index(
+        "rank_role_model", "rank_role_model_clash_name_index", query)
+
+
+def create_rank_role_model_name_index():
+    # set up the query
+    # covers rank role model lookups by name
+    query = (
+        "CREATE INDEX rank_role_model_name_index "
+        "ON rank_role_model (name);"
+    )
+
+    # execute create query
+    preset.create_index(
+        "rank_role_model", "rank_role_model_name_index", query)
+
+
 # DROP
 # todo docstring
 # todo some sort of confirmation
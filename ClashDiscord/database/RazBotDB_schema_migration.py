@@ -0,0 +1,112 @@
+import database.RazBotDB_Presets as preset
+
+
+# schema migration
+class SchemaMigration(object):
+    """
+        SchemaMigration: object for db schema migration table objects
+
+            Instance Attributes
+                version (int): migration version
+                name (str): migration name
+    """
+
+    def __init__(self, version, name):
+        self.version = version
+        self.name = name
+
+
+# INSERT
+def insert_schema_migration(version, name):
+    """
+        Takes in migration version and name,
+        records the migration as applied and returns it
+
+        Args:
+            version (int): migration version
+            name (str): migration name
+
+        Returns:
+            version: migration version
+            name: migration name
+    """
+    # set up the query
+    query = (
+        "INSERT into schema_migration (version, name) "
+        "VALUES (%s, %s);"
+    )
+
+    # execute insert query
+    preset.insert(query, (version, name))
+    # select and return schema_migration
+    data = select_schema_migration(version)
+    return data
+
+
+# SELECT
+def select_schema_migration(version):
+    """
+        Takes in migration version and
+        returns schema_migration db version and name
+
+        Args:
+            version (int): migration version
+
+        Returns:
+            version: migration version
+            name: migration name
+    """
+    # find the schema_migration based on version
+    query = (
+        "SELECT version, name FROM schema_migration "
+        "WHERE version = %s;"
+    )
+
+    # execute and return query
+    data = preset.select(query, (version,))
+    return data
+
+
+def select_schema_migration_all():
+    """
+        Returns schema_migration db version and name of all
+        applied migrations
+
+        Returns:
+            version: migration version
+            name: migration name
+    """
+    # select all applied migrations in version order
+    query = (
+        "SELECT version, name FROM schema_migration "
+        "ORDER BY version;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query)
+    return data
+
+
+# CREATE
+def create_schema_migration_table():
+    # set up the query
+    query = (
+        "CREATE TABLE IF NOT EXISTS schema_migration("
+        "version int not null, "
+        "name varchar(128) not null, "
+        "applied_at timestamp not null default current_timestamp, "
+        "primary key(version)"
+        ");"
+    )
+
+    # execute create query
+    preset.create(query)
+
+
+# DROP
+def drop_schema_migration_table():
+    # set up the query
+    query = ("DROP TABLE schema_migration")
+
+    # execute drop query
+    preset.drop(query)
@@ -27,12 +27,12 @@ class User(object):
 def insert_raz_super_user(discord_user_id):
     # set up query
     query = (
-        f"INSERT into user (discord_id, admin, super_user) "
-        f"VALUES ({discord_user_id}, TRUE, TRUE);"
+        "INSERT into user (discord_id, admin, super_user) "
+        "VALUES (%s, TRUE, TRUE);"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (discord_user_id,))
     # select and return user
     data = select_user_raz()
     return data
@@ -52,11 +52,11 @@ def insert_user(discord_id):
     """
     # set up query
     query = (
-        f"INSERT into user (discord_id) VALUES ({discord_id});"
+        "INSERT into user (discord_id) VALUES (%s);"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (discord_id,))
     # select and return user
     data = select_user(discord_id)
     return data
@@ -76,11 +76,11 @@ def insert_user_admin(discord_id):
     """
     # set up query
     query = (
-        f"INSERT into user (discord_id, admin) VALUES ({discord_id}, TRUE)"
+        "INSERT into user (discord_id, admin) VALUES (%s, TRUE)"
     )
 
     # execute insert query
-    preset.insert(query)
+    preset.insert(query, (discord_id,))
     # select and return user
     data = select_user(discord_id)
     return data
@@ -111,11 +111,11 @@ def select_user(discord_id):
     """
     # set up the query
     query = (
-        f"SELECT discord_id, admin, super_user FROM user WHERE discord_id={discord_id}"
+        "SELECT discord_id, admin, super_user FROM user WHERE discord_id = %s"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (discord_id,))
     return data
 
 
@@ -132,21 +132,20 @@ def select_user_list(discord_id_list):
             admin: 1 or 0 (T or F) if user is admin
             super_user: 1 or 0 (T or F) if user is super user
     """
+    if len(discord_id_list) == 0:
+        return []
+
+    # one placeholder for each discord_id
+    placeholder_string = ", ".join(["%s"] * len(discord_id_list))
+
     # set up the query
     query = (
         f"SELECT discord_id, admin, super_user FROM user "
-        f"WHERE "
+        f"WHERE discord_id IN ({placeholder_string});"
     )
 
-    for discord_id in discord_id_list:
-        query += f"discord_id = {discord_id} OR "
-
-    # cuts the last four characters from the string ' OR '
-    query = query[:-4]
-    query += ';'
-
     # execute and return query
-    data = preset.select_list(query)
+    data = preset.select_list(query, tuple(discord_id_list))
     return data
 
 
@@ -161,7 +160,7 @@ def select_user_all():
     """
     # set up the query
     query = (
-        f"SELECT discord_id, admin, super_user FROM user"
+        "SELECT discord_id, admin, super_user FROM user"
     )
 
     # execute and return query
@@ -180,8 +179,8 @@ def select_user_admin_all():
     """
     # set up the query
     query = (
-        f"SELECT discord_id, admin, super_user FROM user "
-        f"WHERE admin = true;"
+        "SELECT discord_id, admin, super_user FROM user "
+        "WHERE admin = true;"
     )
 
     # execute and return query
@@ -204,13 +203,49 @@ def select_user_from_tag(player_tag):
     """
     # set up the query
     query = (
-        f"SELECT discord_id, admin, super_user FROM user "
-        f"WHERE id = ("
-        f"SELECT user_id FROM player WHERE player_tag = '{player_tag}');"
+        "SELECT user.discord_id, user.admin, user.super_user FROM player "
+        "INNER JOIN user ON player.user_id = user.id "
+        "WHERE player.player_tag = %s;"
     )
 
     # execute and return query
-    data = preset.select(query)
+    data = preset.select(query, (player_tag,))
+    return data
+
+
+def select_user_from_tag_list(player_tag_list):
+    """
+        Takes in list of player tags and returns player_tag, discord_id,
+        admin, and super_user for every user linked to a requested player
+
+        Args:
+            list
+                player_tag (str): player's tag
+
+        Returns:
+            list
+                player_tag: player's tag
+                discord_id: user's discord id in db
+                admin: 1 or 0 (T or F) if user is admin
+                super_user: 1 or 0 (T or F) if user is super user
+    """
+
+    if len(player_tag_list) == 0:
+        return []
+
+    # one placeholder for each player_tag
+    placeholder_string = ", ".join(["%s"] * len(player_tag_list))
+
+    # set up the query
+    query = (
+        f"SELECT player.player_tag, "
+        f"user.discord_id, user.admin, user.super_user FROM player "
+        f"INNER JOIN user ON player.user_id = user.id "
+        f"WHERE player.player_tag IN ({placeholder_string});"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, tuple(player_tag_list))
     return data
 
 
@@ -235,13 +270,13 @@ def update_user_admin_toggle(discord_id):
 
         # set up the query toggling the admin status
         query = (
-            f"UPDATE user "
-            f"SET admin = {not bool(admin)} "
-            f"WHERE discord_id = {discord_id};"
+            "UPDATE user "
+            "SET admin = %s "
+            "WHERE discord_id = %s;"
         )
 
         # execute update query
-        preset.update(query)
+        preset.update(query, (not bool(admin), discord_id))
         # select and return user
         data = select_user(discord_id)
         return data
@@ -264,11 +299,11 @@ def delete_user(discord_id):
     """
     # set up the query
     query = (
-        f"DELETE FROM user WHERE discord_id={discord_id}"
+        "DELETE FROM user WHERE discord_id = %s"
     )
 
     # execute delete query
-    preset.delete(query)
+    preset.delete(query, (discord_id,))
     # search user to show it was deleted
     data = select_user(discord_id)
     return data
@@ -283,7 +318,7 @@ def select_user_count():
     """
     # set up the query
     query = (
-        f"SELECT COUNT(id) as user_count FROM user;"
+        "SELECT COUNT(id) as user_count FROM user;"
     )
 
     # execute and return query
@@ -295,7 +330,7 @@ def select_user_count():
 def create_user_table():
     # set up the query
     query = (
-        "CREATE TABLE user ( "
+        "CREATE TABLE IF NOT EXISTS user ( "
         "id int not null auto_increment, "
         "discord_id bigint unique not null, "
         "admin boolean not null default false, "
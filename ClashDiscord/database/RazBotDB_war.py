@@ -0,0 +1,266 @@
+import database.RazBotDB_Presets as preset
+
+
+class War(object):
+    """
+        War: object for db war table objects
+
+            Instance Attributes
+                clan_tag (str): clan's tag
+                end_time (datetime): war end time in utc
+                season (str): war season, "YYYY-MM" of end_time
+                war_tag (str): cwl war tag, None for regular wars
+                clan_name (str): clan's name
+                opponent_tag (str): opponent clan's tag
+                opponent_name (str): opponent clan's name
+                team_size (int): members per clan
+                attacks_per_member (int): attacks each member has
+                clan_stars (int): clan's stars
+                clan_destruction (float): clan's destruction percentage
+                opponent_stars (int): opponent's stars
+                opponent_destruction (float): opponent's destruction
+                status (str): war result for the clan, won lost or tie
+    """
+
+    def __init__(
+        self, clan_tag, end_time, season, war_tag,
+        clan_name, opponent_tag, opponent_name,
+        team_size, attacks_per_member,
+        clan_stars, clan_destruction,
+        opponent_stars, opponent_destruction, status
+    ):
+        self.clan_tag = clan_tag
+        self.end_time = end_time
+        self.season = season
+        self.war_tag = war_tag
+        self.clan_name = clan_name
+        self.opponent_tag = opponent_tag
+        self.opponent_name = opponent_name
+        self.team_size = team_size
+        self.attacks_per_member = attacks_per_member
+        self.clan_stars = clan_stars
+        self.clan_destruction = clan_destruction
+        self.opponent_stars = opponent_stars
+        self.opponent_destruction = opponent_destruction
+        self.status = status
+
+
+# columns in War attribute order
+war_column_string = (
+    "war.clan_tag, war.end_time, war.season, war.war_tag, "
+    "war.clan_name, war.opponent_tag, war.opponent_name, "
+    "war.team_size, war.attacks_per_member, "
+    "war.clan_stars, war.clan_destruction, "
+    "war.opponent_stars, war.opponent_destruction, war.status"
+)
+
+
+# INSERT
+def insert_war(
+    clan_tag, end_time, season, war_tag,
+    clan_name, opponent_tag, opponent_name,
+    team_size, attacks_per_member,
+    clan_stars, clan_destruction,
+    opponent_stars, opponent_destruction, status
+):
+    """
+        Takes in an ended war, inserts it or updates the war
+        with the same clan_tag and end_time and returns the war id
+
+        Args:
+            see War instance attributes
+
+        Returns:
+            id: db war id
+    """
+    # set up the query
+    # clan_tag and end_time are unique, storing a war again updates it
+    query = (
+        "INSERT into war ("
+        "clan_tag, end_time, season, war_tag, "
+        "clan_name, opponent_tag, opponent_name, "
+        "team_size, attacks_per_member, "
+        "clan_stars, clan_destruction, "
+        "opponent_stars, opponent_destruction, status"
+        ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE "
+        "season = VALUES(season), "
+        "war_tag = VALUES(war_tag), "
+        "clan_name = VALUES(clan_name), "
+        "opponent_tag = VALUES(opponent_tag), "
+        "opponent_name = VALUES(opponent_name), "
+        "team_size = VALUES(team_size), "
+        "attacks_per_member = VALUES(attacks_per_member), "
+        "clan_stars = VALUES(clan_stars), "
+        "clan_destruction = VALUES(clan_destruction), "
+        "opponent_stars = VALUES(opponent_stars), "
+        "opponent_destruction = VALUES(opponent_destruction), "
+        "status = VALUES(status);"
+    )
+
+    # execute insert query
+    preset.insert(query, (
+        clan_tag, end_time, season, war_tag,
+        clan_name, opponent_tag, opponent_name,
+        team_size, attacks_per_member,
+        clan_stars, clan_destruction,
+        opponent_stars, opponent_destruction, status
+    ))
+    # select and return war id
+    data = select_war_id(clan_tag, end_time)
+    return data
+
+
+# SELECT
+def select_war_id(clan_tag, end_time):
+    """
+        Takes in clan_tag and end_time and returns the db war id
+
+        Args:
+            clan_tag (str): clan's tag
+            end_time (datetime): war end time in utc
+
+        Returns:
+            id: db war id
+    """
+    # find the war based on clan_tag and end_time
+    query = (
+        "SELECT id FROM war "
+        "WHERE clan_tag = %s "
+        "AND end_time = %s;"
+    )
+
+    # execute and return query
+    data = preset.select(query, (clan_tag, end_time))
+    return data
+
+
+def select_war_from_clan(clan_tag, war_count):
+    """
+        Takes in clan_tag and returns the clan's latest wars,
+        newest first
+
+        Args:
+            clan_tag (str): clan's tag
+            war_count (int): most wars returned
+
+        Returns:
+            list: war columns in War attribute order
+    """
+    # uses the clan_tag, end_time unique key
+    query = (
+        f"SELECT {war_column_string} FROM war "
+        f"WHERE war.clan_tag = %s "
+        f"ORDER BY war.end_time DESC "
+        f"LIMIT %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (clan_tag, war_count))
+    return data
+
+
+def select_war_stats_from_clan(clan_tag, season=None):
+    """
+        Takes in clan_tag and returns the clan's war totals
+        for season, or lifetime if season is None
+
+        Args:
+            clan_tag (str): clan's tag
+            season (str): war season "YYYY-MM"
+
+        Returns:
+            war_count: wars stored
+            won_count: wars won
+            lost_count: wars lost
+            tied_count: wars tied
+            stars: stars earned
+            destruction: average destruction percentage
+    """
+    # set up the query
+    query = (
+        "SELECT COUNT(id), "
+        "COALESCE(SUM(status = 'won'), 0), "
+        "COALESCE(SUM(status = 'lost'), 0), "
+        "COALESCE(SUM(status = 'tie'), 0), "
+        "COALESCE(SUM(clan_stars), 0), "
+        "COALESCE(AVG(clan_destruction), 0) "
+        "FROM war "
+        "WHERE clan_tag = %s "
+        "AND (%s IS NULL OR season = %s);"
+    )
+
+    # execute and return query
+    data = preset.select(query, (clan_tag, season, season))
+    return data
+
+
+def select_war_id_not_aggregated():
+    """
+        returns the ids of stored wars that have not been
+        added to the season totals
+
+        Returns:
+            list: db war ids
+    """
+    # set up the query
+    query = (
+        "SELECT id FROM war "
+        "WHERE season_aggregated = false "
+        "ORDER BY id;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query)
+    return data
+
+
+# CREATE
+def create_war_table():
+    # set up the query
+    query = (
+        "CREATE TABLE IF NOT EXISTS war("
+        "id int not null auto_increment, "
+        "clan_tag varchar(28) not null, "
+        "end_time datetime not null, "
+        "season char(7) not null, "
+        "war_tag varchar(28), "
+        "clan_name varchar(64) not null, "
+        "opponent_tag varchar(28) not null, "
+        "opponent_name varchar(64) not null, "
+        "team_size int not null, "
+        "attacks_per_member int not null, "
+        "clan_stars int not null, "
+        "clan_destruction float not null, "
+        "opponent_stars int not null, "
+        "opponent_destruction float not null, "
+        "status varchar(8) not null, "
+        "primary key(id), "
+        "unique key war_clan_end_time_key (clan_tag, end_time), "
+        "key war_season_index (season)"
+        ");"
+    )
+
+    # execute create query
+    preset.create(query)
+
+
+def create_war_season_aggregated_column():
+    # set up the query
+    # marks wars already added to war_season_member
+    query = (
+        "ALTER TABLE war "
+        "ADD COLUMN season_aggregated boolean not null default false;"
+    )
+
+    # execute create query
+    preset.create_column("war", "season_aggregated", query)
+
+
+# DROP
+def drop_war_table():
+    # set up the query
+    query = ("DROP TABLE war")
+
+    # execute drop query
+    preset.drop(query)
@@ -0,0 +1,187 @@
+import database.RazBotDB_Presets as preset
+
+
+class WarAttack(object):
+    """
+        WarAttack: object for db war_attack table objects
+
+            Instance Attributes
+                clan_tag (str): war clan's tag
+                end_time (datetime): war end time in utc
+                attack_order (int): order of the attack in the war
+                attacker_tag (str): attacker's player tag
+                attacker_town_hall (int): attacker's town hall
+                defender_tag (str): defender's player tag
+                defender_town_hall (int): defender's town hall
+                stars (int): stars earned
+                destruction (float): destruction percentage earned
+                duration (int): attack duration in seconds
+                score (float): attack score
+    """
+
+    def __init__(
+        self, clan_tag, end_time, attack_order,
+        attacker_tag, attacker_town_hall,
+        defender_tag, defender_town_hall,
+        stars, destruction, duration, score
+    ):
+        self.clan_tag = clan_tag
+        self.end_time = end_time
+        self.attack_order = attack_order
+        self.attacker_tag = attacker_tag
+        self.attacker_town_hall = attacker_town_hall
+        self.defender_tag = defender_tag
+        self.defender_town_hall = defender_town_hall
+        self.stars = stars
+        self.destruction = destruction
+        self.duration = duration
+        self.score = score
+
+
+# INSERT
+def insert_war_attack_list(war_attack_list):
+    """
+        Takes in the war clan's attacks of a stored war, inserts them
+        or updates attacks already stored for the war
+        and returns the affected row count
+
+        Args:
+            list
+                war_id (int): db war id
+                attack_order (int): order of the attack in the war
+                attacker_tag (str): attacker's player tag
+                attacker_town_hall (int): attacker's town hall
+                defender_tag (str): defender's player tag
+                defender_town_hall (int): defender's town hall
+                stars (int): stars earned
+                destruction (float): destruction percentage earned
+                duration (int): attack duration in seconds
+                score (float): attack score
+
+        Returns:
+            int: affected row count
+    """
+    # set up the query
+    # war_id and attack_order are unique, storing an attack again updates it
+    query = (
+        "INSERT into war_attack ("
+        "war_id, attack_order, attacker_tag, attacker_town_hall, "
+        "defender_tag, defender_town_hall, "
+        "stars, destruction, duration, score"
+        ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE "
+        "attacker_tag = VALUES(attacker_tag), "
+        "attacker_town_hall = VALUES(attacker_town_hall), "
+        "defender_tag = VALUES(defender_tag), "
+        "defender_town_hall = VALUES(defender_town_hall), "
+        "stars = VALUES(stars), "
+        "destruction = VALUES(destruction), "
+        "duration = VALUES(duration), "
+        "score = VALUES(score);"
+    )
+
+    # execute insert query
+    data = preset.insert_list(query, war_attack_list)
+    return data
+
+
+# SELECT
+def select_war_attack_from_player(player_tag, attack_count):
+    """
+        Takes in player_tag and returns the player's latest
+        attacks, newest first
+
+        Args:
+            player_tag (str): attacker's player tag
+            attack_count (int): most attacks returned
+
+        Returns:
+            list: war_attack columns in WarAttack attribute order
+    """
+    # uses the attacker_tag index
+    query = (
+        "SELECT war.clan_tag, war.end_time, war_attack.attack_order, "
+        "war_attack.attacker_tag, war_attack.attacker_town_hall, "
+        "war_attack.defender_tag, war_attack.defender_town_hall, "
+        "war_attack.stars, war_attack.destruction, "
+        "war_attack.duration, war_attack.score "
+        "FROM war_attack "
+        "INNER JOIN war ON war_attack.war_id = war.id "
+        "WHERE war_attack.attacker_tag = %s "
+        "ORDER BY war.end_time DESC, war_attack.attack_order DESC "
+        "LIMIT %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (player_tag, attack_count))
+    return data
+
+
+def select_war_attack_from_clan_war(clan_tag, end_time):
+    """
+        Takes in clan_tag and end_time and returns the war clan's
+        attacks in attack order
+
+        Args:
+            clan_tag (str): clan's tag
+            end_time (datetime): war end time in utc
+
+        Returns:
+            list: war_attack columns in WarAttack attribute order
+    """
+    # uses the war clan_tag, end_time unique key
+    query = (
+        "SELECT war.clan_tag, war.end_time, war_attack.attack_order, "
+        "war_attack.attacker_tag, war_attack.attacker_town_hall, "
+        "war_attack.defender_tag, war_attack.defender_town_hall, "
+        "war_attack.stars, war_attack.destruction, "
+        "war_attack.duration, war_attack.score "
+        "FROM war_attack "
+        "INNER JOIN war ON war_attack.war_id = war.id "
+        "WHERE war.clan_tag = %s "
+        "AND war.end_time = %s "
+        "ORDER BY war_attack.attack_order;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (clan_tag, end_time))
+    return data
+
+
+# CREATE
+def create_war_attack_table():
+    # set up the query
+    query = (
+        "CREATE TABLE IF NOT EXISTS war_attack("
+        "id int not null auto_increment, "
+        "war_id int not null, "
+        "attack_order int not null, "
+        "attacker_tag varchar(28) not null, "
+        "attacker_town_hall int not null, "
+        "defender_tag varchar(28) not null, "
+        "defender_town_hall int not null, "
+        "stars int not null, "
+        "destruction float not null, "
+        "duration int not null, "
+        "score double not null, "
+        "primary key(id), "
+        "unique key war_attack_war_order_key (war_id, attack_order), "
+        "key war_attack_attacker_index (attacker_tag), "
+        "foreign key (war_id) "
+        "references war (id) "
+        "on update no action "
+        "on delete cascade"
+        ");"
+    )
+
+    # execute create query
+    preset.create(query)
+
+
+# DROP
+def drop_war_attack_table():
+    # set up the query
+    query = ("DROP TABLE war_attack")
+
+    # execute drop query
+    preset.drop(query)
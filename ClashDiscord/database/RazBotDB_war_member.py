@@ -0,0 +1,225 @@
+import database.RazBotDB_Presets as preset
+
+
+class WarMember(object):
+    """
+        WarMember: object for db war_member table objects
+
+            Instance Attributes
+                clan_tag (str): war clan's tag
+                end_time (datetime): war end time in utc
+                season (str): war season, "YYYY-MM" of end_time
+                player_tag (str): member's player tag
+                name (str): member's player name
+                town_hall (int): member's town hall in the war
+                map_position (int): member's war map position
+                potential_attack_count (int): attacks the member had
+                attack_count (int): attacks made
+                stars (int): stars earned
+                destruction (float): destruction percentage earned
+                score (float): member's war score
+    """
+
+    def __init__(
+        self, clan_tag, end_time, season,
+        player_tag, name, town_hall, map_position,
+        potential_attack_count, attack_count,
+        stars, destruction, score
+    ):
+        self.clan_tag = clan_tag
+        self.end_time = end_time
+        self.season = season
+        self.player_tag = player_tag
+        self.name = name
+        self.town_hall = town_hall
+        self.map_position = map_position
+        self.potential_attack_count = potential_attack_count
+        self.attack_count = attack_count
+        self.stars = stars
+        self.destruction = destruction
+        self.score = score
+
+
+# INSERT
+def insert_war_member_list(war_member_list):
+    """
+        Takes in the members of a stored war, inserts them or
+        updates members already stored for the war
+        and returns the affected row count
+
+        Args:
+            list
+                war_id (int): db war id
+                player_tag (str): member's player tag
+                name (str): member's player name
+                town_hall (int): member's town hall in the war
+                map_position (int): member's war map position
+                potential_attack_count (int): attacks the member had
+                attack_count (int): attacks made
+                stars (int): stars earned
+                destruction (float): destruction percentage earned
+                score (float): member's war score
+
+        Returns:
+            int: affected row count
+    """
+    # set up the query
+    # war_id and player_tag are unique, storing a member again updates it
+    query = (
+        "INSERT into war_member ("
+        "war_id, player_tag, name, town_hall, map_position, "
+        "potential_attack_count, attack_count, "
+        "stars, destruction, score"
+        ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE "
+        "name = VALUES(name), "
+        "town_hall = VALUES(town_hall), "
+        "map_position = VALUES(map_position), "
+        "potential_attack_count = VALUES(potential_attack_count), "
+        "attack_count = VALUES(attack_count), "
+        "stars = VALUES(stars), "
+        "destruction = VALUES(destruction), "
+        "score = VALUES(score);"
+    )
+
+    # execute insert query
+    data = preset.insert_list(query, war_member_list)
+    return data
+
+
+# SELECT
+def select_war_member_from_player(player_tag, war_count):
+    """
+        Takes in player_tag and returns the player's latest
+        war results, newest first
+
+        Args:
+            player_tag (str): player's tag
+            war_count (int): most wars returned
+
+        Returns:
+            list: war_member columns in WarMember attribute order
+    """
+    # uses the player_tag index
+    query = (
+        "SELECT war.clan_tag, war.end_time, war.season, "
+        "war_member.player_tag, war_member.name, "
+        "war_member.town_hall, war_member.map_position, "
+        "war_member.potential_attack_count, war_member.attack_count, "
+        "war_member.stars, war_member.destruction, war_member.score "
+        "FROM war_member "
+        "INNER JOIN war ON war_member.war_id = war.id "
+        "WHERE war_member.player_tag = %s "
+        "ORDER BY war.end_time DESC "
+        "LIMIT %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (player_tag, war_count))
+    return data
+
+
+def select_war_member_from_clan_war(clan_tag, end_time):
+    """
+        Takes in clan_tag and end_time and returns the war's members
+        in map position order
+
+        Args:
+            clan_tag (str): clan's tag
+            end_time (datetime): war end time in utc
+
+        Returns:
+            list: war_member columns in WarMember attribute order
+    """
+    # uses the war clan_tag, end_time unique key
+    query = (
+        "SELECT war.clan_tag, war.end_time, war.season, "
+        "war_member.player_tag, war_member.name, "
+        "war_member.town_hall, war_member.map_position, "
+        "war_member.potential_attack_count, war_member.attack_count, "
+        "war_member.stars, war_member.destruction, war_member.score "
+        "FROM war_member "
+        "INNER JOIN war ON war_member.war_id = war.id "
+        "WHERE war.clan_tag = %s "
+        "AND war.end_time = %s "
+        "ORDER BY war_member.map_position;"
+    )
+
+    # execute and return query
+    data = preset.select_list(query, (clan_tag, end_time))
+    return data
+
+
+def select_war_member_stats_from_player(player_tag, season=None):
+    """
+        Takes in player_tag and returns the player's war totals
+        for season, or lifetime if season is None
+
+        Args:
+            player_tag (str): player's tag
+            season (str): war season "YYYY-MM"
+
+        Returns:
+            war_count: wars stored
+            potential_attack_count: attacks the player had
+            attack_count: attacks made
+            stars: stars earned
+            destruction: destruction percentage earned
+            score: average war score
+    """
+    # set up the query
+    query = (
+        "SELECT COUNT(war_member.id), "
+        "COALESCE(SUM(war_member.potential_attack_count), 0), "
+        "COALESCE(SUM(war_member.attack_count), 0), "
+        "COALESCE(SUM(war_member.stars), 0), "
+        "COALESCE(SUM(war_member.destruction), 0), "
+        "COALESCE(AVG(war_member.score), 0) "
+        "FROM war_member "
+        "INNER JOIN war ON war_member.war_id = war.id "
+        "WHERE war_member.player_tag = %s "
+        "AND (%s IS NULL OR war.season = %s);"
+    )
+
+    # execute and return query
+    data = preset.select(query, (player_tag, season, season))
+    return data
+
+
+# CREATE
+def create_war_member_table():
+    # set up the query
+    query = (
+        "CREATE TABLE IF NOT EXISTS war_member("
+        "id int not null auto_increment, "
+        "war_id int not null, "
+        "player_tag varchar(28) not null, "
+        "name varchar(64) not null, "
+        "town_hall int not null, "
+        "map_position int not null, "
+        "potential_attack_count int not null, "
+        "attack_count int not null, "
+        "stars int not null, "
+        "destruction float not null, "
+        "score double not null, "
+        "primary key(id), "
+        "unique key war_member_war_player_key (war_id, player_tag), "
+        "key war_member_player_index (player_tag), "
+        "foreign key (war_id) "
+        "references war (id) "
+        "on update no action "
+        "on delete cascade"
+        ");"
+    )
+
+    # execute create query
+    preset.create(query)
+
+
+# DROP
+def drop_war_member_table():
+    # set up the query
+    query = ("DROP TABLE war_member")
+
+    # execute drop query
+    preset.drop(query)
@@ -0,0 +1,249 @@
+import database.RazBotDB_Presets as preset
+
+
+class WarSeasonMember(object):
+    """
+        WarSeasonMember: object for db war_season_member table objects,
+            a member's war totals in a clan for a season
+
+            Instance Attributes
+                season (str): war season "YYYY-MM"
+                war_type (str): "war" or "cwl"
+                clan_tag (str): clan's tag
+                player_tag (str): member's player tag
+                name (str): member's latest player name
+                war_count (int): wars stored
+                potential_attack_count (int): attacks the member had
+                attack_count (int): attacks made
+                stars (int): stars earned
+                destruction (float): destruction percentage earned
+                score (float): average war score,
+                    weighted by rounds played on the cwl leaderboard
+    """
+
+    def __init__(
+        self, season, war_type, clan_tag, player_tag, name,
+        war_count, potential_attack_count, attack_count,
+        stars, destruction, score
+    ):
+        self.season = season
+        self.war_type = war_type
+        self.clan_tag = clan_tag
+        self.player_tag = player_tag
+        self.name = name
+        self.war_count = war_count
+        self.potential_attack_count = potential_attack_count
+        self.attack_count = attack_count
+        self.stars = stars
+        self.destruction = destruction
+        self.score = score
+
+
+# UPDATE
+def update_war_season_member_from_war(war_id):
+    """
+        Takes in a stored war id and adds its members to the season
+        totals, a war is only added once
+
+        Args:
+            war_id (int): db war id
+    """
+    # lock the war row, a second aggregation of the same war
+    # waits here and then finds it already aggregated
+    lock_query = (
+        "SELECT id FROM war "
+        "WHERE id = %s "
+        "FOR UPDATE;"
+    )
+
+    # add the war's members to their season totals,
+    # only if the war has not been added yet
+    # target columns are qualified since war_member shares their names,
+    # assignments run in order so score uses the updated sums
+    aggregate_query = (
+        "INSERT into war_season_member ("
+        "season, war_type, clan_tag, player_tag, name, "
+        "war_count, potential_attack_count, attack_count, "
+        "stars, destruction, score_sum, score"
+        ") "
+        "SELECT war.season, "
+        "IF(war.war_tag IS NULL, 'war', 'cwl'), "
+        "war.clan_tag, war_member.player_tag, war_member.name, "
+        "1, war_member.potential_attack_count, war_member.attack_count, "
+        "war_member.stars, war_member.destruction, "
+        "war_member.score, war_member.score "
+        "FROM war_member "
+        "INNER JOIN war ON war_member.war_id = war.id "
+        "WHERE war.id = %s "
+        "AND war.season_aggregated = false "
+        "ON DUPLICATE KEY UPDATE "
+        "war_season_member.name = VALUES(name), "
+        "war_season_member.war_count = "
+        "war_season_member.war_count + VALUES(war_count), "
+        "war_season_member.potential_attack_count = "
+        "war_season_member.potential_attack_count "
+        "+ VALUES(potential_attack_count), "
+        "war_season_member.attack_count = "
+        "war_season_member.attack_count + VALUES(attack_count), "
+        "war_season_member.stars = "
+        "war_season_member.stars + VALUES(stars), "
+        "war_season_member.destruction = "
+        "war_season_member.destruction + VALUES(destruction), "
+        "war_season_member.score_sum = "
+        "war_season_member.score_sum + VALUES(score_sum), "
+        "war_season_member.score = "
+        "war_season_member.score_sum / war_season_member.war_count;"
+    )
+
+    # mark the war as added
+    war_query = (
+        "UPDATE war "
+        "SET season_aggregated = true "
+        "WHERE id = %s;"
+    )
+
+    # execute the queries in one transaction
+    preset.insert_transaction([
+        (lock_query, (war_id,)),
+        (aggregate_query, (war_id,)),
+        (war_query, (war_id,))
+    ])
+
+
+# SELECT
+def select_war_season_member_leaderboard(
+        season, war_type, clan_tag_list, member_count):
+    """
+        Takes in season, war_type and clan tags and
+        returns the highest scoring members of those clans
+
+        Args:
+            season (str): war season "YYYY-MM"
+            war_type (str): "war" or "cwl"
+            clan_tag_list (list): list of clan tags
+            member_count (int): most members returned
+
+        Returns:
+            list: war_season_member columns in
+                WarSeasonMember attribute order
+    """
+    # no clans to rank
+    if len(clan_tag_list) == 0:
+        return []
+
+    # set up the query
+    # read in score order from the season leaderboard index
+    placeholder_string = ", ".join(["%s"] * len(clan_tag_list))
+    query = (
+        f"SELECT season, war_type, clan_tag, player_tag, name, "
+        f"war_count, potential_attack_count, attack_count, "
+        f"stars, destruction, score "
+        f"FROM war_season_member "
+        f"WHERE season = %s "
+        f"AND war_type = %s "
+        f"AND clan_tag IN ({placeholder_string}) "
+        f"ORDER BY score DESC, stars DESC "
+        f"LIMIT %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(
+        query, (season, war_type, *clan_tag_list, member_count))
+    return data
+
+
+def select_war_season_member_cwl_leaderboard(
+        season, clan_tag_list, member_count):
+    """
+        Takes in season and clan tags and returns the highest scoring
+        cwl members of those clans, the average score is weighted by
+        the rounds played like ClashResponder.cwl_member_score_list
+
+        Args:
+            season (str): war season "YYYY-MM"
+            clan_tag_list (list): list of clan tags
+            member_count (int): most members returned
+
+        Returns:
+            list: war_season_member columns in
+                WarSeasonMember attribute order,
+                score being the weighted score
+    """
+    # no clans to rank
+    if len(clan_tag_list) == 0:
+        return []
+
+    # set up the query
+    # every stored cwl war is an ended round of its clan,
+    # the multiplier is log base rounds of rounds played,
+    # or 1 while there have been fewer than 2 rounds
+    placeholder_string = ", ".join(["%s"] * len(clan_tag_list))
+    query = (
+        f"SELECT war_season_member.season, war_season_member.war_type, "
+        f"war_season_member.clan_tag, war_season_member.player_tag, "
+        f"war_season_member.name, war_season_member.war_count, "
+        f"war_season_member.potential_attack_count, "
+        f"war_season_member.attack_count, war_season_member.stars, "
+        f"war_season_member.destruction, "
+        f"war_season_member.score * IF("
+        f"cwl_round.round_count >= 2, "
+        f"LOG(cwl_round.round_count, war_season_member.war_count), 1"
+        f") AS cwl_score "
+        f"FROM war_season_member "
+        f"INNER JOIN ("
+        f"SELECT clan_tag, COUNT(*) AS round_count FROM war "
+        f"WHERE season = %s "
+        f"AND war_tag IS NOT NULL "
+        f"AND clan_tag IN ({placeholder_string}) "
+        f"GROUP BY clan_tag"
+        f") AS cwl_round "
+        f"ON war_season_member.clan_tag = cwl_round.clan_tag "
+        f"WHERE war_season_member.season = %s "
+        f"AND war_season_member.war_type = 'cwl' "
+        f"ORDER BY cwl_score DESC, war_season_member.stars DESC "
+        f"LIMIT %s;"
+    )
+
+    # execute and return query
+    data = preset.select_list(
+        query, (season, *clan_tag_list, season, member_count))
+    return data
+
+
+# CREATE
+def create_war_season_member_table():
+    # set up the query
+    query = (
+        "CREATE TABLE IF NOT EXISTS war_season_member("
+        "id int not null auto_increment, "
+        "season char(7) not null, "
+        "war_type varchar(8) not null, "
+        "clan_tag varchar(28) not null, "
+        "player_tag varchar(28) not null, "
+        "name varchar(64) not null, "
+        "war_count int not null, "
+        "potential_attack_count int not null, "
+        "attack_count int not null, "
+        "stars int not null, "
+        "destruction float not null, "
+        "score_sum double not null, "
+        "score double not null, "
+        "primary key(id), "
+        "unique key war_season_member_key "
+        "(season, war_type, clan_tag, player_tag), "
+        "key war_season_member_leaderboard_index "
+        "(season, war_type, score, stars)"
+        ");"
+    )
+
+    # execute create query
+    preset.create(query)
+
+
+# DROP
+def drop_war_season_member_table():
+    # set up the query
+    query = ("DROP TABLE war_season_member")
+
+    # execute drop query
+    preset.drop(query)
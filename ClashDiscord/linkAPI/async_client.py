@@ -0,0 +1,537 @@
+import asyncio
+import json
+import random
+import aiohttp
+from utils.cache_utils import TTLCache
+from linkAPI.client import LinkApiClient
+from linkAPI.errors import (
+    LoginError,
+    ConflictError,
+    NotFoundError,
+    InvalidTagError
+)
+
+
+class AsyncLinkApiClient(LinkApiClient):
+    """
+        AsyncLinkApiClient: non blocking LinkAPI client
+            sharing one keep-alive aiohttp session
+
+            Instance Attributes
+                username (str): LinkAPI username
+                password (str): LinkAPI password
+                timeout (float): seconds before a request is abandoned
+                max_retries (int): retries for 429, and for 5xx and
+                    connection errors on GET and DELETE
+                backoff_base (float): seconds of the first retry delay,
+                    doubled on every retry
+                backoff_max (float): longest retry delay in seconds
+                link_cache_ttl (float): seconds found links are cached
+                link_cache_negative_ttl (float): seconds not found
+                    answers are cached
+                link_cache_max_size (int): entries kept in each link cache
+    """
+
+    def __init__(
+        self, username: str, password: str,
+        timeout: float = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8,
+        link_cache_ttl: float = 600,
+        link_cache_negative_ttl: float = 120,
+        link_cache_max_size: int = 10000
+    ):
+        super().__init__(username, password)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.link_cache_ttl = link_cache_ttl
+        self.link_cache_negative_ttl = link_cache_negative_ttl
+        self.link_cache_max_size = link_cache_max_size
+
+        # discord user id: list of PlayerLink or None if not found
+        self.discord_user_link_cache = TTLCache(
+            link_cache_ttl, link_cache_max_size)
+        # formatted player tag: PlayerLink or None if not found
+        self.player_tag_link_cache = TTLCache(
+            link_cache_ttl, link_cache_max_size)
+
+        # created on first use inside the running event loop
+        self._session = None
+        self._login_lock = None
+
+    def get_session(self):
+        """
+            returns the shared aiohttp session, creating it on first use
+        """
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+        return self._session
+
+    async def close(self):
+        """
+            closes the shared aiohttp session
+        """
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def retry_delay(self, attempt: int, retry_after: str = None):
+        """
+            returns seconds to wait before retry attempt,
+            honouring a numeric Retry-After header
+        """
+
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+
+        delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+
+        # jitter keeps concurrent retries from landing together
+        return delay * random.uniform(0.5, 1)
+
+    async def login(self):
+        """
+            LinkAPI Client login
+
+            errors:
+                Login Error
+        """
+        request_url = self.base_url + self.login_url
+        payload = {
+            'username': self.username,
+            'password': self.password
+        }
+
+        async with self.get_session().post(
+                url=request_url, json=payload) as r:
+
+            if r.status == 401:
+                raise LoginError("Invalid login credentials")
+
+            # any other failure has no token to read
+            if r.status != 200:
+                raise LoginError(f"Login failed with status {r.status}")
+
+            try:
+                response_json = await r.json(content_type=None)
+            except ValueError:
+                response_json = None
+
+        if not isinstance(response_json, dict) or 'token' not in response_json:
+            raise LoginError("Login response has no token")
+
+        self.token = response_json['token']
+
+    async def refresh_token(self, stale_token: str):
+        """
+            logs in again unless another request already replaced
+            stale_token, so concurrent 401s only log in once
+
+            Args:
+                stale_token (str): token the failed request used
+        """
+
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+
+        async with self._login_lock:
+            # token was refreshed while waiting on the lock
+            if self.token != stale_token:
+                return
+
+            # LoginError from login is raised with its own reason
+            await self.login()
+
+    async def request(self, method: str, url: str, payload=None):
+        """
+            sends an authorized request, logging in when needed
+            and retrying with backoff,
+            429 is retried for every method, 5xx and connection errors
+            only for GET and DELETE so a POST is never sent twice
+
+            Args:
+                method (str): http method
+                url (str): request url
+                payload: json payload
+
+            Raises:
+                LoginError: failed login
+
+            Returns:
+                tuple: response status and parsed json (None if empty)
+        """
+
+        if self.token == "":
+            await self.refresh_token("")
+
+        # a retried GET or DELETE has the same effect as the first
+        idempotent = method.upper() in ("GET", "DELETE")
+
+        attempt = 0
+        token_refreshed = False
+
+        while True:
+            token = self.token
+            header = {
+                'Authorization': f"Bearer {token}"
+            }
+
+            try:
+                async with self.get_session().request(
+                        method, url, headers=header, json=payload) as r:
+                    status = r.status
+                    retry_after = r.headers.get('Retry-After')
+                    response_text = await r.text()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # the request may have reached LinkAPI
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+
+                await asyncio.sleep(self.retry_delay(attempt))
+                attempt += 1
+                continue
+
+            # invalid token, log in once and resend
+            if status == 401:
+                if token_refreshed:
+                    raise LoginError("Invalid login credentials")
+
+                await self.refresh_token(token)
+                token_refreshed = True
+                continue
+
+            # rate limited, or server error on a request safe to resend
+            if ((status == 429 or (idempotent and status >= 500))
+                    and attempt < self.max_retries):
+                await asyncio.sleep(self.retry_delay(attempt, retry_after))
+                attempt += 1
+                continue
+
+            if response_text == "":
+                return status, None
+
+            try:
+                return status, json.loads(response_text)
+            except ValueError:
+                return status, None
+
+    def format_player_tag(self, player_tag: str):
+        """
+            returns player_tag upper case without '#' as LinkAPI expects
+        """
+
+        # change string to upper
+        player_tag = player_tag.upper()
+        # remove '#' from player tag
+        player_tag = player_tag.replace('#', '')
+
+        return player_tag
+
+    def invalidate_link(self, player_tag: str, discord_user_id: int = None):
+        """
+            drops cached links for player_tag and discord_user_id,
+            if discord_user_id is unknown it is taken from the cached tag
+            or every cached discord user link is dropped
+
+            Args:
+                player_tag (str): clash of clans player tag
+                discord_user_id (int): user ID from discord
+        """
+
+        player_tag = self.format_player_tag(player_tag)
+
+        if discord_user_id is None:
+            player_link = self.player_tag_link_cache.get(player_tag)
+
+            if player_link is not None:
+                discord_user_id = player_link.discord_user_id
+
+        self.player_tag_link_cache.pop(player_tag)
+
+        if discord_user_id is None:
+            # the linked user is unknown
+            self.discord_user_link_cache.clear()
+        else:
+            self.discord_user_link_cache.pop(int(discord_user_id))
+
+    async def load_link(self, link_cache, key, load_function, *args):
+        """
+            returns the cached link result for key or loads it,
+            not found answers are cached for link_cache_negative_ttl
+
+            Raises:
+                NotFoundError: data not found, cached or loaded
+        """
+
+        # set when this call ran the load rather than a cache hit
+        load_state = {'not_found': False}
+
+        async def load_or_none():
+            try:
+                return await load_function(*args)
+            # cache not found answers as None
+            except NotFoundError:
+                load_state['not_found'] = True
+                return None
+
+        link_result = await link_cache.get_or_load(key, load_or_none)
+
+        if link_result is None:
+            # shorten the ttl the not found answer was just cached with
+            if load_state['not_found'] and link_cache.get(key, False) is None:
+                link_cache.set(key, None, ttl=self.link_cache_negative_ttl)
+
+            raise NotFoundError("data is not found with supplied information")
+
+        return link_result
+
+    async def get_discord_user_link(self, discord_user_id: int):
+        """
+            gets linked players using discord ID,
+            found and not found answers are cached
+
+            Args:
+                discord_user_id (int): user ID from discord
+
+            Raises:
+                LoginError: failed login
+                NotFoundError: data not found
+
+            Returns:
+                list: list of PlayerLink objects
+                    player_tag, discord_user_id
+        """
+
+        player_links = await self.load_link(
+            self.discord_user_link_cache, int(discord_user_id),
+            self.fetch_discord_user_link, discord_user_id)
+
+        # callers get their own list
+        return list(player_links)
+
+    async def get_player_tag_link(self, player_tag: str):
+        """
+            gets linked player using player tag,
+            found and not found answers are cached
+
+            Args:
+                player_tag (str): clash of clans player tag
+
+            Raises:
+                LoginError: failed login
+                NotFoundError: data not found
+                InvalidTagError: invalid player tag
+
+            Returns:
+                PlayerLink: Player Link Object
+                    player_tag, discord_user_id
+        """
+
+        return await self.load_link(
+            self.player_tag_link_cache, self.format_player_tag(player_tag),
+            self.fetch_player_tag_link, player_tag)
+
+    async def fetch_discord_user_link(self, discord_user_id: int):
+        """
+            gets linked players using discord ID
+
+            Args:
+                discord_user_id (int): user ID from discord
+
+            Raises:
+                LoginError: failed login
+                NotFoundError: data not found
+
+            Returns:
+                list: list of PlayerLink objects
+                    player_tag, discord_user_id
+        """
+
+        url = self.base_url + self.links_url + str(discord_user_id)
+
+        status, response_json = await self.request("GET", url)
+
+        # no user is found with requested id
+        if status == 404:
+            raise NotFoundError("No user found with requested id")
+
+        # no user is found with requested id
+        if not response_json:
+            raise NotFoundError("No user found with requested id")
+
+        player_links = self.instanciate_player_link_list(
+            player_links=response_json)
+
+        return player_links
+
+    async def fetch_player_tag_link(self, player_tag: str):
+        """
+            gets linked player using player tag
+
+            Args:
+                player_tag (str): clash of clans player tag
+
+            Raises:
+                LoginError: failed login
+                NotFoundError: data not found
+                InvalidTagError: invalid player tag
+
+            Returns:
+                PlayerLink: Player Link Object
+                    player_tag, discord_user_id
+        """
+
+        # change string to upper
+        player_tag = player_tag.upper()
+        # remove '#' from player tag
+        player_tag = player_tag.replace('#', '')
+
+        url = self.base_url + self.links_url + player_tag
+
+        status, response_json = await self.request("GET", url)
+
+        # no player is found with requested tag
+        if status == 404:
+            raise NotFoundError("No player found with requested tag")
+
+        # tag is invalid
+        if status == 400:
+            raise InvalidTagError("Invalid player tag")
+
+        # no player is found with requested tag
+        if not response_json:
+            raise NotFoundError("No player found with requested tag")
+
+        player_link = self.instanciate_player_link(
+            player_tag=response_json[0]['playerTag'],
+            discord_user_id=response_json[0]['discordId']
+        )
+
+        return player_link
+
+    async def get_batch_links(self, batch_list: list):
+        """
+            gets linked player using list of discord ids and player tags
+
+            Args:
+                batch_list (list): list of strings for
+                    discord ids and player tags
+
+            Raises:
+                LoginError: failed login
+                NotFoundError: data not found
+
+            Returns:
+                list: list of PlayerLink objects
+                    player_tag, discord_user_id
+        """
+
+        url = self.base_url + self.batch_url
+
+        payload = []
+        # adding items in batch list and formatting player tags
+        for item in batch_list:
+            payload_item = item.upper()
+            payload_item = payload_item.replace('#', '')
+            payload.append(payload_item)
+
+        status, response_json = await self.request("POST", url, payload)
+
+        # no discord user or player tag found
+        if status == 404:
+            raise NotFoundError("data is not found with supplied information")
+
+        # no user is found with requested id
+        if not response_json:
+            raise NotFoundError("data is not found with supplied information")
+
+        player_links = self.instanciate_player_link_list(
+            player_links=response_json)
+
+        return player_links
+
+    async def add_link(self, player_tag: str, discord_user_id: int):
+        """
+            adds a player link
+
+            Args:
+                player_tag (str): clash of clans player tag
+                discord_user_id (int): user ID from discord
+
+            Raises:
+                LoginError: failed login
+                InvalidTagError: invalid player tag
+                ConflictError: link data already in db
+
+            Returns:
+                PlayerLink: Player Link Object
+                    player_tag, discord_user_id
+        """
+
+        # change string to upper
+        player_tag = player_tag.upper()
+        # remove '#' from player tag
+        player_tag = player_tag.replace('#', '')
+
+        url = self.base_url + self.links_url
+        payload = {
+            'playerTag': f"{player_tag}",
+            'discordId': f"{discord_user_id}"
+        }
+
+        status, response_json = await self.request("POST", url, payload)
+
+        # tag is invalid
+        if status == 400:
+            raise InvalidTagError("Invalid player tag")
+
+        # tag is already in DB
+        if status == 409:
+            raise ConflictError("Tag already in DB")
+
+        # drop cached answers for the tag and user
+        self.invalidate_link(player_tag, discord_user_id)
+
+        if status == 200:
+            player_link = self.instanciate_player_link(
+                player_tag=player_tag,
+                discord_user_id=discord_user_id)
+            return player_link
+
+    async def delete_link(self, player_tag: str):
+        """
+            deletes a player link
+
+            Args:
+                player_tag (str): clash of clans player tag
+
+            Raises:
+                LoginError: failed login
+                NotFoundError: data not found
+        """
+
+        # change string to upper
+        player_tag = player_tag.upper()
+        # remove '#' from player tag
+        player_tag = player_tag.replace('#', '')
+
+        url = self.base_url + self.links_url + player_tag
+
+        status, response_json = await self.request("DELETE", url)
+
+        # drop cached answers for the tag and its user
+        self.invalidate_link(player_tag)
+
+        # tag is invalid
+        if status == 404:
+            raise NotFoundError("Tag not found in DB")
@@ -17,7 +17,8 @@ from cogs import (
     events as events_cog
 )
 from data import ClashDiscord_Client_Data
-from linkAPI.client import LinkApiClient
+from database.RazBotDB_db import db_migrate
+from linkAPI.async_client import AsyncLinkApiClient
 from responders.ClientResponder import (
     get_client_email,
     get_client_password,
@@ -29,20 +30,38 @@ from responders.ClientResponder import (
 
 client_data = ClashDiscord_Client_Data.ClashDiscord_Data()
 
+# events client so claimed clans can be watched for member events
 coc_client = coc.login(
     email=get_client_email(),
-    password=get_client_password()
+    password=get_client_password(),
+    client=coc.EventsClient
 )
 
-linkapi_client = LinkApiClient(
+linkapi_client = AsyncLinkApiClient(
     get_linkapi_username(),
     get_linkapi_password()
 )
 
+
+
+class ClashDiscordBot(commands.InteractionBot):
+    """
+        ClashDiscordBot: InteractionBot that also closes
+            the LinkAPI session when the bot shuts down
+    """
+
+    async def close(self):
+        try:
+            await super().close()
+        finally:
+            # bot.run awaits close before stopping the event loop
+            await linkapi_client.close()
+
+
 intents = disnake.Intents.default()
 intents.members = True
 
-bot = commands.InteractionBot(
+bot = ClashDiscordBot(
     intents=intents,
     test_guilds=get_client_test_guilds())
 
@@ -76,4 +95,6 @@ bot.add_cog(events_cog.Events(
     bot, coc_client, client_data, linkapi_client))
 
 if __name__ == "__main__":
+    # bring the db schema up to date before the bot starts
+    db_migrate()
     bot.run(get_client_token())
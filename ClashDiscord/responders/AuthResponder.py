@@ -50,7 +50,8 @@ async def player_verification(db_player_obj, user_obj, coc_client):
         }
 
     try:
-        player_obj = await coc_client.get_player(db_player_obj.player_tag)
+        player_obj = await clash_responder.fetch_player(
+            db_player_obj.player_tag, coc_client)
     except Maintenance:
         return {
             'verified': False,
@@ -148,8 +149,8 @@ async def player_leadership_verification(db_player_obj, user_obj, guild_id, coc_
                 (verified, field_dict_list, player_obj)
     """
 
-    db_user = db_responder.read_user(user_obj.id)
-    db_guild = db_responder.read_guild(guild_id)
+    db_user = await db_responder.read_user(user_obj.id)
+    db_guild = await db_responder.read_guild(guild_id)
 
     if db_user is None:
         return {
@@ -181,8 +182,8 @@ async def player_leadership_verification(db_player_obj, user_obj, guild_id, coc_
 
             return verification_payload
 
-    db_clan_list = db_responder.read_clan_list_from_guild(guild_id)
-    db_player_list = db_responder.read_player_list(user_obj.id)
+    db_clan_list = await db_responder.read_clan_list_from_guild(guild_id)
+    db_player_list = await db_responder.read_player_list(user_obj.id)
 
     if len(db_clan_list) == 0:
         return {
@@ -206,7 +207,8 @@ async def player_leadership_verification(db_player_obj, user_obj, guild_id, coc_
     # check for leadership in any claimed clan
     for db_player in db_player_list:
         try:
-            player_obj = await coc_client.get_player(db_player.player_tag)
+            player_obj = await clash_responder.fetch_player(
+                db_player.player_tag, coc_client)
         except Maintenance:
             return {
                 'verified': False,
@@ -426,14 +428,15 @@ async def war_verification(
     cwl_enum_round = coc_utils.get_war_specified(war_selection, cwl_group)
 
     try:
-        war_obj = await coc_client.get_current_war(
-            player_obj.clan.tag, cwl_round=cwl_enum_round)
+        war_obj = await clash_responder.fetch_current_war(
+            player_obj.clan.tag, coc_client, cwl_enum_round)
 
         # specifically for last day of CWl
         if cwl_group is not None:
             # amount of rounds matches the number of rounds
             if len(cwl_group.rounds) == cwl_group.number_of_rounds:
-                last_round_war = await coc_client.get_league_war(cwl_group.rounds[-1][0])
+                last_round_war = await clash_responder.fetch_league_war(
+                    cwl_group.rounds[-1][0], coc_client)
 
                 # last war is either in war or war ended
                 if last_round_war.state != "preparation":
@@ -445,8 +448,8 @@ async def war_verification(
                     elif cwl_enum_round == WarRound.previous_war:
                         cwl_enum_round = WarRound.current_war
 
-                    war_obj = await coc_client.get_current_war(
-                        player_obj.clan.tag, cwl_round=cwl_enum_round)
+                    war_obj = await clash_responder.fetch_current_war(
+                        player_obj.clan.tag, coc_client, cwl_enum_round)
 
     except Maintenance:
         return {
@@ -567,14 +570,15 @@ async def war_leadership_verification(
     cwl_enum_round = coc_utils.get_war_specified(war_selection, cwl_group)
 
     try:
-        war_obj = await coc_client.get_current_war(
-            player_obj.clan.tag, cwl_round=cwl_enum_round)
+        war_obj = await clash_responder.fetch_current_war(
+            player_obj.clan.tag, coc_client, cwl_enum_round)
 
         # specifically for last day of CWl
         if cwl_group is not None:
             # amount of rounds matches the number of rounds
             if len(cwl_group.rounds) == cwl_group.number_of_rounds:
-                last_round_war = await coc_client.get_league_war(cwl_group.rounds[-1][0])
+                last_round_war = await clash_responder.fetch_league_war(
+                    cwl_group.rounds[-1][0], coc_client)
 
                 # last war is either in war or war ended
                 if last_round_war.state != "preparation":
@@ -586,8 +590,8 @@ async def war_leadership_verification(
                     elif cwl_enum_round == WarRound.previous_war:
                         cwl_enum_round = WarRound.current_war
 
-                    war_obj = await coc_client.get_current_war(
-                        player_obj.clan.tag, cwl_round=cwl_enum_round)
+                    war_obj = await clash_responder.fetch_current_war(
+                        player_obj.clan.tag, coc_client, cwl_enum_round)
 
     except Maintenance:
         return {
@@ -1019,7 +1023,7 @@ async def clan_role_verification(
         }
 
     # get clan tag from clan role
-    db_clan_role = db_responder.read_clan_role(clan_role.id)
+    db_clan_role = await db_responder.read_clan_role(clan_role.id)
 
     # role mentioned was not a linked clan role
     if db_clan_role is None:
@@ -1087,8 +1091,8 @@ async def clan_role_player_verification(
                 (verified, field_dict_list, player_obj, clan_obj)
     """
 
-    db_guild = db_responder.read_guild(guild_id)
-    db_user = db_responder.read_user(user.id)
+    db_guild = await db_responder.read_guild(guild_id)
+    db_user = await db_responder.read_user(user.id)
 
     clan_verification_payload = (await clan_role_verification(
         clan_role, coc_client))
@@ -1105,7 +1109,7 @@ async def clan_role_player_verification(
         if (db_guild.admin_user_id == user.id or
                 db_user.super_user):
 
-            db_player_obj = db_responder.read_player_active(user.id)
+            db_player_obj = await db_responder.read_player_active(user.id)
             player_verification_payload = (
                 await player_verification(db_player_obj, user, coc_client))
 
@@ -1122,7 +1126,7 @@ async def clan_role_player_verification(
             }
             return verification_payload
 
-    db_player_obj_list = db_responder.read_player_list(user.id)
+    db_player_obj_list = await db_responder.read_player_list(user.id)
 
     if len(db_player_obj_list) == 0:
         return {
@@ -1186,8 +1190,8 @@ async def clan_role_player_leadership_verification(
                 (verified, field_dict_list, player_obj, clan_obj)
     """
 
-    db_guild = db_responder.read_guild(guild_id)
-    db_user = db_responder.read_user(user.id)
+    db_guild = await db_responder.read_guild(guild_id)
+    db_user = await db_responder.read_user(user.id)
 
     clan_role_player_verification_payload = (await clan_role_player_verification(
         clan_role, user, guild_id, coc_client))
@@ -1268,14 +1272,15 @@ async def clan_role_war_verification(
     cwl_enum_round = coc_utils.get_war_specified(war_selection, cwl_group)
 
     try:
-        war_obj = await coc_client.get_current_war(
-            clan_obj.tag, cwl_round=cwl_enum_round)
+        war_obj = await clash_responder.fetch_current_war(
+            clan_obj.tag, coc_client, cwl_enum_round)
 
         # specifically for last day of CWl
         if cwl_group is not None:
             # amount of rounds matches the number of rounds
             if len(cwl_group.rounds) == cwl_group.number_of_rounds:
-                last_round_war = await coc_client.get_league_war(cwl_group.rounds[-1][0])
+                last_round_war = await clash_responder.fetch_league_war(
+                    cwl_group.rounds[-1][0], coc_client)
 
                 # last war is either in war or war ended
                 if last_round_war.state != "preparation":
@@ -1287,8 +1292,8 @@ async def clan_role_war_verification(
                     elif cwl_enum_round == WarRound.previous_war:
                         cwl_enum_round = WarRound.current_war
 
-                    war_obj = await coc_client.get_current_war(
-                        clan_obj.tag, cwl_round=cwl_enum_round)
+                    war_obj = await clash_responder.fetch_current_war(
+                        clan_obj.tag, coc_client, cwl_enum_round)
 
     except Maintenance:
         return {
@@ -1403,8 +1408,8 @@ async def clan_role_war_leadership_verification(
     cwl_enum_round = coc_utils.get_war_specified(war_selection, cwl_group)
 
     try:
-        war_obj = await coc_client.get_current_war(
-            clan_obj.tag, cwl_round=cwl_enum_round)
+        war_obj = await clash_responder.fetch_current_war(
+            clan_obj.tag, coc_client, cwl_enum_round)
 
         # specifically for last day of CWl
         if cwl_group is not None:
@@ -1419,8 +1424,8 @@ async def clan_role_war_leadership_verification(
                     elif cwl_enum_round == WarRound.previous_war:
                         cwl_enum_round = WarRound.current_war
 
-                    war_obj = await coc_client.get_current_war(
-                        clan_obj.tag, cwl_round=cwl_enum_round)
+                    war_obj = await clash_responder.fetch_current_war(
+                        clan_obj.tag, coc_client, cwl_enum_round)
 
     except Maintenance:
         return {
@@ -1644,7 +1649,7 @@ async def clan_role_cwl_group_leadership_verification(
     return verification_payload
 
 
-def guild_admin_verification(
+async def guild_admin_verification(
     inter: ApplicationCommandInteraction
 ):
     """
@@ -1657,7 +1662,7 @@ def guild_admin_verification(
                 (verified, embed_list, db_guild, db_author)
     """
 
-    db_guild = db_responder.read_guild(inter.guild.id)
+    db_guild = await db_responder.read_guild(inter.guild.id)
 
     # guild not claimed
     if not db_guild:
@@ -1670,7 +1675,7 @@ def guild_admin_verification(
             'db_author': None
         }
 
-    db_author = db_responder.read_user(inter.author.id)
+    db_author = await db_responder.read_user(inter.author.id)
 
     # author not claimed
     if not db_author:
@@ -181,7 +181,8 @@ async def cwl_lineup_member(
     return field_dict_list
 
 
-async def cwl_clan_score(clan_obj, cwl_group: ClanWarLeagueGroup):
+async def cwl_clan_score(
+        clan_obj, cwl_group: ClanWarLeagueGroup, coc_client):
     if not cwl_group:
         return [{
             'name': f"{clan_obj.name} is not in CWL",
@@ -190,7 +191,7 @@ async def cwl_clan_score(clan_obj, cwl_group: ClanWarLeagueGroup):
 
     scored_members = (
         await clash_responder.cwl_clan_member_scoreboard_list(
-            cwl_group, clan_obj))
+            cwl_group, clan_obj, coc_client))
 
     sorted_scored_members = sorted(
         scored_members, key=lambda member: member.score, reverse=True)
@@ -222,7 +223,7 @@ async def cwl_clan_noatk(clan, cwl_group: ClanWarLeagueGroup,
 
     scored_members = (
         await clash_responder.cwl_clan_member_scoreboard_list(
-            cwl_group, clan))
+            cwl_group, clan, coc_client))
 
     no_atk_members = []
 
@@ -243,7 +244,7 @@ async def cwl_clan_noatk(clan, cwl_group: ClanWarLeagueGroup,
 
     field_dict_list = []
     for member in no_atk_members:
-        player = await coc_client.get_player(member.tag)
+        player = await clash_responder.fetch_player(member.tag, coc_client)
         th_emoji = get_th_emoji(
             player.town_hall, discord_emoji_list, client_emoji_list)
 
@@ -259,7 +260,7 @@ async def cwl_clan_noatk(clan, cwl_group: ClanWarLeagueGroup,
     return field_dict_list
 
 
-async def cwl_member_score(player_obj, cwl_group, clan_tag):
+async def cwl_member_score(player_obj, cwl_group, clan_tag, coc_client):
     if not cwl_group:
         return [{
             'name': f"{player_obj.name} is not in CWL",
@@ -268,7 +269,8 @@ async def cwl_member_score(player_obj, cwl_group, clan_tag):
 
     # get a list of all CWLWar objects
     cwl_wars = []
-    async for war in cwl_group.get_wars_for_clan(clan_tag):
+    for war in await clash_responder.fetch_league_war_list(
+            cwl_group, coc_client, clan_tag):
         if war.state == "warEnded":
             cwl_wars.append(war)
 
@@ -329,7 +331,7 @@ async def cwl_scoreboard_group(
     ended_war_count = 0
     # getting the ended war count
     for war_round in cwl_group.rounds:
-        war = await coc_client.get_league_war(war_round[0])
+        war = await clash_responder.fetch_league_war(war_round[0], coc_client)
 
         if war.state == "warEnded":
             ended_war_count += 1
@@ -339,7 +341,7 @@ async def cwl_scoreboard_group(
 
     for clan in cwl_group.clans:
         clan_scoreboard = await clash_responder.cwl_clan_scoreboard(
-            cwl_group, clan)
+            cwl_group, clan, coc_client)
 
         clan_scoreboards.append(clan_scoreboard)
 
@@ -379,7 +381,7 @@ async def cwl_scoreboard_round(
         "War Star", discord_emoji_list, client_emoji_list)
 
     for war_tag in cwl_round:
-        war = await coc_client.get_league_war(war_tag)
+        war = await clash_responder.fetch_league_war(war_tag, coc_client)
 
         # set opponent war status
         if war.status == "lost":
@@ -430,14 +432,15 @@ async def cwl_scoreboard_clan(
 
     # get a list of all CWLWar objects
     cwl_wars = []
-    async for war in cwl_group.get_wars_for_clan(clan.tag):
+    for war in await clash_responder.fetch_league_war_list(
+            cwl_group, coc_client, clan.tag):
         if war.state == "warEnded":
             cwl_wars.append(war)
 
-    # get a list of all CWLWarMembers their scores
+    # get a list of all CWLWarMembers their scores in one pass
     scored_members = []
-    for member in cwl_clan.members:
-        scored_member = clash_responder.cwl_member_score(cwl_wars, member)
+    for scored_member in clash_responder.cwl_member_score_list(
+            cwl_wars, cwl_clan.members):
 
         if scored_member.participated_wars == 0:
             continue
@@ -451,7 +454,8 @@ async def cwl_scoreboard_clan(
     for scored_member in scored_members:
         position_index += 1
 
-        player = await coc_client.get_player(scored_member.tag)
+        player = await clash_responder.fetch_player(
+            scored_member.tag, coc_client)
         th_emoji = get_th_emoji(
             player.town_hall, discord_emoji_list, client_emoji_list)
         star_emoji = get_emoji(
@@ -109,8 +109,10 @@ async def clan_lineup(
     field_dict_list = []
     return_string = ""
 
-    for member in clan_obj.members:
-        player = await clash_responder.get_player(member.tag, coc_client)
+    player_list = await clash_responder.get_player_list(
+        [member.tag for member in clan_obj.members], coc_client)
+
+    for member, player in zip(clan_obj.members, player_list):
 
         # just in case player returned None
         if player is None:
@@ -153,8 +155,10 @@ async def clan_lineup_member(
 ):
     field_dict_list = []
 
-    for member in clan_obj.members:
-        player = await clash_responder.get_player(member.tag, coc_client)
+    player_list = await clash_responder.get_player_list(
+        [member.tag for member in clan_obj.members], coc_client)
+
+    for member, player in zip(clan_obj.members, player_list):
 
         # just in case player returned None
         if player is None:
@@ -204,8 +208,10 @@ async def clan_lineup_member(
 async def war_preference_clan(
         clan_obj, coc_client, discord_emoji_list, client_emoji_list):
     in_count = 0
-    for member in clan_obj.members:
-        player_obj = await coc_client.get_player(member.tag)
+    player_obj_list = await clash_responder.fetch_player_list(
+        [member.tag for member in clan_obj.members], coc_client)
+
+    for player_obj in player_obj_list:
         if player_obj.war_opted_in:
             in_count += 1
 
@@ -241,8 +247,10 @@ async def war_preference_member(
     in_string = ""
     out_string = ""
 
-    for member in clan_obj.members:
-        player = await coc_client.get_player(member.tag)
+    player_list = await clash_responder.fetch_player_list(
+        [member.tag for member in clan_obj.members], coc_client)
+
+    for player in player_list:
         th_emoji = get_emoji(
             player.town_hall, discord_emoji_list, client_emoji_list)
 
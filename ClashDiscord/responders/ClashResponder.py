@@ -1,8 +1,15 @@
 import re
+import asyncio
 import datetime
 import math
+import time
 from utils import coc_utils
-from coc.errors import Maintenance, NotFound, PrivateWarLog, GatewayError
+from utils.cache_utils import TTLCache
+from coc import WarRound, ClanWar
+from coc.utils import correct_tag
+from coc.errors import (
+    Maintenance, NotFound, PrivateWarLog, GatewayError, Forbidden)
+import data.ClashDiscord_Client_Data as ClashDiscord_Client_Data
 
 
 th_lineup_dict = {
@@ -23,11 +30,109 @@ th_lineup_dict = {
 }
 
 
+# player cache defaults, used when ClashDiscord_Data does not set them
+default_player_cache_ttl = 60
+default_player_cache_max_size = 5000
+
+# player requests in flight at once for member fan outs,
+# used when the coc.py client has no throttle_limit
+default_player_fetch_concurrency = 10
+
+client_data = ClashDiscord_Client_Data.ClashDiscord_Data()
+
+# process wide cache of coc.py player objects keyed by player tag
+player_cache = TTLCache(
+    getattr(client_data, 'player_cache_ttl', default_player_cache_ttl),
+    getattr(client_data, 'player_cache_max_size',
+            default_player_cache_max_size)
+)
+
+# shared by every fan out so concurrent commands stay within the limit,
+# created on first use inside the running event loop
+player_fetch_semaphore = None
+
+# seconds between war poller runs,
+# used when ClashDiscord_Data does not set war_poll_interval
+default_war_poll_interval = 30
+
+# seconds a war snapshot is kept by war state,
+# the poller fetches the war again once they pass
+war_refresh_interval_dict = {
+    'preparation': 600,
+    'inWar': 60,
+    'warEnded': 900,
+    'notInWar': 900
+}
+
+# seconds a cwl group is kept by group state, None if not in cwl
+cwl_group_refresh_interval_dict = {
+    'preparation': 600,
+    'inWar': 600,
+    'ended': 1800,
+    None: 900
+}
+
+war_poll_interval = getattr(
+    client_data, 'war_poll_interval', default_war_poll_interval)
+
+# seconds between syncing the clans watched for clan events
+# with the claimed clans,
+# used when ClashDiscord_Data does not set clan_event_sync_interval
+default_clan_event_sync_interval = 300
+
+clan_event_sync_interval = getattr(
+    client_data, 'clan_event_sync_interval',
+    default_clan_event_sync_interval)
+
+# (clan tag, coc.py WarRound): coc.py war object, None if not in war
+war_cache = TTLCache(war_refresh_interval_dict['inWar'])
+
+# clan tag: coc.py cwl group object, None if not in cwl
+cwl_group_cache = TTLCache(cwl_group_refresh_interval_dict[None])
+
+# seconds an ended cwl war is kept, ended wars do not change
+# so they are kept for the rest of the season
+cwl_ended_war_ttl = 14 * 24 * 60 * 60
+
+# war tag: cwl war api data, shared by every cwl command
+# and turned into a war object for the requesting clan
+cwl_war_cache = TTLCache(war_refresh_interval_dict['inWar'], 20000)
+
+# clan tag: monotonic time the poller fetches the clan's war
+# and cwl group again
+war_poll_dict = {}
+cwl_group_poll_dict = {}
+
+# clan tag: end times of the ended wars that have been stored
+war_ended_dict = {}
+
+
 # Player
 
+async def fetch_player(player_tag, coc_client):
+    """
+        returns the cached player for player_tag or fetches it,
+        concurrent fetches of the same tag share one request
+
+        Args:
+            player_tag (str): player tag
+            coc_client (obj): coc.py client
+
+        Raises:
+            Maintenance, NotFound, GatewayError: as raised by coc.py,
+                failed fetches are not cached
+
+        Returns:
+            obj: coc.py player object
+    """
+
+    return await player_cache.get_or_load(
+        correct_tag(player_tag), coc_client.get_player, player_tag)
+
+
 async def get_player(player_tag, coc_client):
     try:
-        player_obj = await coc_client.get_player(player_tag)
+        player_obj = await fetch_player(player_tag, coc_client)
 
     except Maintenance:
         return None
@@ -41,6 +146,81 @@ async def get_player(player_tag, coc_client):
     return player_obj
 
 
+def forget_player(player_tag):
+    """
+        drops the cached player for player_tag,
+        the next get fetches the player
+
+        Args:
+            player_tag (str): player tag
+    """
+
+    player_cache.pop(correct_tag(player_tag))
+
+
+def get_player_fetch_semaphore(coc_client):
+    """
+        returns the semaphore bounding member fan out requests,
+        sized to the coc.py client's throttle limit
+    """
+    global player_fetch_semaphore
+
+    if player_fetch_semaphore is None:
+        player_fetch_semaphore = asyncio.Semaphore(getattr(
+            coc_client, 'throttle_limit', default_player_fetch_concurrency))
+
+    return player_fetch_semaphore
+
+
+async def fetch_player_list(player_tag_list, coc_client):
+    """
+        fetches players concurrently with bounded concurrency
+        and returns them in player_tag_list order
+
+        Args:
+            player_tag_list (list): list of player tags
+            coc_client (obj): coc.py client
+
+        Raises:
+            Maintenance, NotFound, GatewayError: as raised by coc.py
+
+        Returns:
+            list: coc.py player objects
+    """
+
+    semaphore = get_player_fetch_semaphore(coc_client)
+
+    async def fetch_player_limited(player_tag):
+        async with semaphore:
+            return await fetch_player(player_tag, coc_client)
+
+    return await asyncio.gather(
+        *(fetch_player_limited(player_tag) for player_tag in player_tag_list))
+
+
+async def get_player_list(player_tag_list, coc_client):
+    """
+        gets players concurrently with bounded concurrency
+        and returns them in player_tag_list order
+
+        Args:
+            player_tag_list (list): list of player tags
+            coc_client (obj): coc.py client
+
+        Returns:
+            list: coc.py player objects, None for players not found
+    """
+
+    semaphore = get_player_fetch_semaphore(coc_client)
+
+    async def get_player_limited(player_tag):
+        async with semaphore:
+            return await get_player(player_tag, coc_client)
+
+    return await asyncio.gather(
+        *(get_player_limited(player_tag) for player_tag in player_tag_list))
+
+
 async def verify_token(api_key, player_tag, coc_client):
     try:
         player_obj = await coc_client.verify_player_token(player_tag, api_key)
@@ -487,11 +667,50 @@ async def get_clan(clan_tag, coc_client):
     return clan_obj
 
 
+async def get_clan_member_dict(clan_tag_list, coc_client):
+    """
+        gets every clan in clan_tag_list concurrently with bounded
+        concurrency and indexes their members by player tag
+
+        Args:
+            clan_tag_list (list): list of clan tags
+            coc_client (obj): coc.py client
+
+        Returns:
+            dict: player tag: coc.py clan member object,
+                member.clan being the fetched clan,
+                clans not found are left out
+    """
+
+    semaphore = get_player_fetch_semaphore(coc_client)
+
+    async def get_clan_limited(clan_tag):
+        async with semaphore:
+            return await get_clan(clan_tag, coc_client)
+
+    clan_obj_list = await asyncio.gather(
+        *(get_clan_limited(clan_tag)
+          for clan_tag in dict.fromkeys(clan_tag_list)))
+
+    clan_member_dict = {}
+    for clan_obj in clan_obj_list:
+        # clan was not found
+        if clan_obj is None:
+            continue
+
+        for clan_member in clan_obj.members:
+            clan_member_dict[clan_member.tag] = clan_member
+
+    return clan_member_dict
+
+
 async def clan_lineup(clan_obj, coc_client):
     clan_lineup_dict = th_lineup_dict.copy()
 
-    for member in clan_obj.members:
-        player_obj = await coc_client.get_player(member.tag)
+    player_obj_list = await fetch_player_list(
+        [member.tag for member in clan_obj.members], coc_client)
+
+    for player_obj in player_obj_list:
         clan_lineup_dict[player_obj.town_hall] += 1
 
     return clan_lineup_dict
@@ -543,9 +762,10 @@ async def donation(clan_obj, unit_name, coc_client):
 
     # get a member list to make less overall responses
     member_list = []
-    for member in clan_obj.members:
-        player_obj = await coc_client.get_player(member.tag)
+    player_obj_list = await fetch_player_list(
+        [member.tag for member in clan_obj.members], coc_client)
 
+    for player_obj in player_obj_list:
         # checking if they have the specified unit
         unit_obj = find_player_unit(player_obj, unit_name)
         if unit_obj:
@@ -609,8 +829,14 @@ async def active_super_troop_search(clan_obj, super_troop_name, coc_client):
 
     donor_list = []
     # getting a list of members with the given super_troop activated
-    for clan_member_obj in clan_obj.members:
-        member_obj = await get_player(clan_member_obj.tag, coc_client)
+    member_obj_list = await get_player_list(
+        [clan_member_obj.tag for clan_member_obj in clan_obj.members],
+        coc_client)
+
+    for member_obj in member_obj_list:
+        # player returned None
+        if member_obj is None:
+            continue
         active_super_troop = member_obj.get_troop(super_troop_name)
         if not active_super_troop:
             continue
@@ -621,9 +847,72 @@ async def active_super_troop_search(clan_obj, super_troop_name, coc_client):
 
 # War
 
+def war_refresh_interval(war_obj):
+    """
+        returns seconds to keep war_obj before fetching it again,
+        based on war state and cut short when preparation
+        or battle day is about to end
+
+        Args:
+            war_obj (obj): coc.py war object, None if not in war
+
+        Returns:
+            float: seconds until the war is fetched again
+    """
+
+    if war_obj is None:
+        return war_refresh_interval_dict['notInWar']
+
+    refresh_interval = war_refresh_interval_dict.get(
+        war_obj.state, war_refresh_interval_dict['notInWar'])
+
+    # fetch again as the war changes state
+    if war_obj.state == "preparation":
+        state_end_time = war_obj.start_time
+    elif war_obj.state == "inWar":
+        state_end_time = war_obj.end_time
+    else:
+        state_end_time = None
+
+    if state_end_time is not None:
+        refresh_interval = min(
+            refresh_interval,
+            max(state_end_time.seconds_until, war_poll_interval))
+
+    return refresh_interval
+
+
+async def fetch_current_war(
+        clan_tag, coc_client, cwl_round=WarRound.current_war):
+    """
+        returns the war snapshot for clan_tag and cwl_round or fetches it,
+        concurrent fetches of the same war share one request
+
+        Args:
+            clan_tag (str): clan tag
+            coc_client (obj): coc.py client
+            cwl_round (enum): coc.py WarRound
+
+        Raises:
+            Maintenance, NotFound, PrivateWarLog, GatewayError:
+                as raised by coc.py, failed fetches are not cached
+
+        Returns:
+            obj: coc.py war object, None if not in war
+    """
+
+    async def load_current_war():
+        return await coc_client.get_current_war(
+            clan_tag, cwl_round=cwl_round)
+
+    return await war_cache.get_or_load(
+        (correct_tag(clan_tag), cwl_round), load_current_war,
+        ttl=war_refresh_interval)
+
+
 async def get_war(clan_tag, coc_client):
     try:
-        war_obj = await coc_client.get_current_war(clan_tag)
+        war_obj = await fetch_current_war(clan_tag, coc_client)
 
     except Maintenance:
         return None
@@ -693,11 +982,221 @@ def war_no_attack(war_obj, missed_attack_count):
     return no_attack_members
 
 
+def find_ended_war_list(clan_tag, war_list):
+    """
+        returns the ended wars in war_list
+        that have not been stored for clan_tag
+
+        Args:
+            clan_tag (str): clan tag
+            war_list (list): list of coc.py war objects
+
+        Returns:
+            list: list of ended coc.py war objects not yet stored
+    """
+
+    ended_time_set = war_ended_dict.get(clan_tag, set())
+
+    ended_war_list = []
+    for war_obj in war_list:
+        if war_obj is None or war_obj.state != "warEnded":
+            continue
+
+        if war_obj.end_time.time in ended_time_set:
+            continue
+
+        ended_war_list.append(war_obj)
+
+    return ended_war_list
+
+
+def mark_ended_war(war_obj):
+    """
+        keeps the poller from returning an ended war again,
+        used once the war has been stored
+
+        Args:
+            war_obj (obj): coc.py war object
+    """
+
+    war_ended_dict.setdefault(
+        war_obj.clan.tag, set()).add(war_obj.end_time.time)
+
+
+async def poll_war(clan_tag, coc_client):
+    """
+        fetches the cwl group and current war of a clan
+        past their snapshots and stores them
+
+        Args:
+            clan_tag (str): clan tag
+            coc_client (obj): coc.py client
+
+        Raises:
+            Maintenance, NotFound, PrivateWarLog, GatewayError:
+                as raised by coc.py
+
+        Returns:
+            list: list of ended coc.py war objects not yet stored
+    """
+
+    semaphore = get_player_fetch_semaphore(coc_client)
+    cwl_war_list = []
+
+    # cwl groups change less often than wars
+    if cwl_group_poll_dict.get(clan_tag, 0) <= time.monotonic():
+        async with semaphore:
+            cwl_group = await load_cwl_group(clan_tag, coc_client)
+        refresh_interval = cwl_group_refresh_interval(cwl_group)
+
+        # kept past the next poll so commands never miss
+        cwl_group_cache.set(
+            clan_tag, cwl_group, ttl=refresh_interval + war_poll_interval)
+        cwl_group_poll_dict[clan_tag] = time.monotonic() + refresh_interval
+
+        # cwl rounds end while the next round is shown,
+        # ended rounds come from the cwl war store
+        if cwl_group is not None:
+            cwl_war_list = await fetch_league_war_list(
+                cwl_group, coc_client, clan_tag)
+
+    else:
+        cwl_group = cwl_group_cache.get(clan_tag)
+
+    # the war commands show when no war is selected
+    cwl_round = coc_utils.get_war_specified(None, cwl_group)
+
+    async with semaphore:
+        war_obj = await coc_client.get_current_war(
+            clan_tag, cwl_round=cwl_round)
+    refresh_interval = war_refresh_interval(war_obj)
+
+    war_cache.set(
+        (clan_tag, cwl_round), war_obj,
+        ttl=refresh_interval + war_poll_interval)
+    war_poll_dict[clan_tag] = time.monotonic() + refresh_interval
+
+    return find_ended_war_list(clan_tag, cwl_war_list + [war_obj])
+
+
+async def poll_war_list(clan_tag_list, coc_client):
+    """
+        refreshes the war snapshots of every clan in clan_tag_list
+        that is due, clans missing from the list are no longer polled
+
+        Args:
+            clan_tag_list (list): list of claimed clan tags
+            coc_client (obj): coc.py client
+
+        Returns:
+            list: list of ended coc.py war objects not yet stored,
+                a clan that fails is left out and polled again
+                after war_poll_interval
+    """
+
+    clan_tag_set = set(correct_tag(clan_tag) for clan_tag in clan_tag_list)
+
+    # clans that were unclaimed are dropped
+    for poll_dict in (war_poll_dict, cwl_group_poll_dict, war_ended_dict):
+        for clan_tag in list(poll_dict):
+            if clan_tag not in clan_tag_set:
+                del poll_dict[clan_tag]
+
+    poll_time = time.monotonic()
+
+    async def poll_war_safe(clan_tag):
+        try:
+            return await poll_war(clan_tag, coc_client)
+
+        # try again after the poll interval
+        except (Maintenance, GatewayError):
+            war_poll_dict[clan_tag] = time.monotonic() + war_poll_interval
+
+        # try again once a clan not in war would be
+        except (NotFound, PrivateWarLog):
+            war_poll_dict[clan_tag] = (
+                time.monotonic() + war_refresh_interval_dict['notInWar'])
+
+        # one clan failing does not stop the other clans' polls,
+        # try again after the poll interval
+        except Exception as arg:
+            print(f"war poll failed for {clan_tag}: {arg}")
+            war_poll_dict[clan_tag] = time.monotonic() + war_poll_interval
+
+        return []
+
+    ended_war_list_list = await asyncio.gather(*(
+        poll_war_safe(clan_tag) for clan_tag in clan_tag_set
+        if war_poll_dict.get(clan_tag, 0) <= poll_time
+    ))
+
+    ended_war_list = []
+    for clan_ended_war_list in ended_war_list_list:
+        ended_war_list.extend(clan_ended_war_list)
+    return ended_war_list
+
+
 # CWL Group
 
+def cwl_group_refresh_interval(cwl_group):
+    """
+        returns seconds to keep cwl_group before fetching it again
+
+        Args:
+            cwl_group (obj): coc.py cwl group object, None if not in cwl
+
+        Returns:
+            float: seconds until the cwl group is fetched again
+    """
+
+    if cwl_group is None:
+        return cwl_group_refresh_interval_dict[None]
+
+    return cwl_group_refresh_interval_dict.get(
+        cwl_group.state, cwl_group_refresh_interval_dict[None])
+
+
+async def load_cwl_group(clan_tag, coc_client):
+    """
+        fetches the cwl group for clan_tag, None if not in cwl
+
+        Raises:
+            Maintenance, GatewayError: as raised by coc.py
+    """
+
+    try:
+        return await coc_client.get_league_group(clan_tag)
+
+    # clan is not in cwl
+    except NotFound:
+        return None
+
+
+async def fetch_cwl_group(clan_tag, coc_client):
+    """
+        returns the cwl group snapshot for clan_tag or fetches it,
+        concurrent fetches of the same group share one request
+
+        Args:
+            clan_tag (str): clan tag
+            coc_client (obj): coc.py client
+
+        Raises:
+            Maintenance, GatewayError: as raised by coc.py,
+                failed fetches are not cached
+
+        Returns:
+            obj: coc.py cwl group object, None if not in cwl
+    """
+
+    return await cwl_group_cache.get_or_load(
+        correct_tag(clan_tag), load_cwl_group, clan_tag, coc_client,
+        ttl=cwl_group_refresh_interval)
+
+
 async def get_cwl_group(clan_tag, coc_client):
     try:
-        cwl_group = await coc_client.get_league_group(clan_tag)
+        cwl_group = await fetch_cwl_group(clan_tag, coc_client)
 
     except Maintenance:
         return None
@@ -719,6 +1218,26 @@ def cwl_clan_lineup(cwl_group_clan):
 
 
 def cwl_member_score(cwl_wars, cwl_member):
+    """
+        returns the ScoredCWLMember for cwl_member over cwl_wars
+    """
+
+    return cwl_member_score_list(cwl_wars, [cwl_member])[0]
+
+
+def cwl_member_score_list(cwl_wars, cwl_member_list):
+    """
+        scores every member of cwl_member_list over cwl_wars,
+        indexing each war's members and defenders by tag once
+
+        Args:
+            cwl_wars (list): list of coc.py cwl war objects
+            cwl_member_list (list): list of objects with tag and name
+
+        Returns:
+            list: list of ScoredCWLMember in cwl_member_list order
+    """
+
     class ScoredCWLMember(object):
         """
             ScoredWarMember
@@ -750,16 +1269,19 @@ def cwl_member_score(cwl_wars, cwl_member):
             self.round_scores = round_scores
             self.score = score
 
-    scored_member = ScoredCWLMember(
-        tag=cwl_member.tag,
-        name=cwl_member.name,
-        participated_wars=0,
-        potential_attack_count=0,
-        attack_count=0,
-        stars=0,
-        destruction=0,
-        round_scores=[],
-        score=0)
+    scored_member_list = []
+    for cwl_member in cwl_member_list:
+        scored_member_list.append(ScoredCWLMember(
+            tag=cwl_member.tag,
+            name=cwl_member.name,
+            participated_wars=0,
+            potential_attack_count=0,
+            attack_count=0,
+            stars=0,
+            destruction=0,
+            round_scores=[],
+            score=0))
+
     # for each war getting that war score and war count
     for war in cwl_wars:
         # do not include wars that are not even in preparation
@@ -770,49 +1292,59 @@ def cwl_member_score(cwl_wars, cwl_member):
         if war.state != "warEnded":
             continue
 
-        round_score = 0
-        for war_member in war.clan.members:
-            if war_member.tag == cwl_member.tag:
+        # tag: WarMember for the war clan and its opponent
+        war_member_dict = {
+            war_member.tag: war_member for war_member in war.clan.members}
+        defender_dict = {
+            defender.tag: defender for defender in war.opponent.members}
+
+        for scored_member in scored_member_list:
+            round_score = 0
+            war_member = war_member_dict.get(scored_member.tag)
+
+            if war_member is not None:
                 scored_member.participated_wars += 1
                 scored_member.potential_attack_count += 1
 
-                war_member_score = member_score(war_member, war)
+                war_member_score = member_score(
+                    war_member, war, defender_dict)
                 round_score = war_member_score.score
                 scored_member.attack_count += war_member_score.attack_count
                 scored_member.stars += war_member_score.stars
                 scored_member.destruction += war_member_score.destruction
 
-                break
+            scored_member.round_scores.append(round_score)
 
-        scored_member.round_scores.append(round_score)
+    for scored_member in scored_member_list:
+        # skip if member did not participate
+        if scored_member.participated_wars == 0:
+            continue
 
-    # return without operating if member did not participate
-    if scored_member.participated_wars == 0:
-        return scored_member
+        score_sum = 0
+        for round_score in scored_member.round_scores:
+            score_sum += round_score
 
-    score_sum = 0
-    for round_score in scored_member.round_scores:
-        score_sum += round_score
+        avg_score = score_sum / scored_member.participated_wars
 
-    avg_score = score_sum / scored_member.participated_wars
+        # there have been 2 or more completed wars
+        if len(cwl_wars) >= 2:
+            participation_multiplier = math.log(
+                scored_member.participated_wars, len(cwl_wars))
 
-    # there have been 2 or more completed wars
-    if len(cwl_wars) >= 2:
-        participation_multiplier = math.log(
-            scored_member.participated_wars, len(cwl_wars))
+        # there have only been 0-1 wars
+        else:
+            participation_multiplier = 1
 
-    # there have only been 0-1 wars
-    else:
-        participation_multiplier = 1
+        scored_member.score = avg_score * participation_multiplier
 
-    scored_member.score = avg_score * participation_multiplier
-    return scored_member
+    return scored_member_list
 
 
-async def cwl_clan_member_scoreboard_list(cwl_group, clan_obj):
+async def cwl_clan_member_scoreboard_list(cwl_group, clan_obj, coc_client):
     # get a list of all CWLWar objects
     cwl_wars = []
-    async for war in cwl_group.get_wars_for_clan(clan_obj.tag):
+    for war in await fetch_league_war_list(
+            cwl_group, coc_client, clan_obj.tag):
         if war.state == "warEnded":
             cwl_wars.append(war)
 
@@ -822,17 +1354,16 @@ async def cwl_clan_member_scoreboard_list(cwl_group, clan_obj):
             cwl_clan = clan
             break
 
-    # get a list of all CWLWarMembers their scores
+    # get a list of all CWLWarMembers their scores in one pass
     scored_members = []
-    for member in cwl_clan.members:
-        scored_member = cwl_member_score(cwl_wars, member)
+    for scored_member in cwl_member_score_list(cwl_wars, cwl_clan.members):
         if scored_member.participated_wars != 0:
             scored_members.append(scored_member)
 
     return scored_members
 
 
-async def cwl_clan_scoreboard(cwl_group, clan):
+async def cwl_clan_scoreboard(cwl_group, clan, coc_client):
     class CWLScoreboardClan(object):
         """
             ScoredWarMember
@@ -849,7 +1380,7 @@ async def cwl_clan_scoreboard(cwl_group, clan):
 
     clan_stars = 0
     clan_destruction = 0
-    async for war in cwl_group.get_wars_for_clan(clan.tag):
+    for war in await fetch_league_war_list(cwl_group, coc_client, clan.tag):
         if war.state == "warEnded":
             clan_stars += war.clan.stars
             clan_destruction += war.clan.destruction
@@ -877,10 +1408,153 @@ def cwl_current_round(cwl_group, cwl_war):
 
 # CWL War
 
+def cwl_war_refresh_interval(war_obj):
+    """
+        returns seconds to keep a cwl war before fetching it again,
+        ended wars are kept for the season
+
+        Args:
+            war_obj (obj): coc.py cwl war object
+
+        Returns:
+            float: seconds until the war is fetched again
+    """
+
+    if war_obj.state == "warEnded":
+        return cwl_ended_war_ttl
+
+    return war_refresh_interval(war_obj)
+
+
+async def fetch_league_war_data(war_tag, coc_client):
+    """
+        fetches the api data of a cwl war,
+        the same data coc.py get_league_war builds its war from
+
+        Args:
+            war_tag (str): cwl war tag
+            coc_client (obj): coc.py client
+
+        Raises:
+            Maintenance, NotFound, GatewayError, PrivateWarLog:
+                as raised by coc.py get_league_war
+
+        Returns:
+            dict: cwl war api data
+    """
+
+    war_tag = correct_tag(war_tag)
+
+    try:
+        war_data = await coc_client.http.get_cwl_wars(war_tag)
+    except Forbidden as exception:
+        raise PrivateWarLog(
+            exception.response, exception.reason) from exception
+
+    # the api does not return the war tag, coc.py sets it the same way
+    war_data["tag"] = war_tag
+    return war_data
+
+
+def orient_league_war(war_data, clan_tag, coc_client):
+    """
+        returns a coc.py cwl war built from war_data
+        seen from clan_tag's side,
+        coc.py swaps clan and opponent so every war clan
+        and war member is_opponent flag matches the side
+
+        Args:
+            war_data (dict): cwl war api data
+            clan_tag (str): clan tag to set as war clan,
+                None to keep the api's war clan
+            coc_client (obj): coc.py client
+
+        Returns:
+            obj: coc.py cwl war object
+    """
+
+    if clan_tag is None:
+        clan_tag = war_data.get("clan", {}).get("tag")
+    else:
+        clan_tag = correct_tag(clan_tag)
+
+    return ClanWar(data=war_data, client=coc_client, clan_tag=clan_tag)
+
+
+async def fetch_league_war(war_tag, coc_client, clan_tag=None):
+    """
+        returns the cached cwl war for war_tag or fetches it,
+        ended wars are fetched once per season and in progress wars
+        are refreshed like current wars
+
+        Args:
+            war_tag (str): cwl war tag
+            coc_client (obj): coc.py client
+            clan_tag (str): clan tag to set as war clan
+
+        Raises:
+            Maintenance, NotFound, GatewayError: as raised by coc.py,
+                failed fetches are not cached
+
+        Returns:
+            obj: coc.py cwl war object
+    """
+
+    # the api data is cached once for both clans of the war
+    war_data = await cwl_war_cache.get_or_load(
+        war_tag, fetch_league_war_data, war_tag, coc_client,
+        ttl=lambda loaded_war_data: cwl_war_refresh_interval(
+            orient_league_war(loaded_war_data, None, coc_client)))
+
+    return orient_league_war(war_data, clan_tag, coc_client)
+
+
+async def fetch_league_war_list(cwl_group, coc_client, clan_tag=None):
+    """
+        fetches the wars of cwl_group concurrently in round order,
+        only the wars clan_tag is in if clan_tag is given
+
+        Args:
+            cwl_group (obj): coc.py cwl group object
+            coc_client (obj): coc.py client
+            clan_tag (str): clan tag to filter and set as war clan
+
+        Raises:
+            Maintenance, NotFound, GatewayError: as raised by coc.py
+
+        Returns:
+            list: list of coc.py cwl war objects
+    """
+
+    semaphore = get_player_fetch_semaphore(coc_client)
+
+    async def fetch_league_war_limited(war_tag):
+        async with semaphore:
+            return await fetch_league_war(war_tag, coc_client, clan_tag)
+
+    war_tag_list = []
+    for cwl_round in cwl_group.rounds:
+        for war_tag in cwl_round:
+            # rounds that are not in preparation yet
+            if war_tag == "#0":
+                continue
+
+            war_tag_list.append(war_tag)
+
+    war_list = await asyncio.gather(*(
+        fetch_league_war_limited(war_tag) for war_tag in war_tag_list))
+
+    if clan_tag is None:
+        return list(war_list)
+
+    # oriented wars have the clan as war clan
+    clan_tag = correct_tag(clan_tag)
+    return [war for war in war_list if war.clan.tag == clan_tag]
+
 
 # UTILS
 
-def member_score(war_member, war_obj):
+def member_score(war_member, war_obj, defender_dict=None):
     class ScoredWarMember(object):
         """
             ScoredWarMember
@@ -924,7 +1598,8 @@ def member_score(war_member, war_obj):
         # add 100 since the member attacked
         member_score += 100
 
-        scored_attack = attack_score(attack, war_member, war_obj)
+        scored_attack = attack_score(
+            attack, war_member, war_obj, defender_dict)
 
         attack_count += 1
         stars += scored_attack.stars
@@ -942,7 +1617,7 @@ def member_score(war_member, war_obj):
     )
 
 
-def attack_score(attack, war_member, war_obj):
+def attack_score(attack, war_member, war_obj, defender_dict=None):
     class ScoredWarAttack(object):
         """
             ScoredWarAttack
@@ -959,7 +1634,13 @@ def attack_score(attack, war_member, war_obj):
 
     star_score = attack.stars/3
     des_score = attack.destruction/100
-    defender = find_defender(war_obj.opponent, attack.defender_tag)
+
+    # defender_dict is the opponent's members by tag when scoring many
+    if defender_dict is None:
+        defender = find_defender(war_obj.opponent, attack.defender_tag)
+    else:
+        defender = defender_dict.get(attack.defender_tag)
+
     th_difference = defender.town_hall-war_member.town_hall
     attack_score = (((star_score*.75)+(des_score*.25))
                     * th_multiplier(th_difference))
@@ -1,10 +1,13 @@
+import asyncio
+import time
 from disnake import (
     ApplicationCommandInteraction,
     TextChannel,
     Member,
     Embed,
     Color,
-    User
+    User,
+    HTTPException
 )
 from coc import (
     Client as CocClient,
@@ -24,9 +27,36 @@ from responders import (
 )
 import data.ClashDiscord_Client_Data as ClashDiscord_Client_Data
 from data.th_urls import get_th_url
+from views.page_view import PageView
 from disnake.utils import get
 
 
+# role sync limits for update_roles_guild
+# members being updated at once
+role_sync_member_concurrency = 20
+# member edit requests in flight at once
+role_sync_edit_concurrency = 2
+
+# nickname sync limits for update_nickname_guild
+# member edit requests in flight at once
+nickname_sync_edit_concurrency = 2
+
+# seconds between scheduled role reconciliation passes,
+# used when ClashDiscord_Data does not set role_reconcile_interval
+default_role_reconcile_interval = 3600
+
+role_reconcile_interval = getattr(
+    ClashDiscord_Client_Data.ClashDiscord_Data(),
+    'role_reconcile_interval', default_role_reconcile_interval)
+
+# least seconds between progress message edits of guild wide runs
+progress_edit_interval = 5
+
+# discord guild id: (guild role fingerprint,
+#   {discord user id: member role fingerprint}) from the last guild sync
+role_fingerprint_dict = {}
+
+
 # DISCORD
 
 def embed_message(
@@ -366,6 +396,177 @@ async def send_embed_list(
 
         return False
 
+
+async def send_embed_page_list(
+        inter: ApplicationCommandInteraction,
+        embed_list: list):
+    """
+        sends embed_list as one message,
+        showing one embed per page if there is more than one
+
+        Args:
+            inter (ApplicationCommandInteraction): interaction to respond to
+            embed_list (list): disnake embeds
+    """
+
+    if len(embed_list) == 1:
+        view = None
+    else:
+        view = PageView(embed_list, inter.author)
+
+    try:
+        if view is None:
+            await inter.send(embed=embed_list[0])
+        else:
+            await inter.send(embed=embed_list[0], view=view)
+
+    # interaction tokens expire after 15 minutes,
+    # long runs send to the channel instead
+    except HTTPException:
+        if view is None:
+            await inter.channel.send(embed=embed_list[0])
+        else:
+            await inter.channel.send(embed=embed_list[0], view=view)
+
+
+class ProgressReport(object):
+    """
+        ProgressReport: running counts of a guild wide run kept in one
+            progress message, and the changes and failures
+            sent as one summary when the run finishes
+
+            Instance Attributes
+                inter (ApplicationCommandInteraction): interaction
+                    the progress message belongs to
+                description (str): what the run is doing
+                member_count (int): members in the run
+                updated_count (int): members finished
+                changed_count (int): members changed
+                failed_count (int): members with failures
+                changed_field_dict_list (list): field dicts of changes
+                failed_field_dict_list (list): field dicts of failures
+                edit_interval (float): least seconds between edits
+                last_edit_time (float): monotonic time of the last edit
+                finished (bool): run has finished
+    """
+
+    def __init__(
+        self, inter, description, member_count,
+        edit_interval=progress_edit_interval
+    ):
+        self.inter = inter
+        self.description = description
+        self.member_count = member_count
+        self.updated_count = 0
+        self.changed_count = 0
+        self.failed_count = 0
+        self.changed_field_dict_list = []
+        self.failed_field_dict_list = []
+        self.edit_interval = edit_interval
+        self.last_edit_time = None
+        self.finished = False
+
+    def progress_string(self):
+        """
+            returns the progress message description
+        """
+
+        if self.finished:
+            status_string = f"{self.description} complete"
+        else:
+            status_string = f"{self.description}"
+
+        return (f"{status_string} "
+                f"{self.updated_count}/{self.member_count}\n"
+                f"changed {self.changed_count}, "
+                f"failed {self.failed_count}")
+
+    async def add(self, changed_field_dict_list, failed_field_dict_list):
+        """
+            counts a finished member and edits the progress message
+            if edit_interval has passed since the last edit
+
+            Args:
+                changed_field_dict_list (list): field dicts of changes
+                failed_field_dict_list (list): field dicts of failures
+        """
+
+        self.updated_count += 1
+
+        if len(changed_field_dict_list) != 0:
+            self.changed_count += 1
+            self.changed_field_dict_list.extend(changed_field_dict_list)
+
+        if len(failed_field_dict_list) != 0:
+            self.failed_count += 1
+            self.failed_field_dict_list.extend(failed_field_dict_list)
+
+        await self.edit()
+
+    async def edit(self, force=False):
+        """
+            edits the progress message with the running counts
+
+            Args:
+                force (bool): edit even if edit_interval has not passed
+        """
+
+        edit_time = time.monotonic()
+
+        if (not force and self.last_edit_time is not None
+                and edit_time - self.last_edit_time < self.edit_interval):
+            return
+
+        # set before editing so members finishing
+        # during the edit do not edit as well
+        self.last_edit_time = edit_time
+
+        embed_list = embed_message(
+            icon_url=self.inter.bot.user.avatar.url,
+            description=self.progress_string(),
+            bot_user_name=self.inter.me.display_name,
+            author=self.inter.author
+        )
+
+        # progress is informational, the run continues without it
+        try:
+            await self.inter.edit_original_message(embeds=embed_list)
+        except HTTPException:
+            pass
+
+    async def finish(self, summary_title):
+        """
+            shows the final counts and sends the summary
+            of changes and failures
+
+            Args:
+                summary_title (str): summary embed title
+        """
+
+        self.finished = True
+        await self.edit(force=True)
+
+        field_dict_list = (
+            self.changed_field_dict_list + self.failed_field_dict_list)
+
+        if len(field_dict_list) == 0:
+            field_dict_list.append({
+                "name": "no changes",
+                "value": f"{self.member_count} members checked"
+            })
+
+        embed_list = embed_message(
+            icon_url=self.inter.bot.user.avatar.url,
+            title=summary_title,
+            description=self.progress_string(),
+            bot_user_name=self.inter.me.display_name,
+            field_list=field_dict_list,
+            author=self.inter.author
+        )
+
+        await send_embed_page_list(self.inter, embed_list)
+
+
 # town hall urls
 
 
@@ -484,7 +685,7 @@ def get_clan_war_league_emoji(coc_name, discord_emoji_list, client_emoji_list):
 
 # user
 
-def find_user_from_tag(player_obj, member_list):
+async def find_user_from_tag(player_obj, member_list):
     """
         finding a user from a requested player
 
@@ -496,31 +697,63 @@ def find_user_from_tag(player_obj, member_list):
             list: field_dict_list
     """
 
-    db_user_obj = db_responder.read_user_from_tag(player_obj.tag)
-    # user with requested player tag not found
-    if not db_user_obj:
-        return {
-            "name": f"{player_obj.name} {player_obj.tag}",
-            "value": (f"linked user not found")
-        }
+    field_dict_list = await find_user_list_from_tag(
+        [player_obj], member_list)
+
+    return field_dict_list[0]
+
+
+async def find_user_list_from_tag(player_obj_list, member_list):
+    """
+        finding the user for each requested player
+        with one db query for all players
+
+        Args:
+            player_obj_list (list): list of clash player objects
+            member_list (list): list of members in server
 
-    # find user in guild
-    user_obj = get(member_list, id=db_user_obj.discord_id)
+        Returns:
+            list: field_dict_list in player_obj_list order
+    """
+
+    db_user_dict = await db_responder.read_user_dict_from_tag_list(
+        [player_obj.tag for player_obj in player_obj_list])
+
+    # member lookups by id for this call
+    member_dict = {member.id: member for member in member_list}
+
+    field_dict_list = []
+    for player_obj in player_obj_list:
+        db_user_obj = db_user_dict.get(player_obj.tag)
+
+        # user with requested player tag not found
+        if not db_user_obj:
+            field_dict_list.append({
+                "name": f"{player_obj.name} {player_obj.tag}",
+                "value": (f"linked user not found")
+            })
+            continue
+
+        # find user in guild
+        user_obj = member_dict.get(db_user_obj.discord_id)
 
-    # user not found in guild
-    if not user_obj:
-        return {
+        # user not found in guild
+        if not user_obj:
+            field_dict_list.append({
+                "name": f"{player_obj.name} {player_obj.tag}",
+                "value": (f"linked user not in server")
+            })
+            continue
+
+        field_dict_list.append({
             "name": f"{player_obj.name} {player_obj.tag}",
-            "value": (f"linked user not in server")
-        }
+            "value": f"claimed by {user_obj.mention}"
+        })
 
-    return {
-        "name": f"{player_obj.name} {player_obj.tag}",
-        "value": f"claimed by {user_obj.mention}"
-    }
+    return field_dict_list
 
 
-def user_player_ping(player, member_list):
+async def user_player_ping(player, member_list):
     """
         turning a player into a user ping
 
@@ -533,22 +766,103 @@ def user_player_ping(player, member_list):
             string: returns user ping if possible and player info
     """
 
-    db_user = db_responder.read_user_from_tag(player.tag)
+    ping_list = await user_player_ping_list([player], member_list)
 
-    if db_user is None:
-        return f"{player.name} {player.tag}"
+    return ping_list[0]
 
-    user = get(member_list, id=db_user.discord_id)
 
-    if user is None:
-        return f"{player.name} {player.tag}"
+async def user_player_ping_list(player_list, member_list):
+    """
+        turning each player into a user ping
+        with one db query for all players
 
-    return f"{user.mention} ({player.name} {player.tag})"
+        Args:
+            player_list (list): list of clash player objects
+                requires player.name and player.tag
+            member_list (list): list of members in server
+
+        Returns:
+            list: user ping if possible and player info
+                in player_list order
+    """
+
+    db_user_dict = await db_responder.read_user_dict_from_tag_list(
+        [player.tag for player in player_list])
+
+    # member lookups by id for this call
+    member_dict = {member.id: member for member in member_list}
+
+    ping_list = []
+    for player in player_list:
+        db_user = db_user_dict.get(player.tag)
+
+        if db_user is None:
+            ping_list.append(f"{player.name} {player.tag}")
+            continue
+
+        user = member_dict.get(db_user.discord_id)
+
+        if user is None:
+            ping_list.append(f"{player.name} {player.tag}")
+            continue
+
+        ping_list.append(f"{user.mention} ({player.name} {player.tag})")
+
+    return ping_list
 
 
 # roles
 
-async def update_roles(user, guild, coc_client):
+async def get_player_limited(player_tag, coc_client, player_semaphore=None):
+    """
+        gets a player, holding player_semaphore while fetching if supplied
+
+        Args:
+            player_tag (str): player tag
+            coc_client ([coc.py client]): [coc.py client]
+            player_semaphore (asyncio.Semaphore): bounds concurrent fetches
+
+        Returns:
+            obj: coc.py player object or None if not found
+    """
+
+    if player_semaphore is None:
+        return await clash_responder.get_player(player_tag, coc_client)
+
+    async with player_semaphore:
+        return await clash_responder.get_player(player_tag, coc_client)
+
+
+async def get_role_player(
+    player_tag, coc_client, player_semaphore=None, clan_member_dict=None
+):
+    """
+        gets the clan member for player_tag from clan_member_dict,
+        fetching the player if they are not in a claimed clan
+
+        Args:
+            player_tag (str): player tag
+            coc_client ([coc.py client]): [coc.py client]
+            player_semaphore (asyncio.Semaphore): bounds concurrent fetches
+            clan_member_dict (dict): player tag: coc.py clan member
+                or player object, None if not found
+
+        Returns:
+            obj: coc.py clan member or player object,
+                None if not found
+    """
+
+    # clan members have the clan and role needed for roles
+    if clan_member_dict is not None and player_tag in clan_member_dict:
+        return clan_member_dict[player_tag]
+
+    return await get_player_limited(player_tag, coc_client, player_semaphore)
+
+
+async def update_roles(
+    user, guild, coc_client, player_semaphore=None, edit_semaphore=None,
+    db_player_obj_list=None, clan_member_dict=None
+):
     """
         update roles and return embed dict list
 
@@ -556,6 +870,15 @@ async def update_roles(user, guild, coc_client):
             user ([disnake.User]): [object for user getting roled]
             guild ([disnake.Guild]): [guild command was called]
             coc_client ([coc.py client]): [coc.py client]
+            player_semaphore ([asyncio.Semaphore]): [bounds concurrent
+                coc player fetches, shared across a guild sync]
+            edit_semaphore ([asyncio.Semaphore]): [bounds concurrent
+                member edits, shared across a guild sync]
+            db_player_obj_list ([list]): [user's claimed db players,
+                read from the db if not supplied]
+            clan_member_dict ([dict]): [player tag: coc.py clan member
+                or player object, None if not found,
+                players found here are not fetched]
 
         Returns:
             [embed_dict_list]: [list]
@@ -566,7 +889,9 @@ async def update_roles(user, guild, coc_client):
     """
     embed_dict_list = []
 
-    db_player_obj_list = db_responder.read_player_list(user.id)
+    if db_player_obj_list is None:
+        db_player_obj_list = await db_responder.read_player_list(user.id)
+
     # player is not claimed
     if len(db_player_obj_list) == 0:
         embed_dict_list.append({
@@ -580,11 +905,15 @@ async def update_roles(user, guild, coc_client):
         return embed_dict_list
 
     # getting a list of all claimed players
-    player_obj_list = []
-    for db_obj in db_player_obj_list:
-        player_obj = await clash_responder.get_player(
-            db_obj.player_tag, coc_client)
+    # fetched concurrently, results keep the db player order
+    fetched_player_list = await asyncio.gather(*(
+        get_role_player(
+            db_obj.player_tag, coc_client, player_semaphore, clan_member_dict)
+        for db_obj in db_player_obj_list
+    ))
 
+    player_obj_list = []
+    for db_obj, player_obj in zip(db_player_obj_list, fetched_player_list):
         # player was not found from tag
         if player_obj is None:
             embed_dict_list.append({
@@ -608,7 +937,7 @@ async def update_roles(user, guild, coc_client):
             continue
 
         # claimed clan validation
-        db_clan_obj = db_responder.read_clan(
+        db_clan_obj = await db_responder.read_clan(
             guild.id, player_obj.clan.tag)
         # clan not found
         if not db_clan_obj:
@@ -624,9 +953,9 @@ async def update_roles(user, guild, coc_client):
             continue
 
         # get discord clan and rank roles
-        db_clan_role_obj = db_responder.read_clan_role_from_tag(
+        db_clan_role_obj = await db_responder.read_clan_role_from_tag(
             guild.id, player_obj.clan.tag)
-        db_rank_role_obj = (db_responder.read_rank_role_from_guild_and_clash(
+        db_rank_role_obj = (await db_responder.read_rank_role_from_guild_and_clash(
             guild.id, player_obj.role.value))
 
         if not db_clan_role_obj and not db_rank_role_obj:
@@ -650,7 +979,7 @@ async def update_roles(user, guild, coc_client):
 
     # if the user has no needed roles
     if len(needed_role_list) == 0:
-        uninitiated_role = db_responder.read_rank_role_from_guild_and_clash(
+        uninitiated_role = await db_responder.read_rank_role_from_guild_and_clash(
             guild.id, "uninitiated"
         )
         if uninitiated_role:
@@ -665,19 +994,14 @@ async def update_roles(user, guild, coc_client):
         current_discord_role_list.append(current_role.id)
 
     # get current roles that match db roles
-    current_db_rank_role_list = db_responder.read_rank_role_list(
-        current_discord_role_list)
-
-    current_db_clan_role_list = db_responder.read_clan_role_list(
-        current_discord_role_list
-    )
+    # guild config is cached, so this does not hit the db per member
+    guild_config = await db_responder.read_guild_config(guild.id)
 
     # getting the list of role id's
     current_role_list = []
-    for rank_role in current_db_rank_role_list:
-        current_role_list.append(rank_role.discord_role_id)
-    for clan_role in current_db_clan_role_list:
-        current_role_list.append(clan_role.discord_role_id)
+    for current_role_id in current_discord_role_list:
+        if current_role_id in guild_config.role_id_set:
+            current_role_list.append(current_role_id)
 
     add_role_id_list, remove_role_id_list = role_add_remove_list(
         needed_role_list, current_role_list)
@@ -721,13 +1045,10 @@ async def update_roles(user, guild, coc_client):
 
         remove_role_obj_list.append(remove_role_obj)
 
-    # add roles
-    for add_role_obj in add_role_obj_list:
-        await user.add_roles(add_role_obj)
-
-    # remove roles
-    for remove_role_obj in remove_role_obj_list:
-        await user.remove_roles(remove_role_obj)
+    # add and remove roles in a single member edit
+    if len(add_role_obj_list) != 0 or len(remove_role_obj_list) != 0:
+        await edit_member_roles(
+            user, add_role_obj_list, remove_role_obj_list, edit_semaphore)
 
     # no roles added or removed
     if len(add_role_obj_list) == 0 and len(remove_role_obj_list) == 0:
@@ -806,6 +1127,374 @@ async def update_roles(user, guild, coc_client):
     return embed_dict_list
 
 
+async def edit_member_roles(
+    member, add_role_obj_list, remove_role_obj_list, edit_semaphore=None
+):
+    """
+        adds and removes roles with one member edit request
+        instead of one request per role
+
+        Args:
+            member ([disnake.Member]): [member getting roled]
+            add_role_obj_list ([list]): [disnake roles to add]
+            remove_role_obj_list ([list]): [disnake roles to remove]
+            edit_semaphore ([asyncio.Semaphore]): [bounds concurrent edits]
+    """
+
+    remove_role_id_list = [role.id for role in remove_role_obj_list]
+
+    # roles[0] is @everyone which can't be sent in a role edit
+    role_obj_list = []
+    for role in member.roles[1:]:
+        if role.id not in remove_role_id_list:
+            role_obj_list.append(role)
+    for role in add_role_obj_list:
+        if role not in role_obj_list:
+            role_obj_list.append(role)
+
+    # disnake waits on the member edit rate limit bucket
+    # and retries 429 responses itself
+    if edit_semaphore is None:
+        await member.edit(roles=role_obj_list)
+        return
+
+    async with edit_semaphore:
+        await member.edit(roles=role_obj_list)
+
+
+async def get_role_player_dict(
+    db_player_obj_list, coc_client, player_semaphore=None,
+    clan_member_dict=None
+):
+    """
+        gets every claimed player concurrently for role resolution
+
+        Args:
+            db_player_obj_list (list): user's claimed db players
+            coc_client ([coc.py client]): [coc.py client]
+            player_semaphore (asyncio.Semaphore): bounds concurrent fetches
+            clan_member_dict (dict): player tag: coc.py clan member
+
+        Returns:
+            dict: player tag: coc.py clan member or player object,
+                None if not found
+    """
+
+    fetched_player_list = await asyncio.gather(*(
+        get_role_player(
+            db_obj.player_tag, coc_client, player_semaphore, clan_member_dict)
+        for db_obj in db_player_obj_list
+    ))
+
+    role_player_dict = {}
+    for db_obj, player_obj in zip(db_player_obj_list, fetched_player_list):
+        role_player_dict[db_obj.player_tag] = player_obj
+
+    return role_player_dict
+
+
+def role_fingerprint(db_player_obj_list, role_player_dict):
+    """
+        returns the clash data a member's roles are decided from,
+        roles only need updating when it changes
+
+        Args:
+            db_player_obj_list (list): user's claimed db players
+            role_player_dict (dict): player tag: coc.py clan member
+                or player object, None if not found
+
+        Returns:
+            tuple: (player tag, clan tag, role, town hall)
+                of each claimed player
+    """
+
+    fingerprint_list = []
+    for db_obj in db_player_obj_list:
+        player_obj = role_player_dict[db_obj.player_tag]
+
+        # player was not found from tag
+        if player_obj is None:
+            fingerprint_list.append((db_obj.player_tag, None, None, None))
+            continue
+
+        if player_obj.clan is None:
+            clan_tag = None
+        else:
+            clan_tag = player_obj.clan.tag
+
+        if player_obj.role is None:
+            role_value = None
+        else:
+            role_value = player_obj.role.value
+
+        # clan members from the clan index do not have a town hall
+        fingerprint_list.append((
+            db_obj.player_tag, clan_tag, role_value,
+            getattr(player_obj, 'town_hall', None)
+        ))
+
+    return tuple(fingerprint_list)
+
+
+def guild_role_fingerprint(guild_config):
+    """
+        returns the claimed clans and roles of a guild,
+        every member's roles need updating when it changes
+
+        Args:
+            guild_config (obj): guild config object
+
+        Returns:
+            tuple: claimed clan tags, clan role and rank role pairs
+    """
+
+    return (
+        frozenset(guild_config.clan_dict),
+        frozenset(
+            (clan_tag, db_clan_role.discord_role_id)
+            for clan_tag, db_clan_role
+            in guild_config.clan_role_dict.items()),
+        frozenset(
+            (clash_name, db_rank_role.discord_role_id)
+            for clash_name, db_rank_role
+            in guild_config.rank_role_dict.items())
+    )
+
+
+def forget_role_fingerprint(discord_guild_id):
+    """
+        drops the role fingerprints of a guild,
+        the next reconciliation updates every member
+
+        Args:
+            discord_guild_id (int): discord id for guild
+    """
+
+    role_fingerprint_dict.pop(discord_guild_id, None)
+
+
+async def update_roles_guild(
+    member_list, guild, coc_client, progress_callback=None,
+    skip_unchanged=False
+):
+    """
+        updates roles of every member in member_list concurrently
+        and returns embed dict list in member order,
+        a member that raises is returned as a role update failed embed
+
+        Args:
+            member_list ([list]): [disnake members, bots are skipped]
+            guild ([disnake.Guild]): [guild command was called]
+            coc_client ([coc.py client]): [coc.py client]
+            progress_callback ([coroutine function]): [awaited with
+                the member's embed dict list after each member is updated]
+            skip_unchanged ([bool]): [skip members whose role fingerprint
+                matches the last guild sync]
+
+        Returns:
+            [embed_dict_list]: [list]
+                embed_dict:
+                    title [str]: embed title or None
+                    field_dict_list [list]: list of field dicts
+                    thumbnail [obj]: coc.py thumbnail object or None
+    """
+
+    member_list = [member for member in member_list if not member.bot]
+
+    # every member's claimed players in one db query
+    db_player_dict = await db_responder.read_player_list_from_user_list(
+        [member.id for member in member_list])
+
+    # members of the guild's claimed clans from one fetch per clan,
+    # players outside those clans are fetched individually
+    db_clan_list = await db_responder.read_clan_list_from_guild(guild.id)
+    clan_member_dict = await clash_responder.get_clan_member_dict(
+        [db_clan.clan_tag for db_clan in db_clan_list], coc_client)
+
+    # fingerprints from the last guild sync,
+    # dropped if the guild's claimed clans or roles changed
+    guild_config = await db_responder.read_guild_config(guild.id)
+    guild_fingerprint = guild_role_fingerprint(guild_config)
+
+    last_guild_fingerprint, last_fingerprint_dict = role_fingerprint_dict.get(
+        guild.id, (None, {}))
+    if last_guild_fingerprint != guild_fingerprint:
+        last_fingerprint_dict = {}
+
+    # members that left the guild are not carried over
+    fingerprint_dict = {}
+
+    # shared limits for the whole guild sync
+    member_semaphore = asyncio.Semaphore(role_sync_member_concurrency)
+    # player fetches share the coc.py throttle limit with other commands
+    player_semaphore = clash_responder.get_player_fetch_semaphore(coc_client)
+    edit_semaphore = asyncio.Semaphore(role_sync_edit_concurrency)
+
+    async def update_member(member):
+        db_player_obj_list = db_player_dict[member.id]
+
+        async with member_semaphore:
+            try:
+                # claimed players are resolved once,
+                # update_roles reads them from role_player_dict
+                role_player_dict = await get_role_player_dict(
+                    db_player_obj_list, coc_client,
+                    player_semaphore, clan_member_dict)
+                fingerprint = role_fingerprint(
+                    db_player_obj_list, role_player_dict)
+
+                if (skip_unchanged and
+                        last_fingerprint_dict.get(member.id) == fingerprint):
+                    member_embed_dict_list = []
+
+                else:
+                    member_embed_dict_list = await update_roles(
+                        member, guild, coc_client,
+                        player_semaphore=player_semaphore,
+                        edit_semaphore=edit_semaphore,
+                        db_player_obj_list=db_player_obj_list,
+                        clan_member_dict=role_player_dict
+                    )
+
+                # only members that updated without failures
+                # are skipped next sync
+                changed_field_dict_list, failed_field_dict_list = (
+                    role_summary_field_list(member_embed_dict_list))
+                if len(failed_field_dict_list) == 0:
+                    fingerprint_dict[member.id] = fingerprint
+
+            # one member failing does not stop the guild sync,
+            # for example a role above the bot or a member that left
+            except Exception as arg:
+                member_embed_dict_list = [{
+                    "title": member.display_name,
+                    "field_dict_list": [{
+                        "name": "role update failed",
+                        "value": f"{member.mention} {arg}"
+                    }],
+                    "thumbnail": None
+                }]
+
+        if progress_callback is not None:
+            await progress_callback(member_embed_dict_list)
+
+        return member_embed_dict_list
+
+    member_embed_list = await asyncio.gather(
+        *(update_member(member) for member in member_list))
+
+    role_fingerprint_dict[guild.id] = (guild_fingerprint, fingerprint_dict)
+
+    embed_dict_list = []
+    for member_embed_dict_list in member_embed_list:
+        embed_dict_list.extend(member_embed_dict_list)
+
+    return embed_dict_list
+
+
+def role_summary_field_list(embed_dict_list):
+    """
+        splits a member's update_roles embed dicts into
+        summary fields of changes and failures,
+        unchanged and unclaimed members are left out
+
+        Args:
+            embed_dict_list (list): embed dicts returned by update_roles
+
+        Returns:
+            changed_field_dict_list: field dicts of role changes
+            failed_field_dict_list: field dicts of failures
+    """
+
+    changed_field_dict_list = []
+    failed_field_dict_list = []
+    for embed_dict in embed_dict_list:
+        field_name = embed_dict["field_dict_list"][0]["name"]
+
+        # nothing to report
+        if field_name in ("no roles changed", "no claimed players"):
+            continue
+
+        if field_name == "roles changed":
+            changed_field_dict_list.extend(embed_dict["field_dict_list"])
+            continue
+
+        # keep the embed title with the fields it was shown above
+        for field_dict in embed_dict["field_dict_list"]:
+            if embed_dict["title"] is None:
+                failed_field_dict_list.append(field_dict)
+            else:
+                failed_field_dict_list.append({
+                    "name": f"{embed_dict['title']} {field_dict['name']}",
+                    "value": field_dict["value"]
+                })
+
+    return changed_field_dict_list, failed_field_dict_list
+
+
+async def update_roles_clan_event(
+    player_tag, clan_tag, bot, coc_client, clan_member=None
+):
+    """
+        updates roles of the user linked to player_tag
+        in every guild that claims clan_tag,
+        called when the player joins, leaves or changes role in the clan
+
+        Args:
+            player_tag (str): tag of the player in the clan event
+            clan_tag (str): tag of the clan in the clan event
+            bot ([disnake.Client]): [bot the guilds are read from]
+            coc_client ([coc.py client]): [coc.py client]
+            clan_member ([coc.py ClanMember]): [player's current clan
+                member, None if the player left the clan]
+
+        Returns:
+            [embed_dict_list]: [list]
+                embed_dict:
+                    title [str]: embed title or None
+                    field_dict_list [list]: list of field dicts
+                    thumbnail [obj]: coc.py thumbnail object or None
+    """
+
+    embed_dict_list = []
+
+    # player is not claimed
+    db_user_obj = await db_responder.read_user_from_tag(player_tag)
+    if db_user_obj is None:
+        return embed_dict_list
+
+    # the cached player still has the clan and role before the event
+    clash_responder.forget_player(player_tag)
+
+    # the event's clan member is current, it does not need a fetch
+    if clan_member is None:
+        clan_member_dict = None
+    else:
+        clan_member_dict = {clan_member.tag: clan_member}
+
+    db_player_obj_list = await db_responder.read_player_list(
+        db_user_obj.discord_id)
+
+    for db_clan_obj in await db_responder.read_clan_list_from_tag(clan_tag):
+        guild = bot.get_guild(db_clan_obj.guild_id)
+        # bot is not in the guild
+        if guild is None:
+            continue
+
+        member = guild.get_member(db_user_obj.discord_id)
+        # user is not in the guild
+        if member is None:
+            continue
+
+        embed_dict_list.extend(await update_roles(
+            member, guild, coc_client,
+            db_player_obj_list=db_player_obj_list,
+            clan_member_dict=clan_member_dict
+        ))
+
+    return embed_dict_list
+
+
 def role_add_remove_list(needed_role_list, current_role_list):
     """
         Takes in list of needed and current role id's and
@@ -841,8 +1530,65 @@ def role_add_remove_list(needed_role_list, current_role_list):
     return add_list, remove_list
 
 
-async def update_user_nickname(user: User, coc_client):
-    db_player = db_responder.read_player_active(user.id)
+def nickname_summary_field_list(field_dict_list):
+    """
+        splits a member's update_user_nickname field dicts into
+        summary fields of changes and failures
+
+        Args:
+            field_dict_list (list): field dicts returned
+                by update_user_nickname
+
+        Returns:
+            changed_field_dict_list: field dicts of nickname changes
+            failed_field_dict_list: field dicts of failures
+    """
+
+    changed_field_dict_list = []
+    failed_field_dict_list = []
+    for field_dict in field_dict_list:
+        if field_dict["name"] == "nickname update successful":
+            changed_field_dict_list.append(field_dict)
+
+        elif field_dict["name"] == "nickname update failed":
+            failed_field_dict_list.append(field_dict)
+
+    return changed_field_dict_list, failed_field_dict_list
+
+
+def find_active_player(db_player_obj_list):
+    """
+        returns the active player of a user's claimed players
+
+        Args:
+            db_player_obj_list (list): user's claimed db players
+
+        Returns:
+            obj: db player object, None if no player is active
+    """
+
+    for db_player_obj in db_player_obj_list:
+        if db_player_obj.active:
+            return db_player_obj
+
+    return None
+
+
+async def set_user_nickname(user, db_player, player, edit_semaphore=None):
+    """
+        sets the user's nickname to player's name
+        and returns field dict list,
+        the user is not edited if the nickname already matches
+
+        Args:
+            user ([disnake.Member]): [user getting renamed]
+            db_player ([db player]): [user's active db player or None]
+            player ([coc.py player]): [active player or None if not found]
+            edit_semaphore ([asyncio.Semaphore]): [bounds concurrent edits]
+
+        Returns:
+            [field_dict_list]: [list of field dicts]
+    """
 
     # no player found for user
     if not db_player:
@@ -853,8 +1599,6 @@ async def update_user_nickname(user: User, coc_client):
 
         return field_dict_list
 
-    player = await clash_responder.get_player(db_player.player_tag, coc_client)
-
     # clash player not found
     if not player:
         field_dict_list = [{
@@ -865,8 +1609,26 @@ async def update_user_nickname(user: User, coc_client):
 
         return field_dict_list
 
+    # nickname already matches, no edit request needed
+    if user.display_name == player.name:
+        field_dict_list = [{
+            "name": f"nickname unchanged",
+            "value": (f"{user.mention} nickname already matches "
+                      f"player {player.name} {player.tag}")
+        }]
+
+        return field_dict_list
+
     try:
-        await user.edit(nick=player.name)
+        # disnake waits on the member edit rate limit bucket
+        # and retries 429 responses itself
+        if edit_semaphore is None:
+            await user.edit(nick=player.name)
+
+        else:
+            async with edit_semaphore:
+                await user.edit(nick=player.name)
+
     except:
         field_dict_list = [{
             "name": f"nickname update failed",
@@ -882,3 +1644,102 @@ async def update_user_nickname(user: User, coc_client):
     }]
 
     return field_dict_list
+
+
+async def update_user_nickname(
+    user: User, coc_client, db_player_obj_list: list = None
+):
+    """
+        sets the user's nickname to their active player's name
+        and returns field dict list
+
+        Args:
+            user ([disnake.User]): [user getting renamed]
+            coc_client ([coc.py client]): [coc.py client]
+            db_player_obj_list ([list]): [user's claimed db players,
+                the active player is read from the db if not supplied]
+
+        Returns:
+            [field_dict_list]: [list of field dicts]
+    """
+
+    if db_player_obj_list is None:
+        db_player = await db_responder.read_player_active(user.id)
+
+    # find the active player in the prefetched players
+    else:
+        db_player = find_active_player(db_player_obj_list)
+
+    if db_player:
+        player = await clash_responder.get_player(
+            db_player.player_tag, coc_client)
+    else:
+        player = None
+
+    return await set_user_nickname(user, db_player, player)
+
+
+async def update_nickname_guild(
+    member_list, coc_client, progress_callback=None
+):
+    """
+        sets the nickname of every member in member_list
+        to their active player's name and returns field dict list
+        in member order
+
+        Args:
+            member_list ([list]): [disnake members, bots are skipped]
+            coc_client ([coc.py client]): [coc.py client]
+            progress_callback ([coroutine function]): [awaited with
+                the member's field dict list after each member is updated]
+
+        Returns:
+            [field_dict_list]: [list of field dicts]
+    """
+
+    member_list = [member for member in member_list if not member.bot]
+
+    # every member's claimed players in one db query
+    db_player_dict = await db_responder.read_player_list_from_user_list(
+        [member.id for member in member_list])
+
+    db_active_dict = {}
+    for member in member_list:
+        db_active_dict[member.id] = find_active_player(
+            db_player_dict[member.id])
+
+    # active players fetched concurrently through the player cache
+    player_tag_list = list(dict.fromkeys(
+        db_player.player_tag for db_player in db_active_dict.values()
+        if db_player))
+    player_list = await clash_responder.get_player_list(
+        player_tag_list, coc_client)
+    player_dict = dict(zip(player_tag_list, player_list))
+
+    # shared limit for the whole nickname sync
+    edit_semaphore = asyncio.Semaphore(nickname_sync_edit_concurrency)
+
+    async def update_member(member):
+        db_player = db_active_dict[member.id]
+
+        if db_player:
+            player = player_dict[db_player.player_tag]
+        else:
+            player = None
+
+        member_field_dict_list = await set_user_nickname(
+            member, db_player, player, edit_semaphore)
+
+        if progress_callback is not None:
+            await progress_callback(member_field_dict_list)
+
+        return member_field_dict_list
+
+    member_field_list = await asyncio.gather(
+        *(update_member(member) for member in member_list))
+
+    field_dict_list = []
+    for member_field_dict_list in member_field_list:
+        field_dict_list.extend(member_field_dict_list)
+
+    return field_dict_list
@@ -8,14 +8,14 @@ from responders import (
 )
 
 
-def help_super_user(
+async def help_super_user(
         inter: Interaction,
         all_commands: list,
         bot_category: Client_Data.ClashDiscord_Category):
 
     field_dict_list = []
 
-    db_user = db_responder.read_user(inter.author.id)
+    db_user = await db_responder.read_user(inter.author.id)
 
     # if user is not super user
     if not db_user.super_user:
@@ -34,14 +34,14 @@ def help_super_user(
     return field_dict_list
 
 
-def help_admin(
+async def help_admin(
         inter: Interaction,
         all_commands: list,
         bot_category: Client_Data.ClashDiscord_Category):
 
     field_dict_list = []
 
-    db_guild = db_responder.read_guild(inter.guild.id)
+    db_guild = await db_responder.read_guild(inter.guild.id)
 
     # guild not claimed
     if db_guild is None:
@@ -51,7 +51,7 @@ def help_admin(
         })
         return field_dict_list
 
-    db_user = db_responder.read_user(inter.author.id)
+    db_user = await db_responder.read_user(inter.author.id)
 
     # user is not guild admin and is not an admin
     if (db_guild.admin_user_id != db_user.discord_id
@@ -79,14 +79,14 @@ def help_admin(
     return field_dict_list
 
 
-def help_client(
+async def help_client(
         inter: Interaction,
         all_commands: list,
         bot_category: Client_Data.ClashDiscord_Category):
 
     field_dict_list = []
 
-    db_guild = db_responder.read_guild(inter.guild.id)
+    db_guild = await db_responder.read_guild(inter.guild.id)
 
     # guild not claimed
     if db_guild is None:
@@ -1,3 +1,4 @@
+import datetime
 import database.RazBotDB_user as user
 import database.RazBotDB_player as player
 import database.RazBotDB_guild as guild
@@ -5,7 +6,50 @@ import database.RazBotDB_clan as clan
 import database.RazBotDB_clan_role as clan_role
 import database.RazBotDB_rank_role_model as rank_role_model
 import database.RazBotDB_rank_role as rank_role
+import database.RazBotDB_war as war
+import database.RazBotDB_war_member as war_member
+import database.RazBotDB_war_attack as war_attack
+import database.RazBotDB_war_season_member as war_season_member
 import database.RazBotDB_db as db
+import database.RazBotDB_Executor as db_executor
+from utils.cache_utils import TTLCache
+from utils import war_score_utils
+
+
+# guild configuration cache
+# clans, clan roles and rank roles only change through admin commands,
+# every write below invalidates the guild's entry
+guild_config_ttl = 300
+guild_config_max_size = 1000
+guild_config_cache = TTLCache(guild_config_ttl, guild_config_max_size)
+
+
+class GuildConfig(object):
+    """
+        GuildConfig: claimed clans and roles of a guild
+
+            Instance Attributes
+                discord_guild_id (int): discord id for guild
+                clan_dict (dict): clan tag: clan object
+                clan_role_dict (dict): clan tag: clan role object
+                rank_role_dict (dict): clash name: rank role object
+                role_id_set (set): discord role ids of every
+                    claimed clan and rank role in the guild
+    """
+
+    def __init__(
+        self, discord_guild_id, clan_dict, clan_role_dict, rank_role_dict
+    ):
+        self.discord_guild_id = discord_guild_id
+        self.clan_dict = clan_dict
+        self.clan_role_dict = clan_role_dict
+        self.rank_role_dict = rank_role_dict
+
+        self.role_id_set = set()
+        for db_clan_role in clan_role_dict.values():
+            self.role_id_set.add(db_clan_role.discord_role_id)
+        for db_rank_role in rank_role_dict.values():
+            self.role_id_set.add(db_rank_role.discord_role_id)
 
 
 # todo reevaluate arg ordering
@@ -14,7 +58,7 @@ import database.RazBotDB_db as db
 
 # todo see if you can instanciate a user directly or if you have to break it up first
 # user
-def claim_user(discord_user_id):
+async def claim_user(discord_user_id):
     """
         claims user and returns user object instance,
             if user has been previously claimed return None
@@ -25,21 +69,21 @@ def claim_user(discord_user_id):
         Returns:
             obj: user object (discord_id, admin, super_user)
     """
-    user_data = user.select_user(discord_user_id)
+    user_data = await db_executor.run(user.select_user, discord_user_id)
     # check if user_data is None
     # if user data is not None that means user has been claimed
     if user_data:
         # if user_data has values then return None
         return None
     else:
-        user_data = user.insert_user(discord_user_id)
+        user_data = await db_executor.run(user.insert_user, discord_user_id)
         user_discord_id, user_admin, user_super_user = user_data
         user_obj = user.User(user_discord_id, bool(
             user_admin), bool(user_super_user))
         return user_obj
 
 
-def read_user(discord_user_id):
+async def read_user(discord_user_id):
     """
         finds user in db, if user is not found returns None
 
@@ -49,7 +93,7 @@ def read_user(discord_user_id):
         Returns:
             obj: user object (discord_id, admin, super_user)
     """
-    user_data = user.select_user(discord_user_id)
+    user_data = await db_executor.run(user.select_user, discord_user_id)
     # if user data is found return user
     if user_data:
         user_discord_id, user_admin, user_super_user = user_data
@@ -59,7 +103,7 @@ def read_user(discord_user_id):
         return None
 
 
-def read_user_from_tag(player_tag):
+async def read_user_from_tag(player_tag):
     """
         finds user with given player tag in db,
         if user is not found returns None
@@ -70,7 +114,7 @@ def read_user_from_tag(player_tag):
         Returns:
             obj: user object (discord_id, admin, super_user)
     """
-    user_data = user.select_user_from_tag(player_tag)
+    user_data = await db_executor.run(user.select_user_from_tag, player_tag)
     # if user data is found return user
     if user_data:
         user_discord_id, user_admin, user_super_user = user_data
@@ -80,7 +124,56 @@ def read_user_from_tag(player_tag):
         return None
 
 
-def read_user_admin_all():
+async def read_user_dict_from_tag_list(player_tag_list):
+    """
+        finds the users linked to each player tag in one db query,
+        tags without a user are left out of the dict
+
+        Args:
+            list
+                player_tag (str): requested player tag
+
+        Returns:
+            dict: player tag: user object (discord_id, admin, super_user)
+    """
+    user_data_list = await db_executor.run(
+        user.select_user_from_tag_list, list(dict.fromkeys(player_tag_list)))
+
+    user_dict = {}
+    for (player_tag, user_discord_id,
+         user_admin, user_super_user) in user_data_list:
+        user_dict[player_tag] = user.User(
+            user_discord_id, bool(user_admin), bool(user_super_user))
+
+    return user_dict
+
+
+async def read_user_list_from_discord_id_list(discord_user_id_list):
+    """
+        finds the users with the requested discord ids in one db query,
+        ids without a user are left out
+
+        Args:
+            list
+                discord_user_id (int): discord id for user
+
+        Returns:
+            list: list of user object (discord_id, admin, super_user)
+    """
+    user_data_list = await db_executor.run(
+        user.select_user_list, list(dict.fromkeys(discord_user_id_list)))
+    user_list = []
+
+    for user_data in user_data_list:
+        user_discord_id, user_admin, user_super_user = user_data
+        user_list.append(user.User(
+            user_discord_id, bool(user_admin), bool(user_super_user)
+        ))
+
+    return user_list
+
+
+async def read_user_admin_all():
     """
         finds all admin users,
         returns empty list if no users are found
@@ -88,7 +181,7 @@ def read_user_admin_all():
         Returns:
             list: list of user object (discord_id, admin, super_user)
     """
-    user_data_list = list(user.select_user_admin_all())
+    user_data_list = list(await db_executor.run(user.select_user_admin_all))
     user_list = []
 
     for user_data in user_data_list:
@@ -100,7 +193,7 @@ def read_user_admin_all():
     return user_list
 
 
-def read_user_all():
+async def read_user_all():
     """
         finds all users,
         returns empty list if no users are found
@@ -108,7 +201,7 @@ def read_user_all():
         Returns:
             list: list of user object (discord_id, admin, super_user)
     """
-    user_data_list = list(user.select_user_all())
+    user_data_list = list(await db_executor.run(user.select_user_all))
     user_list = []
 
     for user_data in user_data_list:
@@ -120,7 +213,7 @@ def read_user_all():
     return user_list
 
 
-def update_toggle_user_admin(discord_user_id):
+async def update_toggle_user_admin(discord_user_id):
     """
         toggles the user's admin bool 
         and returns None if no user is found
@@ -131,7 +224,8 @@ def update_toggle_user_admin(discord_user_id):
         Returns:
             obj: user object (discord_id, admin, super_user)
     """
-    user_data = user.update_user_admin_toggle(discord_user_id)
+    user_data = await db_executor.run(
+        user.update_user_admin_toggle, discord_user_id)
     if user_data:
         user_discord_id, user_admin, user_super_user = user_data
         return user.User(user_discord_id, bool(
@@ -140,21 +234,21 @@ def update_toggle_user_admin(discord_user_id):
         return None
 
 
-def read_user_count():
+async def read_user_count():
     """
         returns int of user count
 
         Returns:
             int: user count
     """
-    user_data = user.select_user_count()
+    user_data = await db_executor.run(user.select_user_count)
 
     user_count, = user_data
 
     return user_count
 
 
-def delete_user(discord_user_id):
+async def delete_user(discord_user_id):
     """
         deletes user and returns None if the user 
         could not be found after deletion,
@@ -166,7 +260,7 @@ def delete_user(discord_user_id):
         Returns:
             obj: user object (discord_id, admin, super_user)
     """
-    user_found = user.delete_user(discord_user_id)
+    user_found = await db_executor.run(user.delete_user, discord_user_id)
     if user_found:
         # user was found after deletion
         user_discord_id, user_admin, user_super_user = user_found
@@ -180,7 +274,7 @@ def delete_user(discord_user_id):
 
 # player
 
-def claim_player(discord_user_id, player_tag):
+async def claim_player(discord_user_id, player_tag):
     """
         claims player and returns player object instance, 
         if player has been previously claimed return None
@@ -193,14 +287,17 @@ def claim_player(discord_user_id, player_tag):
     """
 
     # check if user has another player
-    active_player_data = player.select_player_active(discord_user_id)
+    active_player_data = await db_executor.run(
+        player.select_player_active, discord_user_id)
 
     if active_player_data:
         # if a user has a active player
-        player_data = player.insert_player_alt(discord_user_id, player_tag)
+        player_data = await db_executor.run(
+            player.insert_player_alt, discord_user_id, player_tag)
     else:
         # if a player does not have a active player
-        player_data = player.insert_player_active(discord_user_id, player_tag)
+        player_data = await db_executor.run(
+            player.insert_player_active, discord_user_id, player_tag)
 
     if player_data:
         player_tag, active = player_data
@@ -209,7 +306,28 @@ def claim_player(discord_user_id, player_tag):
         return None
 
 
-def read_player_list(discord_user_id):
+async def claim_player_list(player_claim_list):
+    """
+        claims players in bulk, players that have been
+        previously claimed or whose user is not claimed are skipped
+
+        Args:
+            list
+                discord_user_id (int): discord id for user
+                player_tag (str): player tag to claim
+                active (bool): claim as the user's active player
+
+        Returns:
+            int: count of claimed players
+    """
+
+    claim_count = await db_executor.run(
+        player.insert_player_list, player_claim_list)
+
+    return claim_count
+
+
+async def read_player_list(discord_user_id):
     """
         returns all players associated with discord id
         and returns empty list if no players are found
@@ -220,7 +338,8 @@ def read_player_list(discord_user_id):
         Returns:
             list: list of player object (player_tag, active)
     """
-    player_list = list(player.select_player_all(discord_user_id))
+    player_list = list(await db_executor.run(
+        player.select_player_all, discord_user_id))
     player_obj_list = []
     for item in player_list:
         player_tag, player_active = item
@@ -228,7 +347,33 @@ def read_player_list(discord_user_id):
     return player_obj_list
 
 
-def read_player(discord_user_id, player_tag):
+async def read_player_list_from_user_list(discord_user_id_list):
+    """
+        returns all players associated with each discord id
+        in one db query, users without players map to an empty list
+
+        Args:
+            list
+                discord_user_id (int): discord id for user
+
+        Returns:
+            dict: discord user id: list of player object (player_tag, active)
+    """
+    player_dict = {}
+    for discord_user_id in discord_user_id_list:
+        player_dict[discord_user_id] = []
+
+    player_data_list = await db_executor.run(
+        player.select_player_all_from_user_list, list(player_dict))
+
+    for discord_user_id, player_tag, player_active in player_data_list:
+        player_dict[discord_user_id].append(
+            player.Player(player_tag, bool(player_active)))
+
+    return player_dict
+
+
+async def read_player(discord_user_id, player_tag):
     """
         returns player where discord user id and player tag
         and returns None if no player is found
@@ -240,8 +385,8 @@ def read_player(discord_user_id, player_tag):
         Returns:
             obj: player object (player_tag, active)
     """
-    player_data = player.select_player_from_user_tag(
-        discord_user_id, player_tag)
+    player_data = await db_executor.run(
+        player.select_player_from_user_tag, discord_user_id, player_tag)
     if player_data:
         player_tag, active = player_data
         return player.Player(player_tag, bool(active))
@@ -249,7 +394,7 @@ def read_player(discord_user_id, player_tag):
         return None
 
 
-def read_player_from_tag(player_tag):
+async def read_player_from_tag(player_tag):
     """
         returns player where player tag
         and returns None if no player is found
@@ -260,7 +405,8 @@ def read_player_from_tag(player_tag):
         Returns:
             obj: player object (player_tag, active)
     """
-    player_data = player.select_player_from_tag(player_tag)
+    player_data = await db_executor.run(
+        player.select_player_from_tag, player_tag)
     if player_data:
         player_tag, active = player_data
         return player.Player(player_tag, bool(active))
@@ -268,7 +414,7 @@ def read_player_from_tag(player_tag):
         return None
 
 
-def read_player_active(discord_user_id):
+async def read_player_active(discord_user_id):
     """
         returns user's active player
         and returns None if no player is found
@@ -279,8 +425,8 @@ def read_player_active(discord_user_id):
         Returns:
             obj: player object (player_tag, active)
     """
-    player_data = player.select_player_active(
-        discord_user_id)
+    player_data = await db_executor.run(
+        player.select_player_active, discord_user_id)
     if player_data:
         player_tag, active = player_data
         return player.Player(player_tag, bool(active))
@@ -288,7 +434,7 @@ def read_player_active(discord_user_id):
         return None
 
 
-def update_player_active(discord_user_id, player_tag):
+async def update_player_active(discord_user_id, player_tag):
     """
         updates user's active player 
         and returns None if no player is found
@@ -300,7 +446,8 @@ def update_player_active(discord_user_id, player_tag):
         Returns:
             obj: player object (player_tag, active)
     """
-    player_data = player.update_player_active(discord_user_id, player_tag)
+    player_data = await db_executor.run(
+        player.update_player_active, discord_user_id, player_tag)
     if player_data:
         player_tag, active = player_data
         return player.Player(player_tag, bool(active))
@@ -308,14 +455,14 @@ def update_player_active(discord_user_id, player_tag):
         return None
 
 
-def read_player_count():
+async def read_player_count():
     """
         returns int of player count
 
         Returns:
             int: player count
     """
-    player_data = player.select_player_count()
+    player_data = await db_executor.run(player.select_player_count)
 
     player_count, = player_data
 
@@ -323,7 +470,7 @@ def read_player_count():
 
 
 # todo if active player is deleted and another player remains change the active player
-def delete_player(discord_user_id, player_tag):
+async def delete_player(discord_user_id, player_tag):
     """
         deletes the requested user's player 
         and returns None if the player could not be found after deletion
@@ -337,9 +484,10 @@ def delete_player(discord_user_id, player_tag):
             obj: player object (player_tag, active)
     """
     # delete the player
-    player_found = player.delete_player(discord_user_id, player_tag)
-    player_data = player.select_player_from_user_tag(
-        discord_user_id, player_tag)
+    player_found = await db_executor.run(
+        player.delete_player, discord_user_id, player_tag)
+    player_data = await db_executor.run(
+        player.select_player_from_user_tag, discord_user_id, player_tag)
     if player_data:
         player_tag, active = player_data
         return player.Player(player_tag, bool(active))
@@ -347,7 +495,7 @@ def delete_player(discord_user_id, player_tag):
         return None
 
 
-def delete_player_from_tag(player_tag):
+async def delete_player_from_tag(player_tag):
     """
         deletes the requested user's player 
         and returns None if the player could not be found after deletion
@@ -360,8 +508,10 @@ def delete_player_from_tag(player_tag):
             obj: player object (player_tag, active)
     """
     # delete the player
-    player_found = player.delete_player_from_tag(player_tag)
-    player_data = player.select_player_from_tag(player_tag)
+    player_found = await db_executor.run(
+        player.delete_player_from_tag, player_tag)
+    player_data = await db_executor.run(
+        player.select_player_from_tag, player_tag)
     if player_data:
         player_tag, active = player_data
         return player.Player(player_tag, bool(active))
@@ -369,8 +519,77 @@ def delete_player_from_tag(player_tag):
         return None
 
 
+# guild config
+async def load_guild_config(discord_guild_id):
+    """
+        reads a guild's clans, clan roles and rank roles from the db
+
+        Args:
+            discord_guild_id (int): discord id for guild
+
+        Returns:
+            obj: guild config object
+    """
+    clan_data_list = await db_executor.run(
+        clan.select_clan_all_from_guild, discord_guild_id)
+    clan_role_data_list = await db_executor.run(
+        clan_role.select_clan_role_from_guild, discord_guild_id)
+    rank_role_data_list = await db_executor.run(
+        rank_role.select_guild_rank_role, discord_guild_id)
+
+    clan_dict = {}
+    for guild_id, clan_tag in clan_data_list:
+        clan_dict[clan_tag] = clan.Clan(guild_id, clan_tag)
+
+    clan_role_dict = {}
+    for guild_id, discord_role_id, clan_tag in clan_role_data_list:
+        # keep the first role claimed for a clan like select_clan_role_from_tag
+        if clan_tag not in clan_role_dict:
+            clan_role_dict[clan_tag] = clan_role.ClanRole(
+                guild_id, discord_role_id, clan_tag)
+
+    rank_role_dict = {}
+    for (guild_id, discord_role_id,
+         model_name, clash_name) in rank_role_data_list:
+        # keep the first role claimed for a rank
+        if clash_name not in rank_role_dict:
+            rank_role_dict[clash_name] = rank_role.RankRole(
+                guild_id, discord_role_id, model_name, clash_name)
+
+    return GuildConfig(
+        discord_guild_id, clan_dict, clan_role_dict, rank_role_dict)
+
+
+async def read_guild_config(discord_guild_id):
+    """
+        returns the cached guild config,
+        reading it from the db if it is missing or expired
+
+        Args:
+            discord_guild_id (int): discord id for guild
+
+        Returns:
+            obj: guild config object
+    """
+
+    return await guild_config_cache.get_or_load(
+        discord_guild_id, load_guild_config, discord_guild_id)
+
+
+def invalidate_guild_config(discord_guild_id):
+    """
+        drops the cached guild config,
+        the next read loads it from the db
+
+        Args:
+            discord_guild_id (int): discord id for guild
+    """
+
+    guild_config_cache.pop(discord_guild_id)
+
+
 # guild
-def claim_guild(discord_user_id, discord_guild_id):
+async def claim_guild(discord_user_id, discord_guild_id):
     """
         claims guild and returns guild object instance,
         if guild has been previously claimed return None
@@ -383,14 +602,15 @@ def claim_guild(discord_user_id, discord_guild_id):
             obj: guild object (guild_id, admin_user_id,
                 bot_channel, active, dev)
     """
-    guild_data = guild.select_guild(discord_guild_id)
+    guild_data = await db_executor.run(guild.select_guild, discord_guild_id)
     # check if guild_data is None
     # if guild data is not None that means guild has been claimed
     if guild_data:
         # if guild_data has values then return None
         return None
 
-    guild_data = guild.insert_guild(discord_guild_id, discord_user_id)
+    guild_data = await db_executor.run(
+        guild.insert_guild, discord_guild_id, discord_user_id)
 
     if guild_data:
         # if guild data is found return guild
@@ -403,7 +623,7 @@ def claim_guild(discord_user_id, discord_guild_id):
         return None
 
 
-def read_guild(discord_guild_id):
+async def read_guild(discord_guild_id):
     """
         finds guild in db, if guild is not found returns None
 
@@ -414,7 +634,7 @@ def read_guild(discord_guild_id):
             obj: guild object (guild_id, admin_user_id,
                 bot_channel, active, dev)
     """
-    guild_data = guild.select_guild(discord_guild_id)
+    guild_data = await db_executor.run(guild.select_guild, discord_guild_id)
 
     if guild_data:
         # if guild data is found return guild
@@ -427,21 +647,21 @@ def read_guild(discord_guild_id):
         return None
 
 
-def read_guild_count():
+async def read_guild_count():
     """
         returns int of guild count
 
         Returns:
             int: guild count
     """
-    guild_data = guild.select_guild_count()
+    guild_data = await db_executor.run(guild.select_guild_count)
 
     guild_count, = guild_data
 
     return guild_count
 
 
-def delete_guild(discord_guild_id):
+async def delete_guild(discord_guild_id):
     """
         deletes the requested guild 
         and returns None if the guild could not be found after deletion
@@ -455,7 +675,9 @@ def delete_guild(discord_guild_id):
                 bot_channel, active, dev)
     """
     # delete the guild
-    guild_data = guild.delete_guild(discord_guild_id)
+    guild_data = await db_executor.run(guild.delete_guild, discord_guild_id)
+    # clans and roles were deleted with the guild
+    invalidate_guild_config(discord_guild_id)
     if guild_data:
         guild_id, admin_user_id, bot_channel, active, dev = guild_data
         guild_obj = guild.Guild(
@@ -466,7 +688,7 @@ def delete_guild(discord_guild_id):
 
 
 # clan
-def claim_clan(discord_guild_id, clan_tag):
+async def claim_clan(discord_guild_id, clan_tag):
     """
         claims clan and returns clan object instance,
         if clan has been previously claimed return None
@@ -478,7 +700,8 @@ def claim_clan(discord_guild_id, clan_tag):
         Returns:
             obj: clan object (guild_id, clan_tag)
     """
-    clan_data = clan.select_clan(discord_guild_id, clan_tag)
+    clan_data = await db_executor.run(
+        clan.select_clan, discord_guild_id, clan_tag)
     # check if clan_data is None
     # if clan data is not None that means clan has been claimed
     # only when clan has been claimed by guild trying to claim
@@ -486,7 +709,9 @@ def claim_clan(discord_guild_id, clan_tag):
         # if clan_data has values then return None
         return None
 
-    clan_data = clan.insert_clan(discord_guild_id, clan_tag)
+    clan_data = await db_executor.run(
+        clan.insert_clan, discord_guild_id, clan_tag)
+    invalidate_guild_config(discord_guild_id)
 
     if clan_data:
         # if clan data is found return clan
@@ -497,7 +722,7 @@ def claim_clan(discord_guild_id, clan_tag):
         return None
 
 
-def read_clan(discord_guild_id, clan_tag):
+async def read_clan(discord_guild_id, clan_tag):
     """
         finds clan in db, if clan is not found returns None
 
@@ -508,19 +733,13 @@ def read_clan(discord_guild_id, clan_tag):
         Returns:
             obj: clan object (guild_id, clan_tag)
     """
-    clan_data = clan.select_clan(discord_guild_id, clan_tag)
-
-    if clan_data:
-        # if clan data is found return clan
-        guild_id, clan_tag = clan_data
-        clan_obj = clan.Clan(guild_id, clan_tag)
-        return clan_obj
+    guild_config = await read_guild_config(discord_guild_id)
 
-    else:
-        return None
+    # returns None if clan is not found
+    return guild_config.clan_dict.get(clan_tag)
 
 
-def read_clan_list_from_guild(discord_guild_id):
+async def read_clan_list_from_guild(discord_guild_id):
     """
         finds clans in db, if clan is not found returns empty list
 
@@ -531,7 +750,8 @@ def read_clan_list_from_guild(discord_guild_id):
             obj list: list of clan object (guild_id, clan_tag)
     """
 
-    clan_data_list = list(clan.select_clan_all_from_guild(discord_guild_id))
+    clan_data_list = list(await db_executor.run(
+        clan.select_clan_all_from_guild, discord_guild_id))
     clan_obj_list = []
     for item in clan_data_list:
         guild_id, clan_tag = item
@@ -539,21 +759,59 @@ def read_clan_list_from_guild(discord_guild_id):
     return clan_obj_list
 
 
-def read_clan_count():
+async def read_clan_list_from_tag(clan_tag):
+    """
+        finds the clan in every guild it is claimed in,
+        if clan is not found returns empty list
+
+        Args:
+            clan_tag (str): tag for clan
+
+        Returns:
+            obj list: list of clan object (guild_id, clan_tag)
+    """
+
+    clan_data_list = list(await db_executor.run(
+        clan.select_clan_all_from_tag, clan_tag))
+    clan_obj_list = []
+    for item in clan_data_list:
+        guild_id, clan_tag = item
+        clan_obj_list.append(clan.Clan(guild_id, clan_tag))
+    return clan_obj_list
+
+
+async def read_clan_tag_list():
+    """
+        finds every clan tag claimed in any guild,
+        if no clan is found returns empty list
+
+        Returns:
+            list: list of distinct clan tags
+    """
+
+    clan_data_list = await db_executor.run(clan.select_clan_tag_all)
+
+    clan_tag_list = []
+    for clan_tag, in clan_data_list:
+        clan_tag_list.append(clan_tag)
+    return clan_tag_list
+
+
+async def read_clan_count():
     """
         returns int of clan count
 
         Returns:
             int: clan count
     """
-    clan_data = clan.select_clan_count()
+    clan_data = await db_executor.run(clan.select_clan_count)
 
     clan_count, = clan_data
 
     return clan_count
 
 
-def delete_clan(discord_guild_id, clan_tag):
+async def delete_clan(discord_guild_id, clan_tag):
     """
         deletes the requested guild's clan 
         and returns None if the clan could not be found after deletion
@@ -567,7 +825,10 @@ def delete_clan(discord_guild_id, clan_tag):
             obj: clan object (guild_id, clan_tag)
     """
     # delete the clan
-    clan_data = clan.delete_clan(discord_guild_id, clan_tag)
+    clan_data = await db_executor.run(
+        clan.delete_clan, discord_guild_id, clan_tag)
+    # clan roles were deleted with the clan
+    invalidate_guild_config(discord_guild_id)
     if clan_data:
         guild_id, clan_tag = clan_data
         return clan.Clan(guild_id, clan_tag)
@@ -576,7 +837,7 @@ def delete_clan(discord_guild_id, clan_tag):
 
 
 # clan role
-def claim_clan_role(discord_role_id, discord_guild_id, clan_tag):
+async def claim_clan_role(discord_role_id, discord_guild_id, clan_tag):
     """
         claims clan_role and returns clan_role object instance,
         if clan_role has been previously claimed return None
@@ -590,7 +851,8 @@ def claim_clan_role(discord_role_id, discord_guild_id, clan_tag):
             obj: clan role object 
                 (discord_guild_id, discord_role_id, clan_tag)
     """
-    clan_role_data = clan_role.select_clan_role(discord_role_id)
+    clan_role_data = await db_executor.run(
+        clan_role.select_clan_role, discord_role_id)
     # check if clan_role_data is None
     # if clan role data is not None that means clan role has been claimed
     # only when clan role has been claimed by guild trying to claim role
@@ -598,8 +860,10 @@ def claim_clan_role(discord_role_id, discord_guild_id, clan_tag):
         # if clan_role_data has values then return None
         return None
 
-    clan_role_data = clan_role.insert_clan_role(
+    clan_role_data = await db_executor.run(
+        clan_role.insert_clan_role,
         discord_role_id, discord_guild_id, clan_tag)
+    invalidate_guild_config(discord_guild_id)
 
     if clan_role_data:
         # if clan role data is found return clan role object
@@ -610,7 +874,7 @@ def claim_clan_role(discord_role_id, discord_guild_id, clan_tag):
         return None
 
 
-def read_clan_role(discord_role_id):
+async def read_clan_role(discord_role_id):
     """
         finds clan_role in db, if clan_role is not found returns None
 
@@ -621,7 +885,8 @@ def read_clan_role(discord_role_id):
             obj: clan role object 
                 (discord_guild_id, discord_role_id, clan_tag)
     """
-    clan_role_data = clan_role.select_clan_role(discord_role_id)
+    clan_role_data = await db_executor.run(
+        clan_role.select_clan_role, discord_role_id)
 
     if clan_role_data:
         # if clan role data is found return clan
@@ -632,7 +897,7 @@ def read_clan_role(discord_role_id):
         return None
 
 
-def read_clan_role_list(discord_role_id_list):
+async def read_clan_role_list(discord_role_id_list):
     """
         finds clan_role in db, 
         if no clan_role is not found returns empty list
@@ -646,7 +911,8 @@ def read_clan_role_list(discord_role_id_list):
                 obj: clan role object 
                     (discord_guild_id, discord_role_id, clan_tag)
     """
-    clan_role_data = clan_role.select_clan_role_from_list(discord_role_id_list)
+    clan_role_data = await db_executor.run(
+        clan_role.select_clan_role_from_list, discord_role_id_list)
 
     clan_role_list = []
     for role in clan_role_data:
@@ -658,7 +924,7 @@ def read_clan_role_list(discord_role_id_list):
     return clan_role_list
 
 
-def read_guild_clan_role(discord_guild_id):
+async def read_guild_clan_role(discord_guild_id):
     """
         finds clan_role in db from guild id, 
         if no clan_role is not found returns empty list
@@ -671,7 +937,8 @@ def read_guild_clan_role(discord_guild_id):
                 obj: clan role object
                     (discord_guild_id, discord_role_id, clan_tag)
     """
-    clan_role_data = clan_role.select_clan_role_from_guild(discord_guild_id)
+    clan_role_data = await db_executor.run(
+        clan_role.select_clan_role_from_guild, discord_guild_id)
 
     clan_role_list = []
     for role in clan_role_data:
@@ -683,7 +950,7 @@ def read_guild_clan_role(discord_guild_id):
     return clan_role_list
 
 
-def read_clan_role_from_tag(discord_guild_id, clan_tag):
+async def read_clan_role_from_tag(discord_guild_id, clan_tag):
     """
         finds clan_role in db, if clan_role is not found returns None
 
@@ -695,19 +962,13 @@ def read_clan_role_from_tag(discord_guild_id, clan_tag):
             obj: clan role object 
                 (discord_guild_id, discord_role_id, clan_tag)
     """
-    clan_role_data = clan_role.select_clan_role_from_tag(
-        discord_guild_id, clan_tag)
+    guild_config = await read_guild_config(discord_guild_id)
 
-    if clan_role_data:
-        # if clan role data is found return clan
-        discord_guild_id, discord_role_id, clan_tag = clan_role_data
-        return clan_role.ClanRole(discord_guild_id, discord_role_id, clan_tag)
+    # returns None if clan role is not found
+    return guild_config.clan_role_dict.get(clan_tag)
 
-    else:
-        return None
 
-
-def delete_clan_role(discord_role_id):
+async def delete_clan_role(discord_role_id):
     """
         deletes the requested clan_role 
         and returns None if the clan_role could not be found after deletion
@@ -720,8 +981,16 @@ def delete_clan_role(discord_role_id):
             obj: clan role object 
                 (discord_guild_id, discord_role_id, clan_tag)
     """
+    # find the guild of the clan role before it is deleted
+    clan_role_data = await db_executor.run(
+        clan_role.select_clan_role, discord_role_id)
+    if clan_role_data:
+        discord_guild_id, discord_role_id, clan_tag = clan_role_data
+        invalidate_guild_config(discord_guild_id)
+
     # delete the clan role
-    clan_role_data = clan_role.delete_clan_role(discord_role_id)
+    clan_role_data = await db_executor.run(
+        clan_role.delete_clan_role, discord_role_id)
     if clan_role_data:
         discord_guild_id, discord_role_id, clan_tag = clan_role_data
         return clan_role.ClanRole(discord_guild_id, discord_role_id, clan_tag)
@@ -730,7 +999,7 @@ def delete_clan_role(discord_role_id):
 
 
 # rank role model
-def read_rank_role_model(rank_model_name):
+async def read_rank_role_model(rank_model_name):
     """
         finds rank_role_model in db, if rank_role_model is not found 
         returns None
@@ -741,8 +1010,8 @@ def read_rank_role_model(rank_model_name):
         Returns:
             obj: rank role model object (model_name, clash_name)
     """
-    rank_role_model_data = (
-        rank_role_model.select_rank_role_model_name(rank_model_name))
+    rank_role_model_data = (await db_executor.run(
+        rank_role_model.select_rank_role_model_name, rank_model_name))
 
     if rank_role_model_data:
         # if rank role model data is found return rank role model
@@ -756,7 +1025,7 @@ def read_rank_role_model(rank_model_name):
 
 
 # rank role
-def claim_rank_role(discord_role_id, discord_guild_id, rank_model_name):
+async def claim_rank_role(discord_role_id, discord_guild_id, rank_model_name):
     """
         claims rank_role and returns rank_role object instance,
         if rank_role has been previously claimed return None
@@ -770,7 +1039,8 @@ def claim_rank_role(discord_role_id, discord_guild_id, rank_model_name):
             obj: rank role object 
                 (discord_guild_id, discord_role_id, model_name, clash_name)
     """
-    rank_role_data = rank_role.select_rank_role(discord_role_id)
+    rank_role_data = await db_executor.run(
+        rank_role.select_rank_role, discord_role_id)
     # check if rank_role_data is None
     # if rank role data is not None that means rank role has been claimed
     # only when rank role has been claimed by guild trying to claim role
@@ -778,8 +1048,10 @@ def claim_rank_role(discord_role_id, discord_guild_id, rank_model_name):
         # if rank_role_data has values then return None
         return None
 
-    rank_role_data = rank_role.insert_rank_role(
+    rank_role_data = await db_executor.run(
+        rank_role.insert_rank_role,
         discord_role_id, discord_guild_id, rank_model_name)
+    invalidate_guild_config(discord_guild_id)
 
     if rank_role_data:
         # if rank role data is found return rank role object
@@ -790,7 +1062,7 @@ def claim_rank_role(discord_role_id, discord_guild_id, rank_model_name):
         return None
 
 
-def read_rank_role(discord_role_id):
+async def read_rank_role(discord_role_id):
     """
         finds rank_role in db, if rank_role is not found returns None
 
@@ -801,7 +1073,8 @@ def read_rank_role(discord_role_id):
             obj: rank role object 
                 (discord_guild_id, discord_role_id, model_name, clash_name)
     """
-    rank_role_data = rank_role.select_rank_role(discord_role_id)
+    rank_role_data = await db_executor.run(
+        rank_role.select_rank_role, discord_role_id)
 
     if rank_role_data:
         # if rank role data is found return rank role
@@ -815,7 +1088,7 @@ def read_rank_role(discord_role_id):
         return None
 
 
-def read_guild_rank_role(discord_guild_id):
+async def read_guild_rank_role(discord_guild_id):
     """
         finds rank_role in db, 
         if no rank_role is not found returns empty list
@@ -829,7 +1102,8 @@ def read_guild_rank_role(discord_guild_id):
                     (discord_guild_id, discord_role_id, 
                     model_name, clash_name)
     """
-    rank_role_data = rank_role.select_guild_rank_role(discord_guild_id)
+    rank_role_data = await db_executor.run(
+        rank_role.select_guild_rank_role, discord_guild_id)
 
     rank_role_list = []
     for role in rank_role_data:
@@ -842,7 +1116,7 @@ def read_guild_rank_role(discord_guild_id):
     return rank_role_list
 
 
-def read_rank_role_list(discord_role_id):
+async def read_rank_role_list(discord_role_id):
     """
         finds rank_role in db, 
         if no rank_role is not found returns empty list
@@ -856,7 +1130,8 @@ def read_rank_role_list(discord_role_id):
                     (discord_guild_id, discord_role_id, 
                     model_name, clash_name)
     """
-    rank_role_data = rank_role.select_rank_role_from_list(discord_role_id)
+    rank_role_data = await db_executor.run(
+        rank_role.select_rank_role_from_list, discord_role_id)
 
     rank_role_list = []
     for role in rank_role_data:
@@ -869,7 +1144,7 @@ def read_rank_role_list(discord_role_id):
     return rank_role_list
 
 
-def read_rank_role_from_guild_and_clash(discord_guild_id, clash_name):
+async def read_rank_role_from_guild_and_clash(discord_guild_id, clash_name):
     """
         finds rank_role in db, if rank_role is not found returns None
 
@@ -881,21 +1156,13 @@ def read_rank_role_from_guild_and_clash(discord_guild_id, clash_name):
             obj: rank role object 
                 (discord_guild_id, discord_role_id, model_name, clash_name)
     """
-    rank_role_data = rank_role.select_rank_role_name_from_guild_and_clash(
-        discord_guild_id, clash_name)
-
-    if rank_role_data:
-        # if rank role data is found return rank role
-        discord_guild_role, discord_role_id, model_name, clash_name = rank_role_data
-        rank_role_obj = rank_role.RankRole(
-            discord_guild_role, discord_role_id, model_name, clash_name)
-        return rank_role_obj
+    guild_config = await read_guild_config(discord_guild_id)
 
-    else:
-        return None
+    # returns None if rank role is not found
+    return guild_config.rank_role_dict.get(clash_name)
 
 
-def delete_rank_role(discord_role_id):
+async def delete_rank_role(discord_role_id):
     """
         deletes the requested rank_role 
         and returns None if the rank_role could not be found after deletion
@@ -908,10 +1175,318 @@ def delete_rank_role(discord_role_id):
             obj: rank role object 
                 (discord_guild_id, discord_role_id, model_name, clash_name)
     """
+    # find the guild of the rank role before it is deleted
+    rank_role_data = await db_executor.run(
+        rank_role.select_rank_role, discord_role_id)
+    if rank_role_data:
+        discord_guild_role, discord_role_id, model_name, clash_name = rank_role_data
+        invalidate_guild_config(discord_guild_role)
+
     # delete the rank role
-    rank_role_data = rank_role.delete_rank_role(discord_role_id)
+    rank_role_data = await db_executor.run(
+        rank_role.delete_rank_role, discord_role_id)
     if rank_role_data:
         discord_guild_role, discord_role_id, model_name, clash_name = rank_role_data
         return rank_role.RankRole(discord_guild_role, discord_role_id, model_name, clash_name)
     else:
         return None
+
+
+# war history
+def war_season(end_time):
+    """
+        returns the war season "YYYY-MM" for a war end time
+    """
+    return end_time.strftime("%Y-%m")
+
+
+def current_war_season():
+    """
+        returns the war season "YYYY-MM" of the current utc time
+    """
+    return war_season(datetime.datetime.utcnow())
+
+
+async def claim_war(war_obj):
+    """
+        stores an ended war with its members and attacks,
+        storing the same clan's war with the same end time
+        again updates it
+
+        Args:
+            war_obj (obj): coc.py war object, state warEnded
+
+        Returns:
+            obj: war object
+    """
+
+    end_time = war_obj.end_time.time
+    season = war_season(end_time)
+
+    war_obj_db = war.War(
+        war_obj.clan.tag, end_time, season, war_obj.war_tag,
+        war_obj.clan.name, war_obj.opponent.tag, war_obj.opponent.name,
+        war_obj.team_size, war_obj.attacks_per_member,
+        war_obj.clan.stars, war_obj.clan.destruction,
+        war_obj.opponent.stars, war_obj.opponent.destruction,
+        war_obj.status)
+
+    war_id, = await db_executor.run(
+        war.insert_war,
+        war_obj_db.clan_tag, war_obj_db.end_time, war_obj_db.season,
+        war_obj_db.war_tag, war_obj_db.clan_name,
+        war_obj_db.opponent_tag, war_obj_db.opponent_name,
+        war_obj_db.team_size, war_obj_db.attacks_per_member,
+        war_obj_db.clan_stars, war_obj_db.clan_destruction,
+        war_obj_db.opponent_stars, war_obj_db.opponent_destruction,
+        war_obj_db.status)
+
+    # members scored with the war score module
+    score_arrays = war_score_utils.war_member_scores(war_obj)
+
+    war_member_row_list = []
+    for member_index, member in enumerate(war_obj.clan.members):
+        war_member_row_list.append((
+            war_id, member.tag, member.name,
+            member.town_hall, member.map_position,
+            int(score_arrays.potential_attack_count[member_index]),
+            int(score_arrays.attack_count[member_index]),
+            int(score_arrays.stars[member_index]),
+            float(score_arrays.destruction[member_index]),
+            float(score_arrays.score[member_index])
+        ))
+
+    if war_member_row_list:
+        await db_executor.run(
+            war_member.insert_war_member_list, war_member_row_list)
+
+    # attack columns follow clan member then attack order
+    (member_index_array, stars_array, destruction_array,
+     attacker_th_array, defender_th_array) = (
+        war_score_utils.war_attack_arrays(war_obj))
+    attack_score_array = war_score_utils.attack_score_array(
+        stars_array, destruction_array, attacker_th_array, defender_th_array)
+
+    war_attack_row_list = []
+    attack_index = 0
+    for member in war_obj.clan.members:
+        for attack in member.attacks:
+            war_attack_row_list.append((
+                war_id, attack.order, member.tag, member.town_hall,
+                attack.defender_tag,
+                int(defender_th_array[attack_index]),
+                attack.stars, attack.destruction, attack.duration,
+                float(attack_score_array[attack_index])
+            ))
+            attack_index += 1
+
+    if war_attack_row_list:
+        await db_executor.run(
+            war_attack.insert_war_attack_list, war_attack_row_list)
+
+    # add the war to the season totals once, storing it again is skipped
+    await db_executor.run(
+        war_season_member.update_war_season_member_from_war, war_id)
+
+    return war_obj_db
+
+
+async def read_war_list_from_clan(clan_tag, war_count=10):
+    """
+        returns the clan's latest stored wars, newest first,
+        and returns empty list if no wars are found
+
+        Args:
+            clan_tag (str): clan tag
+            war_count (int): most wars returned
+
+        Returns:
+            list: list of war objects
+    """
+
+    war_data_list = await db_executor.run(
+        war.select_war_from_clan, clan_tag, war_count)
+
+    war_obj_list = []
+    for item in war_data_list:
+        war_obj_list.append(war.War(*item))
+    return war_obj_list
+
+
+async def read_war_stats_from_clan(clan_tag, season=None):
+    """
+        returns the clan's stored war totals for season,
+        or lifetime if season is None
+
+        Args:
+            clan_tag (str): clan tag
+            season (str): war season "YYYY-MM"
+
+        Returns:
+            dict: war_count, won_count, lost_count, tied_count,
+                stars, destruction
+    """
+
+    (war_count, won_count, lost_count, tied_count,
+     stars, destruction) = await db_executor.run(
+        war.select_war_stats_from_clan, clan_tag, season)
+
+    return {
+        'war_count': int(war_count),
+        'won_count': int(won_count),
+        'lost_count': int(lost_count),
+        'tied_count': int(tied_count),
+        'stars': int(stars),
+        'destruction': float(destruction)
+    }
+
+
+async def read_war_member_list_from_player(player_tag, war_count=10):
+    """
+        returns the player's latest stored war results, newest first,
+        and returns empty list if none are found
+
+        Args:
+            player_tag (str): player tag
+            war_count (int): most wars returned
+
+        Returns:
+            list: list of war member objects
+    """
+
+    war_member_data_list = await db_executor.run(
+        war_member.select_war_member_from_player, player_tag, war_count)
+
+    war_member_obj_list = []
+    for item in war_member_data_list:
+        war_member_obj_list.append(war_member.WarMember(*item))
+    return war_member_obj_list
+
+
+async def read_war_member_list_from_clan_war(clan_tag, end_time):
+    """
+        returns the members of a stored war in map position order,
+        and returns empty list if the war is not stored
+
+        Args:
+            clan_tag (str): clan tag
+            end_time (datetime): war end time in utc
+
+        Returns:
+            list: list of war member objects
+    """
+
+    war_member_data_list = await db_executor.run(
+        war_member.select_war_member_from_clan_war, clan_tag, end_time)
+
+    war_member_obj_list = []
+    for item in war_member_data_list:
+        war_member_obj_list.append(war_member.WarMember(*item))
+    return war_member_obj_list
+
+
+async def read_war_member_stats_from_player(player_tag, season=None):
+    """
+        returns the player's stored war totals for season,
+        or lifetime if season is None
+
+        Args:
+            player_tag (str): player tag
+            season (str): war season "YYYY-MM"
+
+        Returns:
+            dict: war_count, potential_attack_count, attack_count,
+                stars, destruction, score
+    """
+
+    (war_count, potential_attack_count, attack_count,
+     stars, destruction, score) = await db_executor.run(
+        war_member.select_war_member_stats_from_player, player_tag, season)
+
+    return {
+        'war_count': int(war_count),
+        'potential_attack_count': int(potential_attack_count),
+        'attack_count': int(attack_count),
+        'stars': int(stars),
+        'destruction': float(destruction),
+        'score': float(score)
+    }
+
+
+async def read_war_attack_list_from_player(player_tag, attack_count=10):
+    """
+        returns the player's latest stored attacks, newest first,
+        and returns empty list if none are found
+
+        Args:
+            player_tag (str): player tag
+            attack_count (int): most attacks returned
+
+        Returns:
+            list: list of war attack objects
+    """
+
+    war_attack_data_list = await db_executor.run(
+        war_attack.select_war_attack_from_player, player_tag, attack_count)
+
+    war_attack_obj_list = []
+    for item in war_attack_data_list:
+        war_attack_obj_list.append(war_attack.WarAttack(*item))
+    return war_attack_obj_list
+
+
+async def read_war_attack_list_from_clan_war(clan_tag, end_time):
+    """
+        returns the war clan's attacks of a stored war in attack order,
+        and returns empty list if the war is not stored
+
+        Args:
+            clan_tag (str): clan tag
+            end_time (datetime): war end time in utc
+
+        Returns:
+            list: list of war attack objects
+    """
+
+    war_attack_data_list = await db_executor.run(
+        war_attack.select_war_attack_from_clan_war, clan_tag, end_time)
+
+    war_attack_obj_list = []
+    for item in war_attack_data_list:
+        war_attack_obj_list.append(war_attack.WarAttack(*item))
+    return war_attack_obj_list
+
+
+async def read_war_season_leaderboard(
+        season, war_type, clan_tag_list, member_count=25):
+    """
+        returns the highest scoring members of the clans
+        in clan_tag_list for a season from the season totals,
+        and returns empty list if none are found
+
+        Args:
+            season (str): war season "YYYY-MM"
+            war_type (str): "war" or "cwl"
+            clan_tag_list (list): list of clan tags
+            member_count (int): most members returned
+
+        Returns:
+            list: list of war season member objects, best first
+    """
+
+    # cwl scores are weighted by the rounds each member played
+    if war_type == "cwl":
+        war_season_member_data_list = await db_executor.run(
+            war_season_member.select_war_season_member_cwl_leaderboard,
+            season, clan_tag_list, member_count)
+
+    else:
+        war_season_member_data_list = await db_executor.run(
+            war_season_member.select_war_season_member_leaderboard,
+            season, war_type, clan_tag_list, member_count)
+
+    war_season_member_obj_list = []
+    for item in war_season_member_data_list:
+        war_season_member_obj_list.append(
+            war_season_member.WarSeasonMember(*item))
+    return war_season_member_obj_list
@@ -10,6 +10,7 @@ from coc import (
 
 from responders.DiscordResponder import get_emoji
 import responders.ClashResponder as clash_responder
+from utils import war_score_utils
 
 
 def war_info(war_obj, discord_emoji_list, client_emoji_list):
@@ -471,18 +472,16 @@ def war_clan_score(war_obj):
         })
         return return_list
 
-    scored_member_list = []
-    # getting scored_member for each clan member
-    for member in war_obj.clan.members:
-        scored_member_list.append(
-            clash_responder.member_score(member, war_obj))
+    # scoring every clan member at once
+    score_arrays = war_score_utils.war_member_scores(war_obj)
 
     scored_member_list = sorted(
-        scored_member_list, key=lambda member: member.score, reverse=True)
-    for member in scored_member_list:
+        zip(score_arrays.name_list, score_arrays.score.tolist()),
+        key=lambda member: member[1], reverse=True)
+    for member_name, member_score in scored_member_list:
         return_list.append({
-            "name": member.name,
-            "value": f"{round(member.score, 3)}"
+            "name": member_name,
+            "value": f"{round(member_score, 3)}"
         })
     return return_list
 
@@ -597,3 +596,235 @@ async def war_lineup_member(
         })
 
     return field_dict_list
+
+
+def war_season_leaderboard(
+        war_season_member_list, season,
+        discord_emoji_list, client_emoji_list):
+    """
+        returns a response list of the season leaderboard
+
+        Args:
+            war_season_member_list (list): war season member objects
+                from db, best first
+            season (str): war season "YYYY-MM"
+            discord_emoji_list (list): discord emojis
+            client_emoji_list (list): client emojis
+
+        Returns:
+            list: field_dict_list
+    """
+
+    if len(war_season_member_list) == 0:
+        return [{
+            'name': f"no wars stored for {season}",
+            'value': "the leaderboard fills as wars end"
+        }]
+
+    star_emoji = get_emoji(
+        "War Star", discord_emoji_list, client_emoji_list)
+
+    field_dict_list = []
+    position_index = 0
+    for member in war_season_member_list:
+        position_index += 1
+
+        field_dict_list.append({
+            'name': f"{position_index}: {member.name}",
+            'value': (
+                f"{round(member.score, 3)} score\n"
+                f"{member.stars} {star_emoji}\n"
+                f"{member.attack_count}/{member.potential_attack_count} "
+                f"attacks in {member.war_count} "
+                f"{'war' if member.war_count == 1 else 'wars'}"
+            )
+        })
+
+    return field_dict_list
+
+
+def war_history_stats_string(war_member_stats, star_emoji):
+    "returns a player's stored war totals as a field value"
+
+    if war_member_stats['war_count'] == 0:
+        return "no wars stored"
+
+    return (
+        f"{round(war_member_stats['score'], 3)} score\n"
+        f"{war_member_stats['stars']} {star_emoji}\n"
+        f"{war_member_stats['attack_count']}/"
+        f"{war_member_stats['potential_attack_count']} "
+        f"attacks in {war_member_stats['war_count']} "
+        f"{'war' if war_member_stats['war_count'] == 1 else 'wars'}"
+    )
+
+
+def war_history_player(
+        season_war_member_stats, war_member_stats, season,
+        war_member_list, war_attack_list,
+        discord_emoji_list, client_emoji_list):
+    """
+        returns a response list of a player's stored war history
+
+        Args:
+            season_war_member_stats (dict): player's war totals for season
+            war_member_stats (dict): player's lifetime war totals
+            season (str): war season "YYYY-MM"
+            war_member_list (list): player's latest war member objects
+            war_attack_list (list): player's latest war attack objects
+            discord_emoji_list (list): discord emojis
+            client_emoji_list (list): client emojis
+
+        Returns:
+            list: field_dict_list
+    """
+
+    if war_member_stats['war_count'] == 0:
+        return [{
+            'name': "no wars stored",
+            'value': "history fills as wars end"
+        }]
+
+    star_emoji = get_emoji(
+        "War Star", discord_emoji_list, client_emoji_list)
+
+    field_dict_list = [{
+        'name': f"{season} season",
+        'value': war_history_stats_string(season_war_member_stats, star_emoji)
+    }, {
+        'name': "lifetime",
+        'value': war_history_stats_string(war_member_stats, star_emoji)
+    }]
+
+    field_value = ""
+    for member in war_member_list:
+        field_value += (
+            f"{member.end_time.strftime('%Y-%m-%d')}: "
+            f"{member.stars} {star_emoji} "
+            f"{member.attack_count}/{member.potential_attack_count} "
+            f"attacks, {round(member.score, 3)} score\n")
+
+    # remove the last 1 character of the string
+    # removing "\n"
+    field_dict_list.append({
+        'name': "latest wars",
+        'value': field_value[:-1]
+    })
+
+    if len(war_attack_list) != 0:
+        field_value = ""
+        for attack in war_attack_list:
+            field_value += (
+                f"{attack.end_time.strftime('%Y-%m-%d')}: "
+                f"TH {attack.attacker_town_hall} vs "
+                f"TH {attack.defender_town_hall}, "
+                f"{attack.stars} {star_emoji} {attack.destruction}%\n")
+
+        field_dict_list.append({
+            'name': "latest attacks",
+            'value': field_value[:-1]
+        })
+
+    return field_dict_list
+
+
+def war_history_clan_stats_string(war_stats, star_emoji):
+    "returns a clan's stored war totals as a field value"
+
+    if war_stats['war_count'] == 0:
+        return "no wars stored"
+
+    return (
+        f"{war_stats['won_count']} won, {war_stats['lost_count']} lost, "
+        f"{war_stats['tied_count']} tied\n"
+        f"{war_stats['stars']} {star_emoji}, "
+        f"{round(war_stats['destruction'], 2)}% average destruction\n"
+        f"{war_stats['war_count']} "
+        f"{'war' if war_stats['war_count'] == 1 else 'wars'}"
+    )
+
+
+def war_history_clan(
+        season_war_stats, war_stats, season, war_list,
+        war_member_list, war_attack_list,
+        discord_emoji_list, client_emoji_list):
+    """
+        returns a response list of a clan's stored war history,
+        with the members and attacks of its latest stored war
+
+        Args:
+            season_war_stats (dict): clan's war totals for season
+            war_stats (dict): clan's lifetime war totals
+            season (str): war season "YYYY-MM"
+            war_list (list): clan's latest war objects, newest first
+            war_member_list (list): latest war's war member objects
+            war_attack_list (list): latest war's war attack objects
+            discord_emoji_list (list): discord emojis
+            client_emoji_list (list): client emojis
+
+        Returns:
+            list: field_dict_list
+    """
+
+    if len(war_list) == 0:
+        return [{
+            'name': "no wars stored",
+            'value': "history fills as wars end"
+        }]
+
+    star_emoji = get_emoji(
+        "War Star", discord_emoji_list, client_emoji_list)
+
+    field_dict_list = [{
+        'name': f"{season} season",
+        'value': war_history_clan_stats_string(season_war_stats, star_emoji)
+    }, {
+        'name': "lifetime",
+        'value': war_history_clan_stats_string(war_stats, star_emoji)
+    }]
+
+    field_value = ""
+    for war_obj in war_list:
+        field_value += (
+            f"{war_obj.end_time.strftime('%Y-%m-%d')} "
+            f"vs. {war_obj.opponent_name}: "
+            f"{war_obj.clan_stars}-{war_obj.opponent_stars} "
+            f"{war_obj.status}\n")
+
+    # remove the last 1 character of the string
+    # removing "\n"
+    field_dict_list.append({
+        'name': "latest wars",
+        'value': field_value[:-1]
+    })
+
+    # attacker tag: latest war's attacks in attack order
+    attack_dict = {}
+    for attack in war_attack_list:
+        attack_dict.setdefault(attack.attacker_tag, []).append(attack)
+
+    latest_war = war_list[0]
+    field_dict_list.append({
+        'name': (f"latest war {latest_war.end_time.strftime('%Y-%m-%d')} "
+                 f"vs. {latest_war.opponent_name}"),
+        'value': (f"{latest_war.clan_stars}-{latest_war.opponent_stars} "
+                  f"{latest_war.status}")
+    })
+
+    for member in war_member_list:
+        field_value = (
+            f"{round(member.score, 3)} score\n"
+            f"{member.attack_count}/{member.potential_attack_count} attacks")
+
+        for attack in attack_dict.get(member.player_tag, []):
+            field_value += (
+                f"\nTH {attack.attacker_town_hall} vs "
+                f"TH {attack.defender_town_hall}, "
+                f"{attack.stars} {star_emoji} {attack.destruction}%")
+
+        field_dict_list.append({
+            'name': f"{member.map_position}. {member.name}",
+            'value': field_value
+        })
+
+    return field_dict_list
@@ -22,7 +22,7 @@ from responders import (
 )
 
 
-def help_main(
+async def help_main(
         bot,
         inter: Interaction,
         client_data: Client_Data.ClashDiscord_Data):
@@ -34,7 +34,7 @@ def help_main(
     button_list = []
 
     # get the db user
-    db_user = db_responder.read_user(inter.author.id)
+    db_user = await db_responder.read_user(inter.author.id)
 
     # return client user help if user not found
     if db_user is None:
@@ -54,7 +54,7 @@ def help_main(
                 return help_dict
 
     # get the db guild
-    db_guild = db_responder.read_guild(inter.guild.id)
+    db_guild = await db_responder.read_guild(inter.guild.id)
 
     for category in client_data.bot_categories:
 
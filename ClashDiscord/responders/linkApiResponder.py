@@ -1,16 +1,24 @@
-from linkAPI.client import LinkApiClient
+import asyncio
+import aiohttp
+from linkAPI.async_client import AsyncLinkApiClient
 from linkAPI.errors import *
 from linkAPI.playerLinkModel import PlayerLink
 from responders import RazBotDB_Responder as db_responder
 
 
-def add_secure_link(linkapi_client: LinkApiClient,
+# discord ids and player tags sent in each LinkAPI /batch request
+link_batch_size = 500
+# LinkAPI add link requests in flight at once during reconciliation
+link_push_concurrency = 5
+
+
+async def add_secure_link(linkapi_client: AsyncLinkApiClient,
                     player_tag: str, discord_user_id: int):
     """
         adding player link from a secured method (api key or super user)
 
         Args:
-            linkapi_client (LinkApiClient): client for linkAPI
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
             player_tag (str): clash of clans player tag
             discord_user_id (int): user ID from discord
 
@@ -21,7 +29,7 @@ def add_secure_link(linkapi_client: LinkApiClient,
 
     # get LinkAPI player link
     try:
-        player_link = linkapi_client.get_player_tag_link(
+        player_link = await linkapi_client.get_player_tag_link(
             player_tag=player_tag)
     except LoginError:
         print("Error logging into LinkAPI")
@@ -37,7 +45,7 @@ def add_secure_link(linkapi_client: LinkApiClient,
         # link needs to be deleted so it can be added
         if player_link.discord_user_id != discord_user_id:
             try:
-                linkapi_client.delete_link(
+                await linkapi_client.delete_link(
                     player_tag=player_tag)
                 player_link = None
             except LoginError:
@@ -49,7 +57,7 @@ def add_secure_link(linkapi_client: LinkApiClient,
     if not player_link:
         # add link in LinkAPI
         try:
-            player_link = linkapi_client.add_link(
+            player_link = await linkapi_client.add_link(
                 player_tag=player_tag,
                 discord_user_id=discord_user_id)
         except LoginError:
@@ -61,13 +69,13 @@ def add_secure_link(linkapi_client: LinkApiClient,
                                 f"cannot securely add link")
 
 
-def add_link(linkapi_client: LinkApiClient,
+async def add_link(linkapi_client: AsyncLinkApiClient,
              player_tag: str, discord_user_id: int):
     """
         adding player link
 
         Args:
-            linkapi_client (LinkApiClient): client for linkAPI
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
             player_tag (str): clash of clans player tag
             discord_user_id (int): user ID from discord
 
@@ -78,7 +86,7 @@ def add_link(linkapi_client: LinkApiClient,
 
     # get LinkAPI player link
     try:
-        player_link = linkapi_client.get_player_tag_link(
+        player_link = await linkapi_client.get_player_tag_link(
             player_tag=player_tag)
     except LoginError:
         print("Error logging into LinkAPI")
@@ -100,7 +108,7 @@ def add_link(linkapi_client: LinkApiClient,
     if not player_link:
         # add link in LinkAPI
         try:
-            player_link = linkapi_client.add_link(
+            player_link = await linkapi_client.add_link(
                 player_tag=player_tag,
                 discord_user_id=discord_user_id)
         except LoginError:
@@ -112,20 +120,20 @@ def add_link(linkapi_client: LinkApiClient,
                                 f"cannot add link")
 
 
-def remove_link(linkapi_client: LinkApiClient,
+async def remove_link(linkapi_client: AsyncLinkApiClient,
                 player_tag: str):
     """
         removing player link
 
         Args:
-            linkapi_client (LinkApiClient): client for linkAPI
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
             player_tag (str): clash of clans player tag
 
         Raises:
             ConflictError: database conflict
     """
     try:
-        linkapi_client.delete_link(
+        await linkapi_client.delete_link(
             player_tag=player_tag)
     except LoginError:
         print("Error logging into LinkAPI")
@@ -133,15 +141,15 @@ def remove_link(linkapi_client: LinkApiClient,
         print(f"Player tag {player_tag} not found in LinkAPI db")
 
 
-def pull_from_link(
-    linkapi_client: LinkApiClient,
+async def pull_from_link(
+    linkapi_client: AsyncLinkApiClient,
     discord_user_id: int
 ):
     """
         pulls link api data and saves to ClashCommander db
 
         Args:
-            linkapi_client (LinkApiClient): client for linkAPI
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
             discord_user_id (int): discord user id
 
         Raises:
@@ -151,7 +159,7 @@ def pull_from_link(
 
     # get link api data
     try:
-        player_links = linkapi_client.get_discord_user_link(
+        player_links = await linkapi_client.get_discord_user_link(
             discord_user_id=discord_user_id)
     except LoginError:
         print("Error logging into LinkAPI")
@@ -160,7 +168,7 @@ def pull_from_link(
     except NotFoundError:
         return
 
-    claimed_players = db_responder.read_player_list(
+    claimed_players = await db_responder.read_player_list(
         discord_user_id=discord_user_id)
 
     # add player claim if player has not been claimed by user or anyone else
@@ -186,7 +194,7 @@ def pull_from_link(
 
         # player data not synced to user
         # search for player claimed by other user
-        other_player_claim = db_responder.read_player_from_tag(
+        other_player_claim = await db_responder.read_player_from_tag(
             player_tag=player_link.player_tag)
 
         # player claim found from other user
@@ -197,7 +205,7 @@ def pull_from_link(
 
         # other player claim not found
         # claim player
-        new_player_claim = db_responder.claim_player(
+        new_player_claim = await db_responder.claim_player(
             discord_user_id=player_link.discord_user_id,
             player_tag=player_link.player_tag)
 
@@ -211,15 +219,15 @@ def pull_from_link(
         continue
 
 
-def push_to_link(
-    linkapi_client: LinkApiClient,
+async def push_to_link(
+    linkapi_client: AsyncLinkApiClient,
     discord_user_id: int
 ):
     """
         pushes ClashCommander db data to LinkAPI
 
         Args:
-            linkapi_client (LinkApiClient): client for linkAPI
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
             discord_user_id (int): discord user id
 
         Raises:
@@ -227,7 +235,7 @@ def push_to_link(
                 (either linked to other player or other error)
     """
 
-    claimed_players = db_responder.read_player_list(
+    claimed_players = await db_responder.read_player_list(
         discord_user_id=discord_user_id)
 
     # no claimed players found, so there is nothing to push, return
@@ -236,7 +244,7 @@ def push_to_link(
 
     # get link api data
     try:
-        player_links = linkapi_client.get_discord_user_link(
+        player_links = await linkapi_client.get_discord_user_link(
             discord_user_id=discord_user_id)
     except LoginError:
         player_links = []
@@ -267,7 +275,7 @@ def push_to_link(
             continue
 
         try:
-            add_link(
+            await add_link(
                 linkapi_client=linkapi_client,
                 player_tag=player_claim.player_tag,
                 discord_user_id=discord_user_id)
@@ -275,15 +283,15 @@ def push_to_link(
             raise ConflictError(arg)
 
 
-def sync_link(
-    linkapi_client: LinkApiClient,
+async def sync_link(
+    linkapi_client: AsyncLinkApiClient,
     discord_user_id: int
 ):
     """
         sync ClashCommander db and LinkAPI data
 
         Args:
-            linkapi_client (LinkApiClient): client for linkAPI
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
             discord_user_id (int): discord user id
 
         Raises:
@@ -293,7 +301,7 @@ def sync_link(
 
     # pull from LinkAPI to ClashCommander db
     try:
-        pull_from_link(
+        await pull_from_link(
             linkapi_client=linkapi_client,
             discord_user_id=discord_user_id)
     except ConflictError as arg:
@@ -301,8 +309,239 @@ def sync_link(
 
     # push from ClashCommander db to LinkAPI
     try:
-        push_to_link(
+        await push_to_link(
             linkapi_client=linkapi_client,
             discord_user_id=discord_user_id)
     except ConflictError as arg:
         raise ConflictError(arg)
+
+
+async def get_batch_link_dict(
+    linkapi_client: AsyncLinkApiClient,
+    batch_list: list
+):
+    """
+        gets LinkAPI links for discord ids and player tags
+        in chunked /batch requests
+
+        Args:
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
+            batch_list (list): discord user ids and player tags
+
+        Raises:
+            LoginError: failed login
+
+        Returns:
+            dict: player tag: linked discord user id
+    """
+
+    link_dict = {}
+
+    for index in range(0, len(batch_list), link_batch_size):
+        batch_chunk = [
+            str(item) for item in batch_list[index:index + link_batch_size]]
+
+        try:
+            player_links = await linkapi_client.get_batch_links(batch_chunk)
+        # nothing in this chunk is linked
+        except NotFoundError:
+            continue
+
+        for player_link in player_links:
+            link_dict[player_link.player_tag] = player_link.discord_user_id
+
+    return link_dict
+
+
+async def reconcile_links(
+    linkapi_client: AsyncLinkApiClient,
+    discord_user_id_list: list
+):
+    """
+        syncs ClashCommander db and LinkAPI data for many users,
+        links and claims are read in bulk and diffed in memory
+
+        Args:
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
+            discord_user_id_list (list): discord ids of claimed users
+
+        Raises:
+            LoginError: failed login
+
+        Returns:
+            dict: reconciliation_payload
+                (user_count, pulled_count, pushed_count, conflict_list)
+    """
+
+    # every claimed player of the requested users in one query
+    db_player_dict = await db_responder.read_player_list_from_user_list(
+        discord_user_id_list)
+
+    claimed_tag_dict = {}
+    for discord_user_id, db_player_list in db_player_dict.items():
+        for db_player in db_player_list:
+            claimed_tag_dict[db_player.player_tag] = discord_user_id
+
+    # links for the users and for their claimed tags,
+    # tags can be linked to users outside the list
+    link_dict = await get_batch_link_dict(
+        linkapi_client, list(db_player_dict) + list(claimed_tag_dict))
+
+    conflict_list = []
+
+    # LinkAPI links to requested users that are not claimed by them
+    pull_tag_list = []
+    for player_tag, discord_user_id in link_dict.items():
+        if discord_user_id not in db_player_dict:
+            continue
+
+        if claimed_tag_dict.get(player_tag) == discord_user_id:
+            continue
+
+        # claimed by a different requested user,
+        # reported as a conflict when pushing that claim
+        if player_tag in claimed_tag_dict:
+            continue
+
+        pull_tag_list.append(player_tag)
+
+    # pull tags claimed by users outside the list
+    other_claim_dict = await db_responder.read_user_dict_from_tag_list(
+        pull_tag_list)
+
+    # users that have an active player or get one in this pull
+    active_user_set = set()
+    for discord_user_id, db_player_list in db_player_dict.items():
+        for db_player in db_player_list:
+            if db_player.active:
+                active_user_set.add(discord_user_id)
+
+    player_claim_list = []
+    for player_tag in pull_tag_list:
+        if player_tag in other_claim_dict:
+            conflict_list.append(
+                f"Player with tag {player_tag} claimed by different user")
+            continue
+
+        discord_user_id = link_dict[player_tag]
+
+        # first claim of a user without an active player becomes active
+        active = discord_user_id not in active_user_set
+        active_user_set.add(discord_user_id)
+
+        player_claim_list.append((discord_user_id, player_tag, active))
+
+    # claimed players that are not linked in LinkAPI
+    push_link_list = []
+    for player_tag, discord_user_id in claimed_tag_dict.items():
+        linked_discord_user_id = link_dict.get(player_tag)
+
+        if linked_discord_user_id is None:
+            push_link_list.append((player_tag, discord_user_id))
+
+        elif linked_discord_user_id != discord_user_id:
+            conflict_list.append(
+                f"Tag {player_tag} already in DB, "
+                f"cannot add link, linked to different user")
+
+    # apply pulled claims with one bulk insert
+    pulled_count = await db_responder.claim_player_list(player_claim_list)
+
+    # LinkAPI has no bulk add, push links with bounded concurrency
+    push_semaphore = asyncio.Semaphore(link_push_concurrency)
+
+    # pulled claims are already applied, a failed push is reported
+    # with the conflicts rather than raised
+    async def push_link(player_tag, discord_user_id):
+        async with push_semaphore:
+            try:
+                player_link = await linkapi_client.add_link(
+                    player_tag=player_tag,
+                    discord_user_id=discord_user_id)
+            except InvalidTagError:
+                return f"Player tag {player_tag} not valid"
+            except ConflictError:
+                return f"Tag {player_tag} already in DB, cannot add link"
+            except LoginError:
+                return f"Tag {player_tag} not pushed, LinkAPI login failed"
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return f"Tag {player_tag} not pushed, LinkAPI not reachable"
+
+        # add_link returns None for any unexpected status
+        if player_link is None:
+            return f"Tag {player_tag} not pushed, LinkAPI request failed"
+
+        return None
+
+    push_result_list = await asyncio.gather(*(
+        push_link(player_tag, discord_user_id)
+        for player_tag, discord_user_id in push_link_list
+    ))
+
+    pushed_count = 0
+    for push_result in push_result_list:
+        if push_result is None:
+            pushed_count += 1
+        else:
+            conflict_list.append(push_result)
+
+    return {
+        'user_count': len(db_player_dict),
+        'pulled_count': pulled_count,
+        'pushed_count': pushed_count,
+        'conflict_list': conflict_list
+    }
+
+
+async def reconcile_guild_links(
+    linkapi_client: AsyncLinkApiClient,
+    guild
+):
+    """
+        syncs ClashCommander db and LinkAPI data
+        for every claimed user in a guild
+
+        Args:
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
+            guild (disnake.Guild): guild to sync
+
+        Raises:
+            LoginError: failed login
+
+        Returns:
+            dict: reconciliation_payload
+                (user_count, pulled_count, pushed_count, conflict_list)
+    """
+
+    member_id_list = [
+        member.id for member in guild.members if not member.bot]
+
+    # only claimed users can be synced
+    discord_user_id_list = []
+    for db_user in await db_responder.read_user_list_from_discord_id_list(
+            member_id_list):
+        discord_user_id_list.append(db_user.discord_id)
+
+    return await reconcile_links(linkapi_client, discord_user_id_list)
+
+
+async def reconcile_all_links(linkapi_client: AsyncLinkApiClient):
+    """
+        syncs ClashCommander db and LinkAPI data for every claimed user
+
+        Args:
+            linkapi_client (AsyncLinkApiClient): client for linkAPI
+
+        Raises:
+            LoginError: failed login
+
+        Returns:
+            dict: reconciliation_payload
+                (user_count, pulled_count, pushed_count, conflict_list)
+    """
+
+    discord_user_id_list = []
+    for db_user in await db_responder.read_user_all():
+        discord_user_id_list.append(db_user.discord_id)
+
+    return await reconcile_links(linkapi_client, discord_user_id_list)
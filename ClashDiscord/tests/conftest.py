@@ -0,0 +1,7 @@
+import os
+import sys
+
+
+# modules import each other from the ClashDiscord directory,
+# the same way main.py is run
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
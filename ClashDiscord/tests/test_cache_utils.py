@@ -0,0 +1,50 @@
+import asyncio
+
+from utils.cache_utils import TTLCache
+
+
+def test_get_or_load_survives_cancelled_loading_caller():
+    async def run():
+        cache = TTLCache(60)
+        load_list = []
+
+        async def load(value):
+            load_list.append(value)
+            await asyncio.sleep(0.05)
+            return value * 2
+
+        # the first caller starts the load, the second waits on it
+        first = asyncio.ensure_future(cache.get_or_load("key", load, 2))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_load("key", load, 2))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+
+        assert await second == 4
+        assert first.cancelled()
+        assert load_list == [2]
+        assert cache.get("key") == 4
+
+    asyncio.run(run())
+
+
+def test_get_or_load_failed_load_is_not_cached():
+    async def run():
+        cache = TTLCache(60)
+
+        async def load():
+            raise ValueError("load failed")
+
+        for _ in range(2):
+            try:
+                await cache.get_or_load("key", load)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("load error was not raised")
+
+        assert cache.get("key") is None
+        assert len(cache._load_dict) == 0
+
+    asyncio.run(run())
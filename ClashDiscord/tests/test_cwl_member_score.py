@@ -0,0 +1,174 @@
+import math
+from types import SimpleNamespace
+
+from responders import ClashResponder
+
+
+def old_cwl_member_score(cwl_wars, cwl_member):
+    """
+        cwl_member_score as it was before cwl_member_score_list,
+        scores a single member by scanning each war's member list
+    """
+
+    scored_member = SimpleNamespace(
+        tag=cwl_member.tag,
+        name=cwl_member.name,
+        participated_wars=0,
+        potential_attack_count=0,
+        attack_count=0,
+        stars=0,
+        destruction=0,
+        round_scores=[],
+        score=0)
+
+    for war in cwl_wars:
+        if war.war_tag == "#0":
+            continue
+
+        if war.state != "warEnded":
+            continue
+
+        round_score = 0
+        for war_member in war.clan.members:
+            if war_member.tag == cwl_member.tag:
+                scored_member.participated_wars += 1
+                scored_member.potential_attack_count += 1
+
+                war_member_score = ClashResponder.member_score(
+                    war_member, war)
+                round_score = war_member_score.score
+                scored_member.attack_count += war_member_score.attack_count
+                scored_member.stars += war_member_score.stars
+                scored_member.destruction += war_member_score.destruction
+
+                break
+
+        scored_member.round_scores.append(round_score)
+
+    if scored_member.participated_wars == 0:
+        return scored_member
+
+    score_sum = 0
+    for round_score in scored_member.round_scores:
+        score_sum += round_score
+
+    avg_score = score_sum / scored_member.participated_wars
+
+    if len(cwl_wars) >= 2:
+        participation_multiplier = math.log(
+            scored_member.participated_wars, len(cwl_wars))
+    else:
+        participation_multiplier = 1
+
+    scored_member.score = avg_score * participation_multiplier
+    return scored_member
+
+
+def war_member(tag, town_hall, attack_list=()):
+    return SimpleNamespace(
+        tag=tag, name=f"member {tag}", town_hall=town_hall,
+        attacks=list(attack_list))
+
+
+def attack(defender_tag, stars, destruction):
+    return SimpleNamespace(
+        defender_tag=defender_tag, stars=stars, destruction=destruction)
+
+
+def cwl_war(war_tag, state, member_list, defender_list):
+    return SimpleNamespace(
+        war_tag=war_tag, state=state, is_cwl=True,
+        clan=SimpleNamespace(members=member_list),
+        opponent=SimpleNamespace(members=defender_list))
+
+
+def cwl_war_list():
+    return [
+        # #A attacks up, #B misses, #C sits out
+        cwl_war("#W1", "warEnded", [
+            war_member("#A", 13, [attack("#X1", 3, 100)]),
+            war_member("#B", 12)
+        ], [
+            war_member("#X1", 14),
+            war_member("#X2", 12)
+        ]),
+        # #A attacks down, #C attacks even, #B sits out
+        cwl_war("#W2", "warEnded", [
+            war_member("#A", 13, [attack("#X4", 2, 76)]),
+            war_member("#C", 11, [attack("#X3", 1, 48)])
+        ], [
+            war_member("#X3", 11),
+            war_member("#X4", 10)
+        ]),
+        # rounds not over or not started are left out
+        cwl_war("#W3", "inWar", [
+            war_member("#A", 13, [attack("#X5", 3, 100)]),
+            war_member("#B", 12, [attack("#X5", 3, 100)])
+        ], [
+            war_member("#X5", 9)
+        ]),
+        cwl_war("#0", "notInWar", [], []),
+        # #B attacks, #C misses
+        cwl_war("#W5", "warEnded", [
+            war_member("#B", 12, [attack("#X6", 0, 31)]),
+            war_member("#C", 11)
+        ], [
+            war_member("#X6", 13)
+        ])
+    ]
+
+
+def assert_same_score(scored_member, old_scored_member):
+    assert scored_member.tag == old_scored_member.tag
+    assert scored_member.name == old_scored_member.name
+    assert (scored_member.participated_wars
+            == old_scored_member.participated_wars)
+    assert (scored_member.potential_attack_count
+            == old_scored_member.potential_attack_count)
+    assert scored_member.attack_count == old_scored_member.attack_count
+    assert scored_member.stars == old_scored_member.stars
+    assert scored_member.destruction == old_scored_member.destruction
+    assert scored_member.round_scores == old_scored_member.round_scores
+    assert math.isclose(scored_member.score, old_scored_member.score)
+
+
+def test_cwl_member_score_list_matches_old_scores():
+    cwl_wars = cwl_war_list()
+    # #D is in the lineup but never played a round
+    cwl_member_list = [
+        SimpleNamespace(tag=tag, name=f"member {tag}")
+        for tag in ("#A", "#B", "#C", "#D")
+    ]
+
+    scored_member_list = ClashResponder.cwl_member_score_list(
+        cwl_wars, cwl_member_list)
+
+    assert ([scored_member.tag for scored_member in scored_member_list]
+            == ["#A", "#B", "#C", "#D"])
+    for scored_member, cwl_member in zip(
+            scored_member_list, cwl_member_list):
+        assert_same_score(
+            scored_member, old_cwl_member_score(cwl_wars, cwl_member))
+
+    # a missed attack scores below an attack
+    scored_member_dict = {
+        scored_member.tag: scored_member
+        for scored_member in scored_member_list}
+    assert scored_member_dict["#B"].round_scores[0] == -100
+    assert scored_member_dict["#D"].score == 0
+
+
+def test_cwl_member_score_list_single_war():
+    cwl_wars = cwl_war_list()[:1]
+    cwl_member_list = [
+        SimpleNamespace(tag=tag, name=f"member {tag}")
+        for tag in ("#A", "#B", "#C")
+    ]
+
+    scored_member_list = ClashResponder.cwl_member_score_list(
+        cwl_wars, cwl_member_list)
+
+    for scored_member, cwl_member in zip(
+            scored_member_list, cwl_member_list):
+        assert_same_score(
+            scored_member, old_cwl_member_score(cwl_wars, cwl_member))
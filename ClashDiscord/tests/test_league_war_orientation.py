@@ -0,0 +1,79 @@
+import asyncio
+
+from responders import ClashResponder
+
+
+def war_member_data(tag, attack_tag_list=()):
+    return {
+        "tag": tag, "name": f"member {tag}",
+        "townhallLevel": 13, "mapPosition": 1,
+        "attacks": [{
+            "attackerTag": tag, "defenderTag": defender_tag,
+            "stars": 3, "destructionPercentage": 100,
+            "order": 1, "duration": 90
+        } for defender_tag in attack_tag_list]
+    }
+
+
+def league_war_data():
+    return {
+        "state": "warEnded", "teamSize": 1,
+        "preparationStartTime": "20261016T000000.000Z",
+        "startTime": "20261017T000000.000Z",
+        "endTime": "20261018T000000.000Z",
+        "clan": {
+            "tag": "#CLAN", "name": "clan",
+            "stars": 3, "destructionPercentage": 100,
+            "members": [war_member_data("#P1", ["#P2"])]
+        },
+        "opponent": {
+            "tag": "#OPPONENT", "name": "opponent",
+            "stars": 0, "destructionPercentage": 0,
+            "members": [war_member_data("#P2")]
+        }
+    }
+
+
+class FakeHttp(object):
+    def __init__(self):
+        self.fetch_count = 0
+
+    async def get_cwl_wars(self, war_tag):
+        self.fetch_count += 1
+        return league_war_data()
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.http = FakeHttp()
+
+
+def test_fetch_league_war_orients_each_side():
+    async def run():
+        ClashResponder.cwl_war_cache.clear()
+        coc_client = FakeClient()
+
+        clan_war = await ClashResponder.fetch_league_war(
+            "#WAR", coc_client, "#CLAN")
+        opponent_war = await ClashResponder.fetch_league_war(
+            "#WAR", coc_client, "#OPPONENT")
+
+        # one fetch serves both clans
+        assert coc_client.http.fetch_count == 1
+
+        assert clan_war.clan.tag == "#CLAN"
+        assert clan_war.status == "won"
+        assert opponent_war.clan.tag == "#OPPONENT"
+        assert opponent_war.opponent.tag == "#CLAN"
+        assert opponent_war.status == "lost"
+
+        # flags describe the requested side
+        for war_obj in (clan_war, opponent_war):
+            assert not war_obj.clan.is_opponent
+            assert war_obj.opponent.is_opponent
+            assert not war_obj.clan.members[0].is_opponent
+            assert war_obj.opponent.members[0].is_opponent
+
+        ClashResponder.cwl_war_cache.clear()
+
+    asyncio.run(run())
@@ -0,0 +1,134 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from linkAPI.async_client import AsyncLinkApiClient
+from linkAPI.errors import NotFoundError
+from utils import cache_utils
+
+
+class FakeLinkApiClient(AsyncLinkApiClient):
+    """
+        answers requests from link_dict instead of LinkAPI
+
+        Instance Attributes
+            link_dict (dict): player tag: discord user id
+            request_list (list): (method, url) of every request sent
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__("username", "password", **kwargs)
+        self.link_dict = {}
+        self.request_list = []
+
+    async def request(self, method, url, payload=None):
+        self.request_list.append((method, url))
+        key = url[len(self.base_url + self.links_url):]
+
+        if method == "POST":
+            self.link_dict[payload['playerTag']] = int(payload['discordId'])
+            return 200, None
+
+        if method == "DELETE":
+            if self.link_dict.pop(key, None) is None:
+                return 404, None
+            return 200, None
+
+        # discord user id lookup
+        if key.isdigit():
+            return 200, [
+                {'playerTag': player_tag, 'discordId': str(discord_user_id)}
+                for player_tag, discord_user_id in self.link_dict.items()
+                if discord_user_id == int(key)]
+
+        if key not in self.link_dict:
+            return 404, None
+
+        return 200, [{
+            'playerTag': key, 'discordId': str(self.link_dict[key])}]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # cache expiry reads time.monotonic, moved forward by the tests,
+    # only cache_utils sees the fake clock
+    clock_dict = {'now': 1000.0}
+    monkeypatch.setattr(cache_utils, "time", SimpleNamespace(
+        monotonic=lambda: clock_dict['now']))
+    return clock_dict
+
+
+def test_not_found_link_expires_on_negative_ttl(clock):
+    async def run():
+        linkapi_client = FakeLinkApiClient(
+            link_cache_ttl=600, link_cache_negative_ttl=120)
+        linkapi_client.link_dict["FOUND"] = 1
+
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                await linkapi_client.get_player_tag_link("#MISSING")
+            await linkapi_client.get_player_tag_link("#FOUND")
+
+        # both answers were cached
+        assert len(linkapi_client.request_list) == 2
+
+        # the not found answer expires, the found link does not
+        clock['now'] += 121
+        with pytest.raises(NotFoundError):
+            await linkapi_client.get_player_tag_link("#MISSING")
+        await linkapi_client.get_player_tag_link("#FOUND")
+        assert len(linkapi_client.request_list) == 3
+
+        clock['now'] += 480
+        await linkapi_client.get_player_tag_link("#FOUND")
+        assert len(linkapi_client.request_list) == 4
+
+    asyncio.run(run())
+
+
+def test_add_and_delete_link_invalidate_tag_and_user(clock):
+    async def run():
+        linkapi_client = FakeLinkApiClient()
+
+        # cache not found answers for the tag and the user
+        with pytest.raises(NotFoundError):
+            await linkapi_client.get_player_tag_link("#TAG")
+        with pytest.raises(NotFoundError):
+            await linkapi_client.get_discord_user_link(1)
+
+        await linkapi_client.add_link("#TAG", 1)
+
+        player_link = await linkapi_client.get_player_tag_link("#TAG")
+        assert player_link.discord_user_id == 1
+        player_link_list = await linkapi_client.get_discord_user_link(1)
+        assert [player_link.player_tag
+                for player_link in player_link_list] == ["TAG"]
+
+        # the user is found from the cached tag
+        await linkapi_client.delete_link("#TAG")
+
+        with pytest.raises(NotFoundError):
+            await linkapi_client.get_player_tag_link("#TAG")
+        with pytest.raises(NotFoundError):
+            await linkapi_client.get_discord_user_link(1)
+
+    asyncio.run(run())
+
+
+def test_unknown_user_invalidation_clears_user_cache(clock):
+    async def run():
+        linkapi_client = FakeLinkApiClient()
+        linkapi_client.link_dict["TAG"] = 1
+        linkapi_client.link_dict["OTHER"] = 2
+
+        await linkapi_client.get_discord_user_link(1)
+        await linkapi_client.get_discord_user_link(2)
+        assert len(linkapi_client.discord_user_link_cache) == 2
+
+        # the tag was never cached so its user is unknown
+        linkapi_client.invalidate_link("#TAG")
+
+        assert len(linkapi_client.discord_user_link_cache) == 0
+
+    asyncio.run(run())
@@ -0,0 +1,89 @@
+import math
+from types import SimpleNamespace
+
+from responders import ClashResponder
+from utils import war_score_utils
+
+
+def war_member(tag, town_hall, attack_list=()):
+    return SimpleNamespace(
+        tag=tag, name=f"member {tag}", town_hall=town_hall,
+        attacks=list(attack_list))
+
+
+def attack(defender_tag, stars, destruction):
+    return SimpleNamespace(
+        defender_tag=defender_tag, stars=stars, destruction=destruction)
+
+
+def war(is_cwl, member_list, defender_list):
+    return SimpleNamespace(
+        is_cwl=is_cwl,
+        clan=SimpleNamespace(members=member_list),
+        opponent=SimpleNamespace(members=defender_list))
+
+
+def defender_list():
+    # town halls far enough apart to hit both ends of the th multiplier
+    return [
+        war_member("#X1", 15),
+        war_member("#X2", 13),
+        war_member("#X3", 12),
+        war_member("#X4", 11),
+        war_member("#X5", 8)
+    ]
+
+
+def assert_member_score_parity(war_obj):
+    score_arrays = war_score_utils.war_member_scores(war_obj)
+
+    assert len(score_arrays) == len(war_obj.clan.members)
+    for index, member in enumerate(war_obj.clan.members):
+        scored_member = ClashResponder.member_score(member, war_obj)
+
+        assert score_arrays.tag_list[index] == scored_member.tag
+        assert score_arrays.name_list[index] == scored_member.name
+        assert (score_arrays.potential_attack_count[index]
+                == scored_member.potential_attack_count)
+        assert score_arrays.attack_count[index] == scored_member.attack_count
+        assert score_arrays.stars[index] == scored_member.stars
+        assert score_arrays.destruction[index] == scored_member.destruction
+        assert math.isclose(
+            score_arrays.score[index], scored_member.score,
+            abs_tol=1e-9)
+
+
+def test_war_member_scores_matches_member_score():
+    # two attacks, one attack and a missed member
+    war_obj = war(False, [
+        war_member("#A", 12, [
+            attack("#X1", 1, 55), attack("#X3", 3, 100)]),
+        war_member("#B", 13, [attack("#X5", 3, 100)]),
+        war_member("#C", 11),
+        war_member("#D", 11, [
+            attack("#X2", 0, 12), attack("#X4", 2, 89)])
+    ], defender_list())
+
+    assert_member_score_parity(war_obj)
+
+
+def test_war_member_scores_matches_member_score_cwl():
+    war_obj = war(True, [
+        war_member("#A", 14, [attack("#X5", 3, 100)]),
+        war_member("#B", 10, [attack("#X1", 1, 42)]),
+        war_member("#C", 12)
+    ], defender_list())
+
+    assert_member_score_parity(war_obj)
+
+
+def test_war_member_scores_no_attacks():
+    war_obj = war(False, [
+        war_member("#A", 12),
+        war_member("#B", 9)
+    ], defender_list())
+
+    score_arrays = war_score_utils.war_member_scores(war_obj)
+
+    assert score_arrays.score.tolist() == [-100, -100]
+    assert_member_score_parity(war_obj)
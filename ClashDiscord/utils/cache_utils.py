@@ -0,0 +1,184 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+
+class TTLCache(object):
+    """
+        TTLCache: in-process cache with per entry expiry
+            and least recently used eviction
+
+            Instance Attributes
+                ttl (float): seconds an entry is kept after it is set
+                max_size (int): maximum entries kept, None for no limit
+    """
+
+    def __init__(self, ttl, max_size=None):
+        self.ttl = ttl
+        self.max_size = max_size
+
+        # key: (expire time, value), least recently used first
+        self._entry_dict = OrderedDict()
+        # key: task of the load currently running for key
+        self._load_dict = {}
+
+    def __len__(self):
+        return len(self._entry_dict)
+
+    def get(self, key, default=None):
+        """
+            returns the cached value for key,
+            default if key is missing or expired
+
+            Args:
+                key: cache key
+                default: value returned on a miss
+
+            Returns:
+                the cached value or default
+        """
+
+        entry = self._entry_dict.get(key)
+
+        if entry is None:
+            return default
+
+        expire_time, value = entry
+
+        if expire_time <= time.monotonic():
+            del self._entry_dict[key]
+            return default
+
+        self._entry_dict.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl=None):
+        """
+            caches value for key, evicting the least recently used
+            entries once max_size is passed
+
+            Args:
+                key: cache key
+                value: value to cache
+                ttl (float): seconds to keep value, defaults to self.ttl
+        """
+
+        if ttl is None:
+            ttl = self.ttl
+
+        self._entry_dict[key] = (time.monotonic() + ttl, value)
+        self._entry_dict.move_to_end(key)
+
+        if self.max_size is not None:
+            while len(self._entry_dict) > self.max_size:
+                self._entry_dict.popitem(last=False)
+
+    def pop(self, key):
+        """
+            removes key and any load running for it,
+            a running load will not cache its result
+
+            Args:
+                key: cache key
+        """
+
+        self._entry_dict.pop(key, None)
+        self._load_dict.pop(key, None)
+
+    def clear(self):
+        """
+            removes every entry and running load
+        """
+
+        self._entry_dict.clear()
+        self._load_dict.clear()
+
+    async def get_or_load(self, key, load_function, *args, ttl=None):
+        """
+            returns the cached value for key, otherwise awaits
+            load_function(*args) and caches the result,
+            concurrent misses for the same key share one load,
+            which keeps running if a caller is cancelled
+
+            Args:
+                key: cache key
+                load_function (coroutine function): loads the value
+                *args: args for load_function
+                ttl (float or function): seconds to keep value,
+                    or a function taking the loaded value and
+                    returning them, defaults to self.ttl
+
+            Returns:
+                the cached or loaded value
+        """
+
+        # a cached None is a miss, use a sentinel to tell them apart
+        value = self.get(key, _missing)
+        if value is not _missing:
+            return value
+
+        # another caller is already loading this key
+        load_task = self._load_dict.get(key)
+
+        # the load runs as its own task so a cancelled caller,
+        # even the one that started it, does not cancel the others
+        if load_task is None:
+            load_task = asyncio.ensure_future(
+                self._load(key, load_function, args, ttl))
+            load_task.add_done_callback(_retrieve_exception)
+            self._load_dict[key] = load_task
+
+        return await asyncio.shield(load_task)
+
+    async def _load(self, key, load_function, args, ttl):
+        """
+            awaits load_function(*args) for get_or_load
+            and caches the result
+
+            Args:
+                key: cache key
+                load_function (coroutine function): loads the value
+                args (tuple): args for load_function
+                ttl (float or function): passed on from get_or_load
+
+            Returns:
+                the loaded value
+        """
+
+        load_task = asyncio.current_task()
+
+        try:
+            value = await load_function(*args)
+
+        finally:
+            # the key was popped while loading
+            popped = self._load_dict.get(key) is not load_task
+            if not popped:
+                del self._load_dict[key]
+
+        # only cache if the key was not popped while loading
+        if not popped:
+            # ttl depends on what was loaded
+            if callable(ttl):
+                ttl = ttl(value)
+
+            self.set(key, value, ttl=ttl)
+
+        return value
+
+
+def _retrieve_exception(load_task):
+    """
+        marks a failed load's exception as retrieved,
+        keeps asyncio from logging it when every caller was cancelled
+
+        Args:
+            load_task (asyncio.Task): load started by get_or_load
+    """
+
+    if not load_task.cancelled():
+        load_task.exception()
+
+
+# marks a cache miss in TTLCache.get_or_load
+_missing = object()
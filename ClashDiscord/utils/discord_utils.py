@@ -100,6 +100,11 @@ command_param_dict = {
             "previous", "current", "upcoming"
         ]
     ),
+    'season': commands.Param(
+        name="season",
+        description="*optional* season as YYYY-MM, defaults to this season",
+        default=None
+    ),
     'missed_attacks': commands.Param(
         name="missed_attacks",
         description="*optional* specified missed attack count",
@@ -366,6 +371,14 @@ command_param_dict = {
             "user", "claim", "remove"
         ]
     ),
+    'superuser_link': commands.Param(
+        name="option",
+        description="*optional* options for superuser link returns",
+        default="sync server",
+        choices=[
+            "sync server", "sync all"
+        ]
+    ),
     'superuser_count': commands.Param(
         name="option",
         description="*optional* options for superuser count returns",
@@ -0,0 +1,172 @@
+import numpy as np
+
+
+# th multiplier by attacker to defender town hall difference,
+# index 0 is a difference of -3 or less and index 6 is 3 or more
+th_multiplier_table = np.array([35, 50, 80, 100, 140, 155, 200])
+th_difference_limit = 3
+
+
+class WarScoreArrays(object):
+    """
+        WarScoreArrays: columnar war member scores,
+            one row per member of a war
+
+            Instance Attributes
+                tag_list (list): member player tags
+                name_list (list): member player names
+                war_count (ndarray): wars scored for each member
+                potential_attack_count (ndarray): potential attacks
+                attack_count (ndarray): attacks made
+                stars (ndarray): stars earned
+                destruction (ndarray): destruction percentage earned
+                score (ndarray): member score, averaged over war_count
+    """
+
+    def __init__(
+        self, tag_list, name_list, war_count,
+        potential_attack_count, attack_count,
+        stars, destruction, score
+    ):
+        self.tag_list = tag_list
+        self.name_list = name_list
+        self.war_count = war_count
+        self.potential_attack_count = potential_attack_count
+        self.attack_count = attack_count
+        self.stars = stars
+        self.destruction = destruction
+        self.score = score
+
+    def __len__(self):
+        return len(self.tag_list)
+
+
+def th_multiplier_array(th_difference):
+    """
+        returns the th multiplier for each town hall difference,
+        matching ClashResponder.th_multiplier
+
+        Args:
+            th_difference (ndarray): defender minus attacker town hall
+
+        Returns:
+            ndarray: th multipliers
+    """
+
+    th_difference = np.clip(
+        th_difference, -th_difference_limit, th_difference_limit)
+
+    return th_multiplier_table[th_difference + th_difference_limit]
+
+
+def attack_score_array(stars, destruction, attacker_th, defender_th):
+    """
+        returns the attack score for each attack,
+        matching ClashResponder.attack_score
+
+        Args:
+            stars (ndarray): stars earned
+            destruction (ndarray): destruction percentage earned
+            attacker_th (ndarray): attacker town hall
+            defender_th (ndarray): defender town hall
+
+        Returns:
+            ndarray: attack scores
+    """
+
+    star_score = stars / 3
+    des_score = destruction / 100
+
+    return (((star_score * .75) + (des_score * .25))
+            * th_multiplier_array(defender_th - attacker_th))
+
+
+def war_attack_arrays(war_obj):
+    """
+        turns the war clan's attacks into columns
+
+        Args:
+            war_obj (obj): coc.py war object
+
+        Returns:
+            tuple: member_index, stars, destruction,
+                attacker_th, defender_th ndarrays,
+                member_index being the attacker's index in war clan members
+    """
+
+    # tag: town hall of the opponent's members
+    defender_th_dict = {}
+    for defender in war_obj.opponent.members:
+        defender_th_dict[defender.tag] = defender.town_hall
+
+    member_index_list = []
+    stars_list = []
+    destruction_list = []
+    attacker_th_list = []
+    defender_th_list = []
+
+    for member_index, war_member in enumerate(war_obj.clan.members):
+        for attack in war_member.attacks:
+            member_index_list.append(member_index)
+            stars_list.append(attack.stars)
+            destruction_list.append(attack.destruction)
+            attacker_th_list.append(war_member.town_hall)
+            defender_th_list.append(defender_th_dict[attack.defender_tag])
+
+    return (
+        np.array(member_index_list, dtype=np.int64),
+        np.array(stars_list, dtype=np.float64),
+        np.array(destruction_list, dtype=np.float64),
+        np.array(attacker_th_list, dtype=np.int64),
+        np.array(defender_th_list, dtype=np.int64)
+    )
+
+
+def war_member_scores(war_obj):
+    """
+        scores every member of the war clan with vectorized operations,
+        matching ClashResponder.member_score
+
+        Args:
+            war_obj (obj): coc.py war object
+
+        Returns:
+            obj: WarScoreArrays with one row per war clan member
+    """
+
+    war_member_list = war_obj.clan.members
+    member_count = len(war_member_list)
+
+    (member_index, stars, destruction,
+     attacker_th, defender_th) = war_attack_arrays(war_obj)
+
+    # each missed attack should be -100
+    if war_obj.is_cwl:
+        potential_attack_count = 1
+    else:
+        potential_attack_count = 2
+
+    attack_score = attack_score_array(
+        stars, destruction, attacker_th, defender_th)
+
+    # adding 100 for every attack made on top of its score
+    score_sum = np.bincount(
+        member_index, weights=attack_score + 100, minlength=member_count)
+
+    score = ((score_sum - potential_attack_count * 100)
+             / potential_attack_count)
+
+    return WarScoreArrays(
+        tag_list=[war_member.tag for war_member in war_member_list],
+        name_list=[war_member.name for war_member in war_member_list],
+        war_count=np.ones(member_count, dtype=np.int64),
+        potential_attack_count=np.full(
+            member_count, potential_attack_count, dtype=np.int64),
+        attack_count=np.bincount(member_index, minlength=member_count),
+        stars=np.bincount(
+            member_index, weights=stars, minlength=member_count),
+        destruction=np.bincount(
+            member_index, weights=destruction, minlength=member_count),
+        score=score
+    )
+
@@ -0,0 +1,56 @@
+import disnake
+
+from buttons.page import (
+    PagePreviousBtn,
+    PageCountBtn,
+    PageNextBtn
+)
+
+
+class PageView(disnake.ui.View):
+    """
+        PageView: shows one embed of embed_list at a time
+            with previous and next buttons
+
+            Instance Attributes
+                embed_list (list): disnake embeds, one per page
+                author (disnake.User): only user that can turn pages
+                page_index (int): index of the page shown
+    """
+
+    def __init__(
+            self, embed_list: list, author: disnake.User,
+            timeout: float = 600):
+        super().__init__(timeout=timeout)
+        self.embed_list = embed_list
+        self.author = author
+        self.page_index = 0
+
+        self.previous_btn = PagePreviousBtn()
+        self.count_btn = PageCountBtn()
+        self.next_btn = PageNextBtn()
+
+        self.add_item(self.previous_btn)
+        self.add_item(self.count_btn)
+        self.add_item(self.next_btn)
+
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.previous_btn.disabled = self.page_index == 0
+        self.next_btn.disabled = self.page_index == len(self.embed_list) - 1
+        self.count_btn.label = f"{self.page_index + 1}/{len(self.embed_list)}"
+
+    async def interaction_check(
+            self, inter: disnake.MessageInteraction):
+        # only the user that ran the command turns pages
+        return inter.author.id == self.author.id
+
+    async def show_page(
+            self, inter: disnake.MessageInteraction, page_index: int):
+        self.page_index = page_index
+        self.update_buttons()
+
+        # edit the original message with the requested page
+        await inter.edit_original_message(
+            embed=self.embed_list[self.page_index], view=self)